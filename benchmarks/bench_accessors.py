@@ -0,0 +1,138 @@
+"""Flush cost of SignalKCoordinator._publish and the sensor accessors it wakes.
+
+Every value in a delta is applied through the coordinator, then one flush publishes the
+dirty paths and each woken sensor reads its receive time three times and its source once
+(staleness, last_seen, idle refresh, attributes). Per-entity cost should stay flat as the
+number of paths grows, and a flush with few changed paths should cost little however many
+entities exist. Only the state machine write is left out, so Home Assistant's own cost of
+storing states does not hide the integration's.
+
+Run from the repository root, in an environment with Home Assistant installed:
+
+    python benchmarks/bench_accessors.py [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.signalk_ha.auth import SignalKAuthManager  # noqa: E402
+from custom_components.signalk_ha.coordinator import (  # noqa: E402
+    ConnectionState,
+    SignalKCoordinator,
+)
+from custom_components.signalk_ha.discovery import DiscoveredEntity  # noqa: E402
+from custom_components.signalk_ha.sensor import SignalKSensor  # noqa: E402
+
+_SIZES = (100, 1000, 5000)
+# Share of paths changed in the partial flush.
+_PARTIAL = 0.01
+
+
+def _make_entry() -> SimpleNamespace:
+    return SimpleNamespace(
+        entry_id="bench",
+        title="Bench",
+        data={
+            "host": "sk.local",
+            "port": 3000,
+            "ssl": False,
+            "verify_ssl": True,
+            "base_url": "http://sk.local:3000/signalk/v1/api/",
+            "ws_url": "ws://sk.local:3000/signalk/v1/stream?subscribe=none",
+            "vessel_id": "mmsi:261006533",
+            "vessel_name": "Bench",
+        },
+        options={},
+    )
+
+
+def _write_state(entity: SignalKSensor) -> None:
+    # What async_write_ha_state reads from the entity, without storing the state.
+    entity.available
+    entity.native_value
+    entity.extra_state_attributes
+
+
+def _setup(hass: HomeAssistant, paths: list[str]) -> SignalKCoordinator:
+    entry = _make_entry()
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._state = ConnectionState.CONNECTED
+    for path in paths:
+        spec = DiscoveredEntity(
+            path=path,
+            name=path,
+            kind="sensor",
+            unit=None,
+            device_class=None,
+            state_class=None,
+            conversion=None,
+            tolerance=None,
+            min_update_seconds=0.0,
+        )
+        entity = SignalKSensor(coordinator, None, entry, spec)
+        entity.async_write_ha_state = lambda entity=entity: _write_state(entity)
+        # The subscription CoordinatorEntity.async_added_to_hass makes.
+        coordinator.async_add_listener(entity._handle_coordinator_update, path)
+    return coordinator
+
+
+def _delta(paths: list[str], value: float) -> str:
+    values = [{"path": path, "value": value} for path in paths]
+    return json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [{"$source": "bench.src", "values": values}],
+        }
+    )
+
+
+def _measure(coordinator: SignalKCoordinator, paths: list[str], rounds: int) -> float:
+    best = float("inf")
+    for index in range(rounds):
+        # New values each round, so every woken sensor writes.
+        coordinator._handle_message(_delta(paths, float(index)), coordinator.config)
+        start = time.perf_counter()
+        coordinator._schedule_flush(immediate=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _run(rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(f"{'paths':>6} {'full flush (ms)':>16} {'per entity (us)':>16} {'1% flush (ms)':>14}")
+        for size in _SIZES:
+            paths = [f"sensors.bench.path{index}" for index in range(size)]
+            coordinator = _setup(hass, paths)
+            full = _measure(coordinator, paths, rounds)
+            partial = _measure(coordinator, paths[: max(int(size * _PARTIAL), 1)], rounds)
+            print(
+                f"{size:>6} {full * 1e3:>16.2f} {full / size * 1e6:>16.2f} "
+                f"{partial * 1e3:>14.3f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
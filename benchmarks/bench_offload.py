@@ -0,0 +1,148 @@
+"""Event-loop blocking with inline decoding versus the batched worker-thread pipeline.
+
+Replays tests/testdata.json at accelerated frame rates while a probe task measures how late
+the event loop wakes it up; late wakeups are time every other integration had to wait.
+
+Run from the repository root:
+
+    python benchmarks/bench_offload.py [--seconds S] [--rates 500,2000,5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from custom_components.signalk_ha.parser import (  # noqa: E402
+    ContextMatcher,
+    DecodedBatch,
+    decode_frames,
+)
+
+_TESTDATA = PROJECT_ROOT / "tests" / "testdata.json"
+_CONTEXTS = ["vessels.self", "vessels.urn:mrn:imo:mmsi:222222222"]
+_PROBE_INTERVAL = 0.002
+# Frames are delivered in socket-sized bursts, as ws.receive() drains a full read buffer.
+_BURST = 50
+
+
+def _load_frames() -> list[str]:
+    frames: list[str] = []
+    with _TESTDATA.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                json.loads(text)
+            except json.JSONDecodeError:
+                # The capture deliberately ends with a garbage line for the replay test.
+                continue
+            frames.append(text)
+    return frames
+
+
+class _Sink:
+    # Stands in for the coordinator's apply step: merge values into a cache on the loop.
+    def __init__(self) -> None:
+        self.cache: dict[str, Any] = {}
+        self.frames = 0
+
+    def apply(self, batch: DecodedBatch) -> None:
+        self.frames += batch.frames
+        self.cache.update(batch.values)
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + _PROBE_INTERVAL
+        await asyncio.sleep(_PROBE_INTERVAL)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def _replay(frames: list[str], rate: int, seconds: float, offload: bool) -> dict[str, float]:
+    loop = asyncio.get_running_loop()
+    matcher = ContextMatcher(_CONTEXTS)
+    sink = _Sink()
+    executor = ThreadPoolExecutor(max_workers=1)
+    queue: list[tuple[str, float]] = []
+    drain: asyncio.Task | None = None
+
+    async def _drain() -> None:
+        nonlocal drain, queue
+        try:
+            while queue:
+                pending, queue = queue, []
+                batch = await loop.run_in_executor(executor, decode_frames, pending, matcher)
+                sink.apply(batch)
+        finally:
+            drain = None
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe(stop, lags))
+    total = int(rate * seconds)
+    start = loop.time()
+    for index in range(0, total, _BURST):
+        # Pace bursts so the replay sustains the requested frame rate.
+        delay = start + index / rate - loop.time()
+        await asyncio.sleep(max(delay, 0.0))
+        for offset in range(min(_BURST, total - index)):
+            text = frames[(index + offset) % len(frames)]
+            if offload:
+                queue.append((text, time.time()))
+                if drain is None:
+                    drain = asyncio.create_task(_drain())
+            else:
+                sink.apply(decode_frames(((text, time.time()),), matcher))
+    while drain is not None:
+        await asyncio.sleep(_PROBE_INTERVAL)
+    elapsed = loop.time() - start
+    stop.set()
+    await probe
+    executor.shutdown()
+
+    lags_ms = sorted(lag * 1000.0 for lag in lags) or [0.0]
+    return {
+        "frames": sink.frames,
+        "achieved_rate": sink.frames / elapsed,
+        "lag_p50": statistics.median(lags_ms),
+        "lag_p99": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+        "lag_max": lags_ms[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--rates", default="500,2000,5000")
+    args = parser.parse_args()
+
+    frames = _load_frames()
+    rates = [int(rate) for rate in args.rates.split(",") if rate]
+    print(f"frames in capture: {len(frames)}; probe interval {_PROBE_INTERVAL * 1000:.0f} ms")
+    print(f"{'rate/s':>7} {'mode':>8} {'achieved/s':>11} {'loop lag p50/p99/max (ms)':>27}")
+    for rate in rates:
+        for offload in (False, True):
+            result = asyncio.run(_replay(frames, rate, args.seconds, offload))
+            print(
+                f"{rate:>7} {'offload' if offload else 'inline':>8} "
+                f"{result['achieved_rate']:>11.0f} {result['lag_p50']:>9.2f} "
+                f"{result['lag_p99']:>8.2f} {result['lag_max']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
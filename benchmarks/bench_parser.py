@@ -0,0 +1,88 @@
+"""Compare the single-pass delta decoder with the legacy three-walk extraction.
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from custom_components.signalk_ha.parser import (  # noqa: E402
+    decode_delta,
+    extract_notifications,
+    extract_sources,
+    extract_values,
+)
+
+_TESTDATA = PROJECT_ROOT / "tests" / "testdata.json"
+_CONTEXTS = ["vessels.self", "vessels.urn:mrn:imo:mmsi:222222222"]
+
+
+def _load_frames() -> list[dict[str, Any]]:
+    frames: list[dict[str, Any]] = []
+    with _TESTDATA.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                frames.append(json.loads(text))
+            except json.JSONDecodeError:
+                # The capture deliberately ends with a garbage line for the replay test.
+                continue
+    return frames
+
+
+def _three_walks(frame: dict[str, Any]) -> None:
+    # Mirrors the pre-decoder coordinator: three independent traversals per frame. The
+    # extract_* helpers still do a full walk each, so this reproduces the old cost.
+    changed = extract_values(frame, _CONTEXTS)
+    notifications = extract_notifications(frame, _CONTEXTS)
+    for notification in notifications:
+        changed.pop(notification["path"], None)
+    extract_sources(frame, _CONTEXTS)
+
+
+def _single_walk(frame: dict[str, Any]) -> None:
+    decode_delta(frame, _CONTEXTS)
+
+
+def _measure(fn: Callable[[dict[str, Any]], None], frames: list[dict[str, Any]], rounds: int):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for frame in frames:
+            fn(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    frames = _load_frames()
+    legacy = _measure(_three_walks, frames, args.rounds)
+    single = _measure(_single_walk, frames, args.rounds)
+    per_frame_legacy = legacy / len(frames) * 1e6
+    per_frame_single = single / len(frames) * 1e6
+    print(f"frames: {len(frames)} (best of {args.rounds} rounds)")
+    print(f"three walks:   {per_frame_legacy:8.2f} us/frame")
+    print(f"decode_delta:  {per_frame_single:8.2f} us/frame")
+    print(f"speedup:       {legacy / single:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+from typing import Mapping
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 
 from .auth import SignalKAuthManager
@@ -34,14 +37,22 @@ from .const import (
     DEFAULT_VERIFY_SSL,
     SK_PATH_NOTIFICATIONS,
 )
-from .coordinator import SignalKCoordinator, SignalKDiscoveryCoordinator
+from .coordinator import (
+    SignalKCoordinator,
+    SignalKDiscoveryCoordinator,
+    async_remove_discovery_cache,
+)
 from .entity_utils import path_from_unique_id
 from .identity import build_instance_id
+from .planner import NOTIFICATIONS_PLAN, SubscriptionPlan
 from .rest import normalize_base_url, normalize_ws_url
 from .runtime import SignalKRuntimeData
+from .snapshot import async_remove_snapshot
 
 PLATFORMS: list[str] = ["sensor", "geo_location", "event"]
 _LOGGER = logging.getLogger(__name__)
+# Bulk enable/disable in the UI emits one registry event per entity; recompute once per burst.
+_SUBSCRIPTION_DEBOUNCE_SECONDS = 0.5
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -58,20 +69,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         auth=auth,
     )
 
-    # Run an initial discovery synchronously to seed entities and subscription periods.
-    # Fail-open here so a flaky REST endpoint doesn't prevent WS updates and HA startup.
-    try:
-        await discovery.async_config_entry_first_refresh()
-    except Exception as err:  # pragma: no cover - defensive
-        # Don't block HA startup on REST failures; later refreshes can populate entities.
-        _LOGGER.warning("Signal K discovery failed during startup: %s", err)
+    # Seed entities and subscription periods from the cached discovery when it matches this
+    # server and groups, and revalidate over REST in the background.
+    if await discovery.async_load_cache():
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_discovery(hass, entry),
+            name=f"signalk_ha_discovery_{entry.entry_id}",
+        )
+    else:
+        # Run an initial discovery synchronously to seed entities and subscription periods.
+        # Fail-open here so a flaky REST endpoint doesn't prevent WS updates and HA startup.
+        try:
+            await discovery.async_config_entry_first_refresh()
+        except Exception as err:  # pragma: no cover - defensive
+            # Don't block HA startup on REST failures; later refreshes can populate entities.
+            _LOGGER.warning("Signal K discovery failed during startup: %s", err)
 
     entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
 
+    # Seed last known values before entities are added so they have state immediately.
+    await coordinator.async_restore_snapshot()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await _async_update_subscriptions(hass, entry)
     await coordinator.async_start()
 
+    subscription_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=_SUBSCRIPTION_DEBOUNCE_SECONDS,
+        immediate=False,
+        function=partial(_async_update_subscriptions, hass, entry),
+    )
+    entry.async_on_unload(subscription_debouncer.async_shutdown)
+
     @callback
     def _registry_updated(event):
         entity_id = event.data.get("entity_id")
@@ -85,7 +116,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         registry = er.async_get(hass)
         entry_data = registry.async_get(entity_id)
         if entry_data and entry_data.config_entry_id == entry.entry_id:
-            hass.async_create_task(_async_update_subscriptions(hass, entry))
+            subscription_debouncer.async_schedule_call()
 
     entry.async_on_unload(hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, _registry_updated))
     return True
@@ -131,10 +162,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await async_remove_snapshot(hass, entry.entry_id)
+    await async_remove_discovery_cache(hass, entry.entry_id)
+
+
 async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def _async_revalidate_discovery(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    runtime: SignalKRuntimeData | None = entry.runtime_data
+    if not runtime:
+        return
+    await runtime.discovery.async_refresh()
+    # Periods may differ from the cached result; only the differences are sent.
+    await _async_update_subscriptions(hass, entry)
+
+
 async def _async_update_subscriptions(hass: HomeAssistant, entry: ConfigEntry) -> None:
     runtime: SignalKRuntimeData | None = entry.runtime_data
     if not runtime:
@@ -145,12 +190,13 @@ async def _async_update_subscriptions(hass: HomeAssistant, entry: ConfigEntry) -
     entries = er.async_entries_for_config_entry(registry, entry.entry_id)
     paths: list[str] = []
     periods: dict[str, int] = {}
+    plans: dict[str, SubscriptionPlan] = {}
     discovery = runtime.discovery
-    discovery_periods: dict[str, int] = {}
+    discovery_periods: Mapping[str, int] = {}
+    discovery_plans: Mapping[str, SubscriptionPlan] = {}
     if discovery and discovery.data:
-        discovery_periods = {
-            spec.path: spec.period_ms for spec in discovery.data.entities if spec.period_ms
-        }
+        discovery_periods = discovery.data.periods
+        discovery_plans = discovery.data.plans
     for registry_entry in entries:
         if registry_entry.disabled:
             continue
@@ -160,8 +206,11 @@ async def _async_update_subscriptions(hass: HomeAssistant, entry: ConfigEntry) -
         if path:
             paths.append(path)
             periods[path] = discovery_periods.get(path, DEFAULT_PERIOD_MS)
+            if path in discovery_plans:
+                plans[path] = discovery_plans[path]
     if entry.options.get(CONF_ENABLE_NOTIFICATIONS, DEFAULT_ENABLE_NOTIFICATIONS):
         if SK_PATH_NOTIFICATIONS not in paths:
             paths.append(SK_PATH_NOTIFICATIONS)
             periods[SK_PATH_NOTIFICATIONS] = DEFAULT_PERIOD_MS
-    await runtime.coordinator.async_update_paths(paths, periods)
+            plans[SK_PATH_NOTIFICATIONS] = NOTIFICATIONS_PLAN
+    await runtime.coordinator.async_update_paths(paths, periods, plans=plans)
@@ -0,0 +1,114 @@
+"""Memory-bounded caches for other vessels (AIS targets) seen on the delta stream."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Mapping
+
+# Expiry is checked on this cadence while targets exist; ages are not tracked more finely.
+EXPIRY_INTERVAL_SECONDS = 60.0
+_MMSI_MARKER = "mmsi:"
+
+
+@dataclass
+class AisTarget:
+    context: str
+    values: dict[str, Any] = field(default_factory=dict)
+    last_seen: datetime | None = None
+    # Monotonic time of the last update, used for age eviction.
+    updated_at: float = 0.0
+
+    @property
+    def mmsi(self) -> str | None:
+        return target_mmsi(self.context)
+
+
+def target_mmsi(context: str) -> str | None:
+    _, marker, mmsi = context.rpartition(_MMSI_MARKER)
+    return mmsi if marker and mmsi else None
+
+
+def normalize_target_paths(value: Any) -> list[str]:
+    """Normalize user input (text lines or a list) into unique value paths."""
+    if isinstance(value, str):
+        candidates: Iterable[Any] = value.splitlines()
+    elif isinstance(value, (list, tuple)):
+        candidates = value
+    else:
+        return []
+    paths: list[str] = []
+    for item in candidates:
+        if not isinstance(item, str):
+            continue
+        path = item.strip()
+        # Notifications of other vessels never reach the event pipeline.
+        if not path or path.startswith("notifications.") or path in paths:
+            continue
+        paths.append(path)
+    return paths
+
+
+class AisTargets:
+    """Per-vessel value caches keyed by context, bounded by count (LRU) and by age.
+
+    Targets are kept in last-update order, so both evictions pop from the front. Each target
+    only holds the subscribed target paths, which keeps the whole cache within a fixed budget.
+    """
+
+    def __init__(self, max_targets: int, max_age_seconds: float) -> None:
+        self._max_targets = max(max_targets, 1)
+        self._max_age = max_age_seconds
+        self._targets: OrderedDict[str, AisTarget] = OrderedDict()
+        self._lru_evictions = 0
+        self._age_evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def get(self, context: str) -> AisTarget | None:
+        return self._targets.get(context)
+
+    def update(
+        self, updates: Mapping[str, Mapping[str, Any]], now: float, seen_at: datetime
+    ) -> list[str]:
+        """Merge values per context and return the contexts evicted to stay within bounds."""
+        targets = self._targets
+        for context, values in updates.items():
+            target = targets.pop(context, None)
+            if target is None:
+                target = AisTarget(context)
+            target.values.update(values)
+            target.last_seen = seen_at
+            target.updated_at = now
+            targets[context] = target
+        evicted: list[str] = []
+        while len(targets) > self._max_targets:
+            context, _ = targets.popitem(last=False)
+            evicted.append(context)
+            self._lru_evictions += 1
+        return evicted
+
+    def expire(self, now: float) -> list[str]:
+        """Drop targets not updated within the maximum age and return their contexts."""
+        targets = self._targets
+        cutoff = now - self._max_age
+        expired: list[str] = []
+        while targets:
+            context, target = next(iter(targets.items()))
+            if target.updated_at > cutoff:
+                break
+            del targets[context]
+            expired.append(context)
+            self._age_evictions += 1
+        return expired
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "targets": len(self._targets),
+            "max_targets": self._max_targets,
+            "max_age_seconds": self._max_age,
+            "lru_evictions": self._lru_evictions,
+            "age_evictions": self._age_evictions,
+        }
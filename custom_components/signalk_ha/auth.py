@@ -14,6 +14,8 @@ import async_timeout
 from aiohttp import ClientSession
 from homeassistant.util import dt as dt_util
 
+from .codec import loads
+
 _AUTH_POLL_DELAYS = (1, 2, 5, 10)
 _AUTH_TIMEOUT_SECONDS = 120
 
@@ -202,7 +204,7 @@ async def async_fetch_access_request(
 
 
 async def _safe_json(resp) -> dict[str, Any]:
-    data = await resp.json()
+    data = await resp.json(loads=loads)
     if not isinstance(data, dict):
         raise AccessRequestUnsupported("Access request response was not a JSON object")
     return data
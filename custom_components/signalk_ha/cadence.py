@@ -0,0 +1,219 @@
+"""Learned change cadence per path, used to stretch the keepalive of slow or static paths."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Mapping
+
+from .link import MAX_KEEPALIVE_SECONDS, SmoothedEstimate
+from .planner import MAX_PERIOD_MS
+
+# Seconds between reviews; a review raises a period by one doubling at most.
+REVIEW_INTERVAL_SECONDS = 600.0
+# Gain of the smoothed value mean and variance.
+_ALPHA = 0.125
+# Evidence before a period moves: this many change gaps, or this long without any change.
+_MIN_GAPS = 6
+_MIN_QUIET_SECONDS = 3600.0
+# Hysteresis: double the period once changes are this many periods apart; fall back to the
+# planned period once they come faster than half of it.
+_RAISE_FACTOR = 4.0
+_LOWER_FACTOR = 2.0
+_DIAGNOSTIC_PATHS = 20
+# Learned keepalives stop where a quiet bus would be taken for a dead link and reconnected.
+MAX_LEARNED_PERIOD_MS = int(min(MAX_PERIOD_MS, MAX_KEEPALIVE_SECONDS * 1000))
+
+
+class PathCadence:
+    """How often one path really changes, how much its value varies, and its learned period."""
+
+    __slots__ = ("gaps", "changes", "first_seen", "last_change", "mean", "variance", "period")
+
+    def __init__(self) -> None:
+        # Seconds between value changes; keepalives repeating the same value do not count.
+        self.gaps = SmoothedEstimate()
+        self.changes = 0
+        self.first_seen: float | None = None
+        self.last_change: float | None = None
+        self.mean: float | None = None
+        self.variance = 0.0
+        self.period: int | None = None
+
+    def observe(self, now: float, value: Any, changed: bool) -> None:
+        if self.first_seen is None:
+            self.first_seen = now
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if self.mean is None:
+                self.mean = float(value)
+            else:
+                # Exponentially weighted mean and variance (West's incremental form).
+                diff = value - self.mean
+                step = _ALPHA * diff
+                self.mean += step
+                self.variance = (1.0 - _ALPHA) * (self.variance + diff * step)
+        if not changed:
+            return
+        if self.last_change is not None:
+            self.gaps.add(now - self.last_change)
+        self.changes += 1
+        self.last_change = now
+
+    def quiet_seconds(self, now: float) -> float:
+        since = self.last_change if self.last_change is not None else self.first_seen
+        return 0.0 if since is None else max(now - since, 0.0)
+
+    def next_period(self, now: float, base: int, current: int) -> int:
+        """Period after one review, between the planned `base` and `MAX_LEARNED_PERIOD_MS`."""
+        quiet = self.quiet_seconds(now)
+        if self.gaps.samples >= _MIN_GAPS:
+            # Lower edge of the usual gap, unless the path has been quiet for longer already.
+            expected = max(self.gaps.mean - self.gaps.deviation, quiet)
+        elif quiet >= _MIN_QUIET_SECONDS:
+            if not self.changes:
+                # Never changed while observed: keepalives are all it sends.
+                return MAX_LEARNED_PERIOD_MS
+            expected = quiet
+        else:
+            return current
+        expected_ms = expected * 1000.0
+        if expected_ms >= _RAISE_FACTOR * current:
+            return min(current * 2, MAX_LEARNED_PERIOD_MS)
+        if expected_ms < current / _LOWER_FACTOR:
+            return base
+        return current
+
+
+class CadenceTracker:
+    """Learned cadence of the subscribed paths, persisted with the warm-start snapshot."""
+
+    def __init__(self) -> None:
+        self._paths: dict[str, PathCadence] = {}
+        self._tracked: frozenset[str] | None = None
+
+    def track(self, paths: Iterable[str]) -> None:
+        """Learn these paths only; wildcard subscriptions have no single cadence."""
+        tracked = frozenset(path for path in paths if "*" not in path)
+        self._tracked = tracked
+        self._paths = {path: self._paths.get(path) or PathCadence() for path in tracked}
+
+    def observe(self, now: float, values: Mapping[str, Any], previous: Mapping[str, Any]) -> None:
+        paths = self._paths
+        for path, value in values.items():
+            stats = paths.get(path)
+            if stats is not None:
+                stats.observe(now, value, path in previous and previous[path] != value)
+
+    def period_for(self, path: str) -> int | None:
+        stats = self._paths.get(path)
+        return stats.period if stats is not None else None
+
+    def review(self, now: float, bases: Mapping[str, int]) -> bool:
+        """Move learned periods one step given each path's planned period; True if any moved."""
+        moved = False
+        for path, base in bases.items():
+            stats = self._paths.get(path)
+            if stats is None:
+                continue
+            current = min(max(stats.period or base, base), MAX_LEARNED_PERIOD_MS)
+            period = stats.next_period(now, base, current)
+            learned = period if period > base else None
+            if learned != stats.period:
+                stats.period = learned
+                moved = True
+        return moved
+
+    def as_storage(self, now: float) -> dict[str, Any]:
+        return {
+            "saved_at": now,
+            "paths": {
+                path: [
+                    stats.gaps.mean,
+                    stats.gaps.deviation,
+                    stats.gaps.samples,
+                    stats.changes,
+                    stats.first_seen,
+                    stats.last_change,
+                    stats.mean,
+                    stats.variance,
+                    stats.period,
+                ]
+                for path, stats in self._paths.items()
+                if stats.first_seen is not None
+            },
+        }
+
+    def restore(self, data: Any, now: float) -> int:
+        """Load stored cadences, skipping malformed entries; returns how many were restored."""
+        paths = data.get("paths") if isinstance(data, dict) else None
+        saved_at = data.get("saved_at") if isinstance(data, dict) else None
+        if not isinstance(paths, dict) or not isinstance(saved_at, (int, float)):
+            return 0
+        # Time spent stopped is not time the path stood still.
+        shift = max(now - saved_at, 0.0)
+        restored = 0
+        for path, item in paths.items():
+            if self._tracked is not None and path not in self._tracked:
+                continue
+            stats = _decode_cadence(item, shift)
+            if stats is not None:
+                self._paths[path] = stats
+                restored += 1
+        return restored
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        raised = sorted(
+            ((path, stats) for path, stats in self._paths.items() if stats.period),
+            key=lambda item: item[1].period or 0,
+            reverse=True,
+        )
+        return {
+            "tracked_paths": len(self._paths),
+            "raised_paths": len(raised),
+            "raised": {
+                path: {
+                    "period_ms": stats.period,
+                    "changes": stats.changes,
+                    "change_interval_s": (
+                        round(stats.gaps.mean, 1) if stats.gaps.samples else None
+                    ),
+                    "quiet_s": round(stats.quiet_seconds(now), 1),
+                    "std_dev": (
+                        round(math.sqrt(stats.variance), 4) if stats.mean is not None else None
+                    ),
+                }
+                for path, stats in raised[:_DIAGNOSTIC_PATHS]
+            },
+        }
+
+
+def _decode_cadence(item: Any, shift: float) -> PathCadence | None:
+    if not isinstance(item, list) or len(item) != 9:
+        return None
+    (
+        gap_mean,
+        gap_deviation,
+        gap_samples,
+        changes,
+        first_seen,
+        last_change,
+        mean,
+        variance,
+        period,
+    ) = item
+    numbers = (gap_mean, gap_deviation, gap_samples, changes, first_seen, variance)
+    if not all(isinstance(number, (int, float)) for number in numbers):
+        return None
+    stats = PathCadence()
+    stats.gaps.mean = float(gap_mean)
+    stats.gaps.deviation = float(gap_deviation)
+    stats.gaps.samples = int(gap_samples)
+    stats.changes = int(changes)
+    stats.first_seen = first_seen + shift
+    if isinstance(last_change, (int, float)):
+        stats.last_change = last_change + shift
+    if isinstance(mean, (int, float)):
+        stats.mean = float(mean)
+    stats.variance = float(variance)
+    if isinstance(period, int) and period > 0:
+        stats.period = period
+    return stats
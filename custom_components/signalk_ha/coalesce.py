@@ -0,0 +1,100 @@
+"""Adaptive coalescing window sized from the smoothed ingest rate."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Mapping
+
+# Smoothing time constant (seconds) for the ingest and flush rate estimates.
+_RATE_TAU_SECONDS = 10.0
+# Ingest rate (messages per second) at which the window reaches its upper bound.
+_BUSY_RATE = 200.0
+_DEPTH_PREFIX = "environment.depth."
+
+
+class CoalesceWindow:
+    """Size the coalescing window between bounds from the observed message rate.
+
+    A quiet bus gets the short window so rare updates are not delayed; a busy one gets the
+    long window so flush work stays bounded. The window grows linearly with the smoothed rate.
+    """
+
+    def __init__(self, min_seconds: float, max_seconds: float) -> None:
+        self._min = max(min_seconds, 0.0)
+        self._max = max(max_seconds, self._min)
+        self._seconds = self._min
+        self._ingest_rate = 0.0
+        self._flush_rate = 0.0
+        self._flushes = 0
+        self._last_flush: float | None = None
+        self._last_messages = 0
+
+    @property
+    def seconds(self) -> float:
+        return self._seconds
+
+    @property
+    def min_seconds(self) -> float:
+        return self._min
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max
+
+    @property
+    def ingest_rate(self) -> float:
+        return self._ingest_rate
+
+    @property
+    def flush_rate(self) -> float:
+        return self._flush_rate
+
+    @property
+    def flushes(self) -> int:
+        return self._flushes
+
+    def record_flush(self, now: float, messages: int) -> float:
+        """Fold the messages received since the previous flush into the rates.
+
+        `messages` is the running message total, so the hot path never has to count twice.
+        Returns the window to use for the next flush.
+        """
+        self._flushes += 1
+        last = self._last_flush
+        received = max(messages - self._last_messages, 0)
+        self._last_flush = now
+        self._last_messages = messages
+        if last is None or now <= last:
+            return self._seconds
+        elapsed = now - last
+        # Time-weighted EWMA: a burst of back-to-back flushes moves the estimate by at most
+        # 1/tau per flush, and a long quiet gap lets the newest sample dominate.
+        weight = 1.0 - math.exp(-elapsed / _RATE_TAU_SECONDS)
+        self._ingest_rate += weight * (received / elapsed - self._ingest_rate)
+        self._flush_rate += weight * (1.0 / elapsed - self._flush_rate)
+        busy = min(self._ingest_rate / _BUSY_RATE, 1.0)
+        self._seconds = self._min + (self._max - self._min) * busy
+        return self._seconds
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "window_seconds": round(self._seconds, 3),
+            "min_seconds": self._min,
+            "max_seconds": self._max,
+            "ingest_rate_per_second": round(self._ingest_rate, 2),
+            "flush_rate_per_second": round(self._flush_rate, 2),
+            "flushes": self._flushes,
+        }
+
+
+def has_urgent_depth(values: Mapping[str, Any], threshold: float) -> bool:
+    """Return True when any depth value in the batch is below the threshold (meters)."""
+    for path, value in values.items():
+        if (
+            path.startswith(_DEPTH_PREFIX)
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and value < threshold
+        ):
+            return True
+    return False
@@ -0,0 +1,106 @@
+"""JSON codec with optional fast backends for WebSocket frames and REST bodies."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant always ships orjson
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONDecodeError(ValueError):
+    """Payload is not valid JSON, whichever backend decoded it."""
+
+
+# Sentinel for "the delta value carried no value key"; distinct from an explicit null.
+UNSET: Any = msgspec.UNSET if msgspec is not None else object()
+
+if msgspec is not None:  # pragma: no cover - optional dependency
+
+    class DeltaValue(msgspec.Struct):
+        path: str
+        value: Any = UNSET
+        source: str | None = msgspec.field(default=None, name="$source")
+        timestamp: str | None = None
+
+    class DeltaUpdate(msgspec.Struct):
+        values: list[DeltaValue] = []
+        source: str | None = msgspec.field(default=None, name="$source")
+        timestamp: str | None = None
+
+    class DeltaFrame(msgspec.Struct):
+        """Typed view of a delta; fields we never read are skipped by the decoder."""
+
+        context: str | None = None
+        updates: list[DeltaUpdate] = []
+
+    _DELTA_DECODER = msgspec.json.Decoder(DeltaFrame)
+    _DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, msgspec.DecodeError)
+else:
+    DeltaFrame = None
+    _DECODE_ERRORS = (ValueError,)
+
+# orjson wins for generic documents; msgspec's edge is the typed delta decoder.
+_loads: Callable[[str | bytes], Any]
+_dumps: Callable[[Any], str]
+if orjson is not None:
+    BACKEND = "orjson"
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+elif msgspec is not None:  # pragma: no cover - optional dependency
+    BACKEND = "msgspec"
+    _loads = msgspec.json.Decoder().decode
+    _encode = msgspec.json.Encoder().encode
+
+    def _dumps(obj: Any) -> str:
+        return _encode(obj).decode()
+
+else:  # pragma: no cover - Home Assistant always ships orjson
+    BACKEND = "json"
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+TYPED_DELTAS = DeltaFrame is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document into plain Python objects."""
+    try:
+        return _loads(data)
+    except _DECODE_ERRORS as err:
+        raise JSONDecodeError(str(err)) from err
+
+
+def loads_delta(data: str | bytes) -> Any:
+    """Decode a WebSocket frame, preferring the typed delta schema when msgspec is present.
+
+    Frames that do not fit the schema (server hello, malformed entries) fall back to a
+    generic decode so the parser can apply its usual tolerant handling.
+    """
+    if DeltaFrame is None:
+        return loads(data)
+    try:  # pragma: no cover - optional dependency
+        return _DELTA_DECODER.decode(data)
+    except msgspec.ValidationError:  # pragma: no cover - optional dependency
+        return loads(data)
+    except msgspec.DecodeError as err:  # pragma: no cover - optional dependency
+        raise JSONDecodeError(str(err)) from err
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as a compact JSON string."""
+    return _dumps(obj)
@@ -19,6 +19,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 if TYPE_CHECKING:  # pragma: no cover - typing-only imports
     from homeassistant.components.zeroconf import ZeroconfServiceInfo
 
+from .ais import normalize_target_paths
 from .auth import (
     AccessRequestInfo,
     AccessRequestRejected,
@@ -29,30 +30,60 @@ from .auth import (
 )
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_AIS_ENABLED,
+    CONF_AIS_MAX_AGE_MINUTES,
+    CONF_AIS_MAX_TARGETS,
+    CONF_AIS_PATHS,
     CONF_BASE_URL,
+    CONF_COALESCE_MAX_MS,
+    CONF_COALESCE_MIN_MS,
     CONF_ENABLE_NOTIFICATIONS,
     CONF_GROUPS,
     CONF_HOST,
     CONF_INSTANCE_ID,
+    CONF_LEARN_PERIODS,
+    CONF_NOTIFICATION_BURST,
+    CONF_NOTIFICATION_CACHE_SIZE,
     CONF_NOTIFICATION_IGNORE_PREFIXES,
     CONF_NOTIFICATION_PATHS,
+    CONF_NOTIFICATION_RATE_PER_MINUTE,
+    CONF_NOTIFICATION_REPEAT_SUMMARY,
+    CONF_OFFLOAD_FRAME_BYTES,
+    CONF_OFFLOAD_FRAME_RATE,
     CONF_PORT,
     CONF_REFRESH_INTERVAL_HOURS,
     CONF_SERVER_ID,
     CONF_SERVER_VERSION,
     CONF_SSL,
+    CONF_URGENT_DEPTH_M,
     CONF_VERIFY_SSL,
     CONF_VESSEL_ID,
     CONF_VESSEL_NAME,
+    CONF_WS_COMPRESSION,
     CONF_WS_URL,
+    DEFAULT_AIS_ENABLED,
+    DEFAULT_AIS_MAX_AGE_MINUTES,
+    DEFAULT_AIS_MAX_TARGETS,
+    DEFAULT_AIS_PATHS,
+    DEFAULT_COALESCE_MAX_MS,
+    DEFAULT_COALESCE_MIN_MS,
     DEFAULT_ENABLE_NOTIFICATIONS,
     DEFAULT_GROUPS,
+    DEFAULT_LEARN_PERIODS,
+    DEFAULT_NOTIFICATION_BURST,
+    DEFAULT_NOTIFICATION_CACHE_SIZE,
     DEFAULT_NOTIFICATION_IGNORE_PREFIXES,
     DEFAULT_NOTIFICATION_PATHS,
+    DEFAULT_NOTIFICATION_RATE_PER_MINUTE,
+    DEFAULT_NOTIFICATION_REPEAT_SUMMARY,
+    DEFAULT_OFFLOAD_FRAME_BYTES,
+    DEFAULT_OFFLOAD_FRAME_RATE,
     DEFAULT_PORT,
     DEFAULT_REFRESH_INTERVAL_HOURS,
     DEFAULT_SSL,
+    DEFAULT_URGENT_DEPTH_M,
     DEFAULT_VERIFY_SSL,
+    DEFAULT_WS_COMPRESSION,
     DOMAIN,
 )
 from .identity import build_instance_id, resolve_vessel_identity
@@ -597,6 +628,44 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_NOTIFICATION_IGNORE_PREFIXES, DEFAULT_NOTIFICATION_IGNORE_PREFIXES
                 )
             )
+            coalesce_min = max(
+                int(user_input.get(CONF_COALESCE_MIN_MS, DEFAULT_COALESCE_MIN_MS)), 0
+            )
+            # Keep the bounds ordered so the window can always be derived from them.
+            coalesce_max = max(
+                int(user_input.get(CONF_COALESCE_MAX_MS, DEFAULT_COALESCE_MAX_MS)), coalesce_min
+            )
+            urgent_depth = max(
+                float(user_input.get(CONF_URGENT_DEPTH_M, DEFAULT_URGENT_DEPTH_M)), 0.0
+            )
+            offload_rate = max(
+                int(user_input.get(CONF_OFFLOAD_FRAME_RATE, DEFAULT_OFFLOAD_FRAME_RATE)), 0
+            )
+            offload_bytes = max(
+                int(user_input.get(CONF_OFFLOAD_FRAME_BYTES, DEFAULT_OFFLOAD_FRAME_BYTES)), 0
+            )
+            notification_cache_size = max(
+                int(user_input.get(CONF_NOTIFICATION_CACHE_SIZE, DEFAULT_NOTIFICATION_CACHE_SIZE)),
+                1,
+            )
+            notification_rate = max(
+                int(
+                    user_input.get(
+                        CONF_NOTIFICATION_RATE_PER_MINUTE, DEFAULT_NOTIFICATION_RATE_PER_MINUTE
+                    )
+                ),
+                0,
+            )
+            notification_burst = max(
+                int(user_input.get(CONF_NOTIFICATION_BURST, DEFAULT_NOTIFICATION_BURST)), 1
+            )
+            ais_paths = normalize_target_paths(user_input.get(CONF_AIS_PATHS, DEFAULT_AIS_PATHS))
+            ais_max_targets = max(
+                int(user_input.get(CONF_AIS_MAX_TARGETS, DEFAULT_AIS_MAX_TARGETS)), 1
+            )
+            ais_max_age = max(
+                int(user_input.get(CONF_AIS_MAX_AGE_MINUTES, DEFAULT_AIS_MAX_AGE_MINUTES)), 1
+            )
             return self.async_create_entry(
                 title="",
                 data={
@@ -605,6 +674,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_NOTIFICATION_PATHS: notification_paths,
                     CONF_NOTIFICATION_IGNORE_PREFIXES: notification_prefixes,
                     CONF_GROUPS: groups,
+                    CONF_COALESCE_MIN_MS: coalesce_min,
+                    CONF_COALESCE_MAX_MS: coalesce_max,
+                    CONF_URGENT_DEPTH_M: urgent_depth,
+                    CONF_OFFLOAD_FRAME_RATE: offload_rate,
+                    CONF_OFFLOAD_FRAME_BYTES: offload_bytes,
+                    CONF_NOTIFICATION_CACHE_SIZE: notification_cache_size,
+                    CONF_NOTIFICATION_RATE_PER_MINUTE: notification_rate,
+                    CONF_NOTIFICATION_BURST: notification_burst,
+                    CONF_AIS_ENABLED: bool(user_input.get(CONF_AIS_ENABLED, DEFAULT_AIS_ENABLED)),
+                    CONF_AIS_PATHS: ais_paths,
+                    CONF_AIS_MAX_TARGETS: ais_max_targets,
+                    CONF_AIS_MAX_AGE_MINUTES: ais_max_age,
+                    CONF_WS_COMPRESSION: bool(
+                        user_input.get(CONF_WS_COMPRESSION, DEFAULT_WS_COMPRESSION)
+                    ),
+                    CONF_LEARN_PERIODS: bool(
+                        user_input.get(CONF_LEARN_PERIODS, DEFAULT_LEARN_PERIODS)
+                    ),
+                    CONF_NOTIFICATION_REPEAT_SUMMARY: bool(
+                        user_input.get(
+                            CONF_NOTIFICATION_REPEAT_SUMMARY, DEFAULT_NOTIFICATION_REPEAT_SUMMARY
+                        )
+                    ),
                 },
             )
 
@@ -626,6 +718,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_NOTIFICATION_IGNORE_PREFIXES, DEFAULT_NOTIFICATION_IGNORE_PREFIXES
             )
         )
+        options = self._entry.options
         group_options = _group_options()
         schema = vol.Schema(
             {
@@ -640,6 +733,72 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_NOTIFICATION_IGNORE_PREFIXES, default=current_notification_prefixes
                 ): cv.string,
                 vol.Optional(CONF_GROUPS, default=current_groups): cv.multi_select(group_options),
+                vol.Optional(
+                    CONF_COALESCE_MIN_MS,
+                    default=options.get(CONF_COALESCE_MIN_MS, DEFAULT_COALESCE_MIN_MS),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_COALESCE_MAX_MS,
+                    default=options.get(CONF_COALESCE_MAX_MS, DEFAULT_COALESCE_MAX_MS),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_URGENT_DEPTH_M,
+                    default=options.get(CONF_URGENT_DEPTH_M, DEFAULT_URGENT_DEPTH_M),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_OFFLOAD_FRAME_RATE,
+                    default=options.get(CONF_OFFLOAD_FRAME_RATE, DEFAULT_OFFLOAD_FRAME_RATE),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_OFFLOAD_FRAME_BYTES,
+                    default=options.get(CONF_OFFLOAD_FRAME_BYTES, DEFAULT_OFFLOAD_FRAME_BYTES),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_NOTIFICATION_CACHE_SIZE,
+                    default=options.get(
+                        CONF_NOTIFICATION_CACHE_SIZE, DEFAULT_NOTIFICATION_CACHE_SIZE
+                    ),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_NOTIFICATION_RATE_PER_MINUTE,
+                    default=options.get(
+                        CONF_NOTIFICATION_RATE_PER_MINUTE, DEFAULT_NOTIFICATION_RATE_PER_MINUTE
+                    ),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_NOTIFICATION_BURST,
+                    default=options.get(CONF_NOTIFICATION_BURST, DEFAULT_NOTIFICATION_BURST),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_NOTIFICATION_REPEAT_SUMMARY,
+                    default=options.get(
+                        CONF_NOTIFICATION_REPEAT_SUMMARY, DEFAULT_NOTIFICATION_REPEAT_SUMMARY
+                    ),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_AIS_ENABLED,
+                    default=options.get(CONF_AIS_ENABLED, DEFAULT_AIS_ENABLED),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_AIS_PATHS,
+                    default=paths_to_text(options.get(CONF_AIS_PATHS, DEFAULT_AIS_PATHS)),
+                ): cv.string,
+                vol.Optional(
+                    CONF_AIS_MAX_TARGETS,
+                    default=options.get(CONF_AIS_MAX_TARGETS, DEFAULT_AIS_MAX_TARGETS),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_AIS_MAX_AGE_MINUTES,
+                    default=options.get(CONF_AIS_MAX_AGE_MINUTES, DEFAULT_AIS_MAX_AGE_MINUTES),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    CONF_WS_COMPRESSION,
+                    default=options.get(CONF_WS_COMPRESSION, DEFAULT_WS_COMPRESSION),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_LEARN_PERIODS,
+                    default=options.get(CONF_LEARN_PERIODS, DEFAULT_LEARN_PERIODS),
+                ): cv.boolean,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
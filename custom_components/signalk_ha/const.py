@@ -19,6 +19,21 @@ CONF_NOTIFICATION_IGNORE_PREFIXES = "notification_ignore_prefixes"
 CONF_GROUPS = "groups"
 CONF_SERVER_ID = "server_id"
 CONF_SERVER_VERSION = "server_version"
+CONF_COALESCE_MIN_MS = "coalesce_min_ms"
+CONF_COALESCE_MAX_MS = "coalesce_max_ms"
+CONF_URGENT_DEPTH_M = "urgent_depth_m"
+CONF_OFFLOAD_FRAME_RATE = "offload_frame_rate"
+CONF_OFFLOAD_FRAME_BYTES = "offload_frame_bytes"
+CONF_NOTIFICATION_CACHE_SIZE = "notification_cache_size"
+CONF_NOTIFICATION_RATE_PER_MINUTE = "notification_rate_per_minute"
+CONF_NOTIFICATION_BURST = "notification_burst"
+CONF_NOTIFICATION_REPEAT_SUMMARY = "notification_repeat_summary"
+CONF_AIS_ENABLED = "ais_enabled"
+CONF_AIS_PATHS = "ais_paths"
+CONF_AIS_MAX_TARGETS = "ais_max_targets"
+CONF_AIS_MAX_AGE_MINUTES = "ais_max_age_minutes"
+CONF_WS_COMPRESSION = "ws_compression"
+CONF_LEARN_PERIODS = "learn_periods"
 
 DEFAULT_PORT = 3000
 DEFAULT_SSL = False
@@ -28,6 +43,33 @@ DEFAULT_ENABLE_NOTIFICATIONS = True
 DEFAULT_NOTIFICATION_PATHS: tuple[str, ...] = ("notifications.*",)
 DEFAULT_NOTIFICATION_IGNORE_PREFIXES: tuple[str, ...] = ("notifications.security.",)
 DEFAULT_GROUPS = ("navigation", "environment", "tanks")
+# Bounds for the adaptive coalescing window: short when the bus is quiet, long when busy.
+DEFAULT_COALESCE_MIN_MS = 100
+DEFAULT_COALESCE_MAX_MS = 2000
+# Depth (meters) below which depth updates skip the long window; 0 disables.
+DEFAULT_URGENT_DEPTH_M = 0.0
+# Decode on a worker thread above this frame rate (frames/s) or frame size (bytes); 0 disables.
+DEFAULT_OFFLOAD_FRAME_RATE = 200
+DEFAULT_OFFLOAD_FRAME_BYTES = 65536
+# Notification paths remembered for deduplication; the least recently seen are evicted.
+DEFAULT_NOTIFICATION_CACHE_SIZE = 512
+# Per-path limit for notifications repeating the same state (0 disables); changes always pass.
+DEFAULT_NOTIFICATION_RATE_PER_MINUTE = 12
+DEFAULT_NOTIFICATION_BURST = 5
+DEFAULT_NOTIFICATION_REPEAT_SUMMARY = False
+# Other vessels (AIS targets) are opt-in; each target only keeps these paths.
+DEFAULT_AIS_ENABLED = False
+DEFAULT_AIS_PATHS: tuple[str, ...] = (
+    "navigation.position",
+    "navigation.courseOverGroundTrue",
+    "navigation.speedOverGround",
+)
+DEFAULT_AIS_MAX_TARGETS = 200
+DEFAULT_AIS_MAX_AGE_MINUTES = 10
+# Offer permessage-deflate; servers that do not support it simply decline.
+DEFAULT_WS_COMPRESSION = True
+# Stretch the keepalive of paths observed to change slowly, within the staleness budget.
+DEFAULT_LEARN_PERIODS = True
 
 DEFAULT_PERIOD_MS = 5000
 DEFAULT_FORMAT = "delta"
@@ -57,6 +99,15 @@ HEALTH_SENSOR_LAST_NOTIFICATION = "last_notification"
 HEALTH_SENSOR_MESSAGE_COUNT = "message_count"
 HEALTH_SENSOR_MESSAGES_PER_HOUR = "messages_per_hour"
 HEALTH_SENSOR_NOTIFICATIONS_PER_HOUR = "notifications_per_hour"
+HEALTH_SENSOR_MESSAGE_RATE = "message_rate"
+HEALTH_SENSOR_VALUE_RATE = "value_rate"
+HEALTH_SENSOR_NOTIFICATION_RATE = "notification_rate"
+HEALTH_SENSOR_DATA_RATE = "data_rate"
+HEALTH_SENSOR_END_TO_END_LATENCY = "end_to_end_latency"
+HEALTH_SENSOR_LINK_RTT = "link_rtt"
+HEALTH_SENSOR_LINK_JITTER = "link_jitter"
+HEALTH_SENSOR_FRAME_INTERVAL = "frame_interval"
+HEALTH_SENSOR_PAYLOAD_BYTES = "payload_bytes"
 
 NOTIFICATION_EVENT_TYPES = (
     "nominal",
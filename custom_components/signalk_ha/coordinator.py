@@ -3,51 +3,113 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
 import logging
 import random
 import ssl
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 
 from aiohttp import ClientError, ClientSession, ClientTimeout, WSMsgType, WSServerHandshakeError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
+from .ais import EXPIRY_INTERVAL_SECONDS, AisTarget, AisTargets, normalize_target_paths
 from .auth import AuthRequired, SignalKAuthManager, build_auth_headers
+from .cadence import MAX_LEARNED_PERIOD_MS, REVIEW_INTERVAL_SECONDS, CadenceTracker
+from .coalesce import CoalesceWindow, has_urgent_depth
+from .codec import JSONDecodeError, dumps, loads
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_AIS_ENABLED,
+    CONF_AIS_MAX_AGE_MINUTES,
+    CONF_AIS_MAX_TARGETS,
+    CONF_AIS_PATHS,
     CONF_BASE_URL,
+    CONF_COALESCE_MAX_MS,
+    CONF_COALESCE_MIN_MS,
     CONF_ENABLE_NOTIFICATIONS,
     CONF_GROUPS,
     CONF_HOST,
+    CONF_LEARN_PERIODS,
+    CONF_NOTIFICATION_BURST,
+    CONF_NOTIFICATION_CACHE_SIZE,
+    CONF_NOTIFICATION_RATE_PER_MINUTE,
+    CONF_NOTIFICATION_REPEAT_SUMMARY,
+    CONF_OFFLOAD_FRAME_BYTES,
+    CONF_OFFLOAD_FRAME_RATE,
     CONF_PORT,
     CONF_REFRESH_INTERVAL_HOURS,
     CONF_SERVER_ID,
     CONF_SERVER_VERSION,
     CONF_SSL,
+    CONF_URGENT_DEPTH_M,
     CONF_VERIFY_SSL,
     CONF_VESSEL_ID,
     CONF_VESSEL_NAME,
+    CONF_WS_COMPRESSION,
     CONF_WS_URL,
+    DEFAULT_AIS_ENABLED,
+    DEFAULT_AIS_MAX_AGE_MINUTES,
+    DEFAULT_AIS_MAX_TARGETS,
+    DEFAULT_AIS_PATHS,
+    DEFAULT_COALESCE_MAX_MS,
+    DEFAULT_COALESCE_MIN_MS,
     DEFAULT_ENABLE_NOTIFICATIONS,
     DEFAULT_FORMAT,
     DEFAULT_GROUPS,
+    DEFAULT_LEARN_PERIODS,
+    DEFAULT_NOTIFICATION_BURST,
+    DEFAULT_NOTIFICATION_CACHE_SIZE,
+    DEFAULT_NOTIFICATION_RATE_PER_MINUTE,
+    DEFAULT_NOTIFICATION_REPEAT_SUMMARY,
+    DEFAULT_OFFLOAD_FRAME_BYTES,
+    DEFAULT_OFFLOAD_FRAME_RATE,
+    DEFAULT_PERIOD_MS,
     DEFAULT_POLICY,
     DEFAULT_REFRESH_INTERVAL_HOURS,
+    DEFAULT_STALE_SECONDS,
+    DEFAULT_URGENT_DEPTH_M,
+    DEFAULT_WS_COMPRESSION,
     DOMAIN,
     notification_event_type,
 )
-from .discovery import DiscoveryResult, MetadataConflict, discover_entities
+from .dedupe import NotificationDedupe, NotificationRateLimiter, notification_signature
+from .discovery import (
+    DiscoveryResult,
+    MetadataConflict,
+    discover_entities,
+    discovery_result_from_dict,
+    discovery_result_to_dict,
+)
 from .identity import resolve_vessel_identity
-from .parser import extract_notifications, extract_sources, extract_values
+from .latency import ALL_GROUPS, LatencyTracker, parse_server_timestamp, path_group
+from .link import PING_INTERVAL_SECONDS, LinkQuality
+from .parser import ContextMatcher, DecodedBatch, PathInterest, decode_frames
+from .planner import (
+    POLICY_INSTANT,
+    SubscriptionPlan,
+    estimate_savings,
+    merge_plans,
+)
+from .pool import (
+    SharedStream,
+    join_stream,
+    leave_stream,
+    merge_interests,
+    merge_targets,
+    stream_key,
+)
+from .rates import RATE_WINDOWS, KeyedRates, SlidingRate
 from .rest import (
     async_fetch_discovery,
     async_fetch_vessel_self,
@@ -55,18 +117,32 @@ from .rest import (
     normalize_server_url,
     normalize_ws_url,
 )
-from .subscription import build_subscribe_payload
+from .snapshot import SnapshotStore, decode_snapshot, encode_snapshot
+from .subscription import build_subscribe_payload, build_unsubscribe_payload
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISCOVERY_CACHE_VERSION = 1
 _BACKOFF_MIN = 1.0
 _BACKOFF_MAX = 30.0
 _BACKOFF_JITTER = 1.0
-_COALESCE_SECONDS = 0.5
 _LOG_INTERVAL_SECONDS = 60.0
-_STALE_CHECK_SECONDS = 60.0
-_INACTIVITY_TIMEOUT = 45.0
-_NOTIFICATION_DEDUPE_SECONDS = 5.0
+# Unchanged repeats faster than a re-timed keepalive before per-path unsubscribe is given up.
+_RETIME_VIOLATIONS = 3
+# Fire slightly after a deadline so entities comparing wall-clock age agree the path is stale.
+_STALE_GRACE_SECONDS = 0.25
+_TOP_RATES_LIMIT = 10
+# Held notification repeats are summarized at most this often per path.
+_NOTIFICATION_SUMMARY_SECONDS = 60.0
+# Other vessels move slowly; AIS itself reports every few seconds to minutes.
+_AIS_PERIOD_MS = 60000
+_AIS_MIN_PERIOD_MS = 5000
+# Frames waiting for the decode worker before the receive loop waits for it to catch up.
+_FRAME_QUEUE_LIMIT = 2000
+# Frames read within one event-loop turn that mean the socket has a backlog, e.g. after HA
+# stalled; from there on frames are batched so superseded values collapse before applying.
+_BACKLOG_FRAMES = 32
+_RATE_METRICS = ("messages", "values", "notifications", "bytes")
 
 
 class ConnectionState(str, Enum):
@@ -97,6 +173,21 @@ class SignalKStats:
     reconnects: int = 0
 
 
+def _identifies_context(vessel_id: str | None) -> bool:
+    # Only URN/MRN/MMSI vessel ids appear in delta contexts; hash ids are local to HA.
+    if not vessel_id:
+        return False
+    return vessel_id.removeprefix("vessels.").startswith(("urn:", "mrn:", "mmsi:"))
+
+
+def _discovery_cache_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.discovery"
+
+
+async def async_remove_discovery_cache(hass: HomeAssistant, entry_id: str) -> None:
+    await Store(hass, _DISCOVERY_CACHE_VERSION, _discovery_cache_key(entry_id)).async_remove()
+
+
 class SignalKDiscoveryCoordinator(DataUpdateCoordinator[DiscoveryResult]):
     def __init__(
         self,
@@ -110,6 +201,10 @@ class SignalKDiscoveryCoordinator(DataUpdateCoordinator[DiscoveryResult]):
         self._auth = auth
         self._conflicts: list[MetadataConflict] = []
         self._last_refresh: datetime | None = None
+        # The last result is cached on disk so startup can build entities without REST.
+        self._cache_store: Store[dict[str, Any]] | None = None
+        self._cached_payload: dict[str, Any] | None = None
+        self._from_cache = False
 
         interval_hours = entry.options.get(
             CONF_REFRESH_INTERVAL_HOURS,
@@ -130,6 +225,32 @@ class SignalKDiscoveryCoordinator(DataUpdateCoordinator[DiscoveryResult]):
     def last_refresh(self) -> dt_util.dt | None:
         return self._last_refresh
 
+    @property
+    def from_cache(self) -> bool:
+        """True while entities come from the disk cache and REST has not confirmed them."""
+        return self._from_cache
+
+    async def async_load_cache(self) -> bool:
+        """Seed data from the discovery cache when it matches this server and groups."""
+        try:
+            stored = await self._get_cache_store().async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Signal K discovery cache could not be loaded: %s", err)
+            return False
+        if not isinstance(stored, dict) or stored.get("key") != self._cache_key(
+            self._entry.data.get(CONF_SERVER_ID) or None,
+            self._entry.data.get(CONF_SERVER_VERSION) or None,
+        ):
+            return False
+        result = discovery_result_from_dict(stored.get("result"))
+        if result is None:
+            return False
+        self._cached_payload = stored
+        self._conflicts = result.conflicts
+        self._from_cache = True
+        self.async_set_updated_data(result)
+        return True
+
     async def _async_update_data(self) -> DiscoveryResult:
         cfg = self._config()
         updates: dict[str, Any] = {}
@@ -194,15 +315,49 @@ class SignalKDiscoveryCoordinator(DataUpdateCoordinator[DiscoveryResult]):
             configuration_url=base_url,
         )
 
-        groups = self._entry.options.get(
-            CONF_GROUPS, self._entry.data.get(CONF_GROUPS, DEFAULT_GROUPS)
-        )
-        scopes = [group for group in groups if isinstance(group, str)]
-        result = discover_entities(vessel, scopes=scopes)
+        result = discover_entities(vessel, scopes=self._scopes())
         self._conflicts = result.conflicts
         self._last_refresh = dt_util.utcnow()
+        self._from_cache = False
+        await self._async_save_cache(result, server_id, server_version)
         return result
 
+    def _scopes(self) -> list[str]:
+        groups = self._entry.options.get(
+            CONF_GROUPS, self._entry.data.get(CONF_GROUPS, DEFAULT_GROUPS)
+        )
+        return [group for group in groups if isinstance(group, str)]
+
+    def _cache_key(self, server_id: str | None, server_version: str | None) -> dict[str, Any]:
+        # A different server, server version or group selection yields different entities.
+        return {
+            "server_id": server_id,
+            "server_version": server_version,
+            "groups": sorted(self._scopes()),
+        }
+
+    async def _async_save_cache(
+        self, result: DiscoveryResult, server_id: str | None, server_version: str | None
+    ) -> None:
+        payload = {
+            "key": self._cache_key(server_id, server_version),
+            "result": discovery_result_to_dict(result),
+        }
+        if payload == self._cached_payload:
+            return  # Periodic refreshes of an unchanged vessel do not rewrite the file.
+        self._cached_payload = payload
+        try:
+            await self._get_cache_store().async_save(payload)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Signal K discovery cache could not be saved: %s", err)
+
+    def _get_cache_store(self) -> Store[dict[str, Any]]:
+        if self._cache_store is None:
+            self._cache_store = Store(
+                self.hass, _DISCOVERY_CACHE_VERSION, _discovery_cache_key(self._entry.entry_id)
+            )
+        return self._cache_store
+
     def _async_update_device_registry(
         self,
         *,
@@ -247,7 +402,7 @@ class SignalKDiscoveryCoordinator(DataUpdateCoordinator[DiscoveryResult]):
         await self.async_shutdown()
 
 
-class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class SignalKCoordinator(DataUpdateCoordinator[Mapping[str, Any]]):
     def __init__(
         self,
         hass: HomeAssistant,
@@ -268,6 +423,10 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._log_times: dict[str, float] = {}
         self._stale_unsub: asyncio.TimerHandle | None = None
         self._reauth_started = False
+        self._context_matcher: ContextMatcher | None = None
+        self._context_vessel_id: str | None = None
+        # The server's own context from its hello frame, e.g. "vessels.urn:mrn:imo:mmsi:...".
+        self._server_self: str | None = None
 
         self._state = ConnectionState.DISCONNECTED
         self._last_error: str | None = None
@@ -276,18 +435,123 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._last_source_by_path: dict[str, str] = {}
         self._stats = SignalKStats()
         self._data_cache: dict[str, Any] = {}
+        # Paths whose value or source changed since the last flush, and the set last published.
+        self._dirty_paths: set[str] = set()
+        self._changed_paths: frozenset[str] = frozenset()
+        # Entities bound to a path (via coordinator_context) are only woken for that path.
+        self._path_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._refresh_all_paths = False
+        options = entry.options
+        self._coalesce = CoalesceWindow(
+            options.get(CONF_COALESCE_MIN_MS, DEFAULT_COALESCE_MIN_MS) / 1000.0,
+            options.get(CONF_COALESCE_MAX_MS, DEFAULT_COALESCE_MAX_MS) / 1000.0,
+        )
+        self._urgent_depth: float = options.get(CONF_URGENT_DEPTH_M, DEFAULT_URGENT_DEPTH_M)
+        # Bursts and very large frames are decoded in batches on a worker thread.
+        self._offload_rate: float = options.get(CONF_OFFLOAD_FRAME_RATE, DEFAULT_OFFLOAD_FRAME_RATE)
+        self._offload_bytes: int = options.get(
+            CONF_OFFLOAD_FRAME_BYTES, DEFAULT_OFFLOAD_FRAME_BYTES
+        )
+        self._frame_queue: list[tuple[str, float]] = []
+        self._decode_task: asyncio.Task | None = None
+        self._offload_stats = {
+            "batches": 0,
+            "frames": 0,
+            "max_batch": 0,
+            "backlog_turns": 0,
+            "queue_full_waits": 0,
+            "collapsed_values": 0,
+            "dropped_frames": 0,
+        }
+        self._turn_frames = 0
+        # Staleness deadlines (loop time) per path; the heap holds at most one entry per path
+        # and refreshed paths are re-pushed lazily when their old entry surfaces.
+        self._stale_deadlines: dict[str, float] = {}
+        self._stale_heap: list[tuple[float, str]] = []
         self._paths: list[str] = []
         self._periods: dict[str, int] = {}
+        # Planned period, minPeriod and policy per path; paths without one get a bare period.
+        self._plans: dict[str, SubscriptionPlan] = {}
+        # Path -> plan as last sent on the current connection, so later changes can be sent
+        # as subscribe/unsubscribe diffs instead of replaying every path.
+        self._subscribed: dict[str, SubscriptionPlan] = {}
+        # Learned change cadence per path; slow or static paths get a longer keepalive.
+        self._learn_periods: bool = options.get(CONF_LEARN_PERIODS, DEFAULT_LEARN_PERIODS)
+        self._cadence = CadenceTracker()
+        self._cadence_unsub: asyncio.TimerHandle | None = None
+        self._subscribed_targets: tuple[str, ...] = ()
+        # Re-timing a path is a per-path unsubscribe plus subscribe until the server is seen
+        # ignoring per-path unsubscribe; then it takes a full resubscribe. Raised paths are
+        # watched for unchanged repeats faster than their new keepalive (the old subscription).
+        self._per_path_unsubscribe = True
+        self._retimed: dict[str, float] = {}
+        self._retime_repeats: dict[str, tuple[float, str | None]] = {}
+        self._retime_violations = 0
+        # Longest subscribed period: the slowest keepalive the server owes us.
+        self._keepalive_seconds: float | None = None
+        self._link = LinkQuality()
+        self._compression_requested: bool = options.get(CONF_WS_COMPRESSION, DEFAULT_WS_COMPRESSION)
+        # Negotiated deflate window bits of the current connection; 0 when uncompressed.
+        self._compression = 0
+        # Lifetime payload bytes (after decompression), in total and per path group.
+        self._payload_bytes = 0
+        self._group_bytes: dict[str, float] = {}
+        # None until subscriptions are known; afterwards unsubscribed paths are skipped at parse.
+        self._path_interest: PathInterest | None = None
         # Cache signatures per path to dedupe bursty notifications without losing state changes.
-        self._notification_cache: dict[str, tuple[tuple[Any, ...], str | None, float]] = {}
+        self._notification_dedupe = NotificationDedupe(
+            options.get(CONF_NOTIFICATION_CACHE_SIZE, DEFAULT_NOTIFICATION_CACHE_SIZE)
+        )
+        # Storm control: repeats without a state change spend per-path tokens; when enabled,
+        # the ones over the limit are summarized as one "repeated" event per path and period.
+        self._notification_limiter = NotificationRateLimiter(
+            options.get(CONF_NOTIFICATION_RATE_PER_MINUTE, DEFAULT_NOTIFICATION_RATE_PER_MINUTE),
+            options.get(CONF_NOTIFICATION_BURST, DEFAULT_NOTIFICATION_BURST),
+            options.get(CONF_NOTIFICATION_CACHE_SIZE, DEFAULT_NOTIFICATION_CACHE_SIZE),
+        )
+        self._notification_summary: bool = options.get(
+            CONF_NOTIFICATION_REPEAT_SUMMARY, DEFAULT_NOTIFICATION_REPEAT_SUMMARY
+        )
+        self._notification_repeats: dict[str, tuple[dict[str, Any], int]] = {}
+        self._notification_summaries = 0
+        self._summary_handle: asyncio.TimerHandle | None = None
         self._notification_listeners: list[Callable[[dict[str, Any]], None]] = []
+        # Other vessels (AIS) are opt-in: their deltas land in per-context caches holding only
+        # the configured paths, and entities wake on their context like a path.
+        self._ais: AisTargets | None = None
+        self._ais_interest: PathInterest | None = None
+        if options.get(CONF_AIS_ENABLED, DEFAULT_AIS_ENABLED):
+            self._ais = AisTargets(
+                options.get(CONF_AIS_MAX_TARGETS, DEFAULT_AIS_MAX_TARGETS),
+                options.get(CONF_AIS_MAX_AGE_MINUTES, DEFAULT_AIS_MAX_AGE_MINUTES) * 60.0,
+            )
+            self._ais_interest = PathInterest(
+                normalize_target_paths(options.get(CONF_AIS_PATHS, DEFAULT_AIS_PATHS))
+            )
+        self._ais_listeners: list[Callable[[list[str], list[str]], None]] = []
+        self._ais_unsub: asyncio.TimerHandle | None = None
+        # Entries streaming from the same server share one socket; see pool.py.
+        self._stream: SharedStream | None = None
         self._notification_count = 0
         self._last_notification: dict[str, Any] | None = None
         self._first_message_at = None
         self._first_notification_at = None
+        # Sliding 1m/15m/1h windows; the lifetime *_per_hour averages cannot show bursts.
+        self._rates = {metric: SlidingRate() for metric in _RATE_METRICS}
+        self._path_rates = KeyedRates()
+        self._source_rates = KeyedRates()
+        # Stage latencies: values waiting for a flush carry (receive time, server timestamp);
+        # flushed paths keep their flush and server times until an entity writes them.
+        self._latency = LatencyTracker()
+        self._pending_latency: dict[str, tuple[float, str | None]] = {}
+        self._flush_times: dict[str, float] = {}
+        self._server_times: dict[str, float] = {}
         self._last_backoff: float = 0.0
+        # Last known values survive restarts so entities have state before the first delta.
+        self._snapshot = SnapshotStore(hass, entry.entry_id, self._snapshot_data)
+        self._warm_start = False
 
-        self.data = {}
+        self.data = MappingProxyType(self._data_cache)
 
     @property
     def config(self) -> SignalKConfig:
@@ -314,6 +578,11 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def is_connected(self) -> bool:
         return self._state == ConnectionState.CONNECTED
 
+    @property
+    def warm_start(self) -> bool:
+        """True while restored values are served and no connection has been made yet."""
+        return self._warm_start
+
     @property
     def last_error(self) -> str | None:
         return self._last_error
@@ -335,12 +604,39 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
 
     @property
-    def last_update_by_path(self) -> dict[str, Any]:
-        return dict(self._last_update_by_path)
+    def offload(self) -> dict[str, Any]:
+        return {
+            "active": self._decode_task is not None,
+            "queued_frames": len(self._frame_queue),
+            "frame_rate_threshold": self._offload_rate,
+            "frame_bytes_threshold": self._offload_bytes,
+            **self._offload_stats,
+        }
+
+    @property
+    def coalescing(self) -> dict[str, Any]:
+        return {**self._coalesce.as_dict(), "urgent_depth_m": self._urgent_depth}
+
+    @property
+    def last_update_by_path(self) -> Mapping[str, Any]:
+        """Read-only view of receive times; entities should prefer last_update_for()."""
+        return MappingProxyType(self._last_update_by_path)
+
+    @property
+    def last_source_by_path(self) -> Mapping[str, str]:
+        """Read-only view of the latest $source per path."""
+        return MappingProxyType(self._last_source_by_path)
+
+    def last_update_for(self, path: str) -> Any:
+        return self._last_update_by_path.get(path)
+
+    def last_source_for(self, path: str) -> str | None:
+        return self._last_source_by_path.get(path)
 
     @property
-    def last_source_by_path(self) -> dict[str, str]:
-        return dict(self._last_source_by_path)
+    def changed_paths(self) -> frozenset[str]:
+        """Paths whose value or source changed in the most recent flush."""
+        return self._changed_paths
 
     @property
     def last_backoff(self) -> float:
@@ -370,6 +666,84 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def auth_token_present(self) -> bool:
         return self._auth.token_present
 
+    @property
+    def shared_connection(self) -> dict[str, Any]:
+        stream = self._stream
+        if stream is None:
+            return {"entries": 0, "owner": False}
+        return {"entries": len(stream.members), "owner": stream.owner is self}
+
+    @property
+    def link_quality(self) -> dict[str, Any]:
+        # On a shared connection the link belongs to the entry that owns the socket.
+        owner = self._stream.owner if self._stream is not None else None
+        if owner is not None and owner is not self:
+            return owner.link_quality
+        return self._link.as_dict(self._keepalive_seconds)
+
+    @property
+    def compression(self) -> dict[str, Any]:
+        owner = self._stream.owner if self._stream is not None else None
+        if owner is not None and owner is not self:
+            return owner.compression
+        return {
+            "compression_requested": self._compression_requested,
+            "compression_window_bits": self._compression,
+        }
+
+    @property
+    def subscription_plan(self) -> dict[str, Any]:
+        """This entry's plans against a bare period per path, with the traffic they avoid."""
+        now = time.monotonic()
+        rates = zip(self._rates["bytes"].rates(now), self._rates["values"].rates(now))
+        # Longest window with traffic; a delta carries several values, so bytes per value.
+        bytes_per_value = next(
+            (size / values for size, values in reversed(list(rates)) if values), None
+        )
+        return estimate_savings(
+            {path: self._plan_for(path) for path in self._paths},
+            {path: SubscriptionPlan(self._periods.get(path)) for path in self._paths},
+            bytes_per_value,
+        )
+
+    @property
+    def learned_periods(self) -> dict[str, Any]:
+        return {"enabled": self._learn_periods, **self._cadence.as_dict(time.time())}
+
+    @property
+    def transfer(self) -> dict[str, Any]:
+        # aiohttp inflates frames before handing them over, so compressed wire bytes are not
+        # observable; payload bytes are what the server sent before compression. On a shared
+        # connection they are counted by the entry that owns the socket.
+        return {
+            **self.compression,
+            "payload_bytes": self._payload_bytes,
+            "payload_bytes_by_group": {
+                group: round(size)
+                for group, size in sorted(
+                    self._group_bytes.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+        }
+
+    @property
+    def _streaming(self) -> bool:
+        # Entries following a shared connection have no task of their own but still stream.
+        return self._task is not None or self._stream is not None
+
+    @property
+    def ais_enabled(self) -> bool:
+        return self._ais is not None
+
+    @property
+    def ais(self) -> dict[str, Any]:
+        if self._ais is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._ais.as_dict()}
+
+    def ais_target(self, context: str) -> AisTarget | None:
+        return self._ais.get(context) if self._ais is not None else None
+
     @property
     def notifications_enabled(self) -> bool:
         return bool(
@@ -403,6 +777,63 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
         return round(self._stats.messages / (elapsed / 3600.0), 2)
 
+    def ingest_rate(self, metric: str) -> dict[str, float]:
+        """Per-second rate of a metric over each sliding window, keyed by window label."""
+        rates = self._rates[metric].rates(time.monotonic())
+        return {label: round(rate, 3) for label, rate in zip(RATE_WINDOWS, rates)}
+
+    @property
+    def ingest_rates(self) -> dict[str, dict[str, float]]:
+        return {metric: self.ingest_rate(metric) for metric in _RATE_METRICS}
+
+    def top_paths(self, limit: int = _TOP_RATES_LIMIT) -> list[dict[str, Any]]:
+        """Chattiest paths over the last 15 minutes, in values per minute."""
+        return [
+            {"path": path, "per_minute": rate}
+            for path, rate in self._path_rates.top(time.monotonic(), limit)
+        ]
+
+    def top_sources(self, limit: int = _TOP_RATES_LIMIT) -> list[dict[str, Any]]:
+        """Chattiest $source labels over the last 15 minutes, in path updates per minute."""
+        return [
+            {"source": source, "per_minute": rate}
+            for source, rate in self._source_rates.top(time.monotonic(), limit)
+        ]
+
+    @property
+    def notification_dedupe(self) -> dict[str, float | int]:
+        return self._notification_dedupe.as_dict(time.monotonic())
+
+    @property
+    def notification_rate_limit(self) -> dict[str, Any]:
+        return {
+            **self._notification_limiter.as_dict(),
+            "repeat_summary": self._notification_summary,
+            "held_paths": len(self._notification_repeats),
+            "summaries": self._notification_summaries,
+        }
+
+    @property
+    def latency(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """p50/p95/p99 (ms) per pipeline stage and path group over recent samples."""
+        return self._latency.as_dict()
+
+    def latency_summary(self, stage: str, group: str = ALL_GROUPS) -> dict[str, float | int] | None:
+        return self._latency.summary(stage, group)
+
+    @callback
+    def record_state_write(self, path: str) -> None:
+        """Close the latency trail for a path once its entity has written state."""
+        flushed = self._flush_times.pop(path, None)
+        if flushed is None:
+            return  # Idle refresh or availability change; no new value to account for.
+        now = time.time()
+        group = path_group(path)
+        self._latency.record("dispatch", group, now - flushed)
+        server = self._server_times.get(path)
+        if server is not None:
+            self._latency.record("end_to_end", group, now - server)
+
     @property
     def notifications_per_hour(self) -> float | None:
         if not self._first_notification_at:
@@ -412,6 +843,41 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
         return round(self._notification_count / (elapsed / 3600.0), 2)
 
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        if not isinstance(context, str):
+            return super().async_add_listener(update_callback, context)
+        path = context
+        self._path_listeners.setdefault(path, []).append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            listeners = self._path_listeners.get(path)
+            if listeners and update_callback in listeners:
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._path_listeners[path]
+
+        return _remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        # Coordinator-wide listeners (health sensors) first, then only the affected paths.
+        super().async_update_listeners()
+        if self._refresh_all_paths:
+            self._refresh_all_paths = False
+            paths: Iterable[str] = list(self._path_listeners)
+        else:
+            paths = self._changed_paths
+        for path in paths:
+            listeners = self._path_listeners.get(path)
+            if not listeners:
+                continue
+            for update_callback in list(listeners):
+                update_callback()
+
     def async_add_notification_listener(
         self, listener: Callable[[dict[str, Any]], None]
     ) -> Callable[[], None]:
@@ -423,27 +889,104 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return _remove
 
+    def async_add_ais_listener(
+        self, listener: Callable[[list[str], list[str]], None]
+    ) -> Callable[[], None]:
+        """Call `listener(updated, removed)` with target contexts as targets change."""
+        self._ais_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._ais_listeners:
+                self._ais_listeners.remove(listener)
+
+        return _remove
+
     async def async_start(self) -> None:
-        if self._task is not None:
+        if self._task is not None or self._stream is not None:
             return
         self._stop_event.clear()
-        # Keep the WS loop off the bootstrap task graph; it is intentionally long-lived.
-        if hasattr(self.hass, "async_create_background_task"):
-            self._task = self.hass.async_create_background_task(
-                self._run(), name=f"signalk_ha_ws_{self._entry.entry_id}"
-            )
-        else:
-            self._task = self.hass.async_create_task(self._run())
+        cfg = self.config
+        stream = join_stream(
+            self.hass, stream_key(cfg.ws_url, self._auth.token, cfg.vessel_id), self
+        )
+        self._stream = stream
         self._schedule_stale_checks()
+        owner = stream.owner
+        if owner is self:
+            self._start_run()
+            return
+        # Another entry already streams from this server: follow its socket and widen its
+        # subscription instead of opening a second connection.
+        _LOGGER.debug("Sharing the Signal K connection to %s", cfg.ws_url)
+        owner._refresh_stream()
+        self._set_state(owner._state)
+        await owner._async_resubscribe()
+
+    def _start_run(self) -> None:
+        self._task = self._create_background_task(
+            self._run(), f"signalk_ha_ws_{self._entry.entry_id}"
+        )
+
+    def _create_background_task(self, coro, name: str) -> asyncio.Task:
+        # Keep long-lived loops off the bootstrap task graph.
+        if hasattr(self.hass, "async_create_background_task"):
+            return self.hass.async_create_background_task(coro, name=name)
+        return self.hass.async_create_task(coro)
+
+    async def async_restore_snapshot(self) -> None:
+        try:
+            stored = await self._snapshot.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Signal K snapshot could not be loaded: %s", err)
+            return
+        if not stored:
+            return
+        if self._learn_periods and isinstance(stored, dict):
+            # Unlike values, learned cadences do not go stale while Home Assistant is down.
+            self._cadence.restore(stored.get("cadence"), time.time())
+        values, updates, sources = decode_snapshot(stored, dt_util.utcnow(), DEFAULT_STALE_SECONDS)
+        if not values:
+            return
+        self._data_cache.update(values)
+        self._last_update_by_path.update(updates)
+        self._last_source_by_path.update(sources)
+        # Restored paths keep their original receive times, so they go stale on schedule.
+        now = dt_util.utcnow()
+        loop_now = self.hass.loop.time()
+        for path, received in updates.items():
+            deadline = loop_now + DEFAULT_STALE_SECONDS - (now - received).total_seconds()
+            if path not in self._stale_deadlines:
+                heapq.heappush(self._stale_heap, (deadline, path))
+            self._stale_deadlines[path] = deadline
+        if self._streaming:
+            self._schedule_stale_checks()
+        self._warm_start = True
+        _LOGGER.debug("Restored %s Signal K values from snapshot", len(values))
 
     async def async_stop(self) -> None:
         self._stop_event.set()
+        await self._async_leave_stream()
+        if self._decode_task is not None:
+            self._decode_task.cancel()
+            self._decode_task = None
+        self._frame_queue = []
         if self._flush_handle is not None:
             self._flush_handle.cancel()
             self._flush_handle = None
         if self._stale_unsub is not None:
             self._stale_unsub.cancel()
             self._stale_unsub = None
+        if self._summary_handle is not None:
+            self._summary_handle.cancel()
+            self._summary_handle = None
+        if self._ais_unsub is not None:
+            self._ais_unsub.cancel()
+            self._ais_unsub = None
+        if self._cadence_unsub is not None:
+            self._cadence_unsub.cancel()
+            self._cadence_unsub = None
+        self._notification_repeats = {}
+        await self._snapshot.async_flush()
 
         if self._ws is not None and not self._ws.closed:
             await self._ws.close()
@@ -459,22 +1002,71 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._set_state(ConnectionState.DISCONNECTED)
 
+    async def _async_leave_stream(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        was_owner = stream.owner is self
+        leave_stream(self.hass, stream, self)
+        owner = stream.owner
+        if owner is None:
+            return
+        owner._refresh_stream()
+        if was_owner:
+            # The next entry takes over the connection and subscribes the remaining union.
+            owner._start_run()
+        else:
+            await owner._async_resubscribe()
+
+    def _refresh_stream(self) -> None:
+        stream = self._stream
+        if stream is None:
+            return
+        stream.interest = merge_interests(member._path_interest for member in stream.members)
+        stream.targets = merge_targets(
+            member._target_interest(member.config) for member in stream.members
+        )
+        # The owner's context matcher depends on whether anyone tracks other vessels.
+        self._context_matcher = None
+
+    async def _async_resubscribe(self) -> None:
+        if (
+            self._ws is not None
+            and not self._ws.closed
+            and self._state == ConnectionState.CONNECTED
+        ):
+            await self._send_subscription_diff(self._ws)
+
     async def async_update_paths(
-        self, paths: list[str], periods: dict[str, int] | None = None
+        self,
+        paths: list[str],
+        periods: dict[str, int] | None = None,
+        *,
+        plans: Mapping[str, SubscriptionPlan] | None = None,
     ) -> None:
         cleaned = sorted({path for path in paths if isinstance(path, str)})
         periods = periods or {}
+        plans = plans or {}
         cleaned_periods = {path: int(periods[path]) for path in cleaned if path in periods}
-        if cleaned == self._paths and cleaned_periods == self._periods:
+        cleaned_plans = {path: plans[path] for path in cleaned if path in plans}
+        if (
+            cleaned == self._paths
+            and cleaned_periods == self._periods
+            and cleaned_plans == self._plans
+        ):
             return
         self._paths = cleaned
         self._periods = cleaned_periods
-        if (
-            self._ws is not None
-            and not self._ws.closed
-            and self._state == ConnectionState.CONNECTED
-        ):
-            await self._send_subscribe(self._ws)
+        self._plans = cleaned_plans
+        if self._learn_periods:
+            self._cadence.track(cleaned)
+        self._path_interest = PathInterest(cleaned) if cleaned else None
+        self._prune_uninteresting_paths()
+        owner = self._stream.owner if self._stream is not None else None
+        if owner is None:
+            owner = self
+        owner._refresh_stream()
+        await owner._async_resubscribe()
 
     async def _run(self) -> None:
         backoff = _BACKOFF_MIN
@@ -484,19 +1076,26 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             url = cfg.ws_url
             ssl_context = self._build_ssl_param(cfg)
             headers = build_auth_headers(self._auth.token)
+            # Compile the context filter once per connection rather than per message.
+            self._context_matcher_for(cfg, rebuild=True)
             disconnect_reason: str | None = None
+            probe: asyncio.Task | None = None
 
             self._set_state(ConnectionState.CONNECTING)
             try:
                 _LOGGER.info("Connecting to Signal K: %s", url)
+                # Pings and pongs are handled here rather than by aiohttp so the round trip can
+                # be timed; _probe_link replaces the heartbeat.
                 async with self._session.ws_connect(
                     url,
-                    heartbeat=30,
+                    autoping=False,
+                    compress=15 if self._compression_requested else 0,
                     timeout=ClientTimeout(total=10),
                     ssl=ssl_context,
                     headers=headers,
                 ) as ws:
                     self._ws = ws
+                    self._compression = getattr(ws, "compress", 0)
                     backoff = _BACKOFF_MIN
                     self._last_backoff = 0.0
                     self._auth.mark_success()
@@ -505,17 +1104,45 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     await self._send_subscribe(ws)
 
                     self._set_state(ConnectionState.CONNECTED)
+                    self._link.reset_connection()
+                    probe = self._create_background_task(
+                        self._probe_link(ws), f"signalk_ha_ping_{self._entry.entry_id}"
+                    )
+                    last_frame = time.monotonic()
+                    awaiting_hello = True
 
                     while not self._stop_event.is_set():  # pragma: no branch
+                        # Pongs do not count as activity; the deadline runs from the last frame.
+                        timeout = (
+                            last_frame
+                            + self._link.inactivity_timeout(self._keepalive_seconds)
+                            - time.monotonic()
+                        )
                         try:
-                            msg = await ws.receive(timeout=_INACTIVITY_TIMEOUT)
+                            if timeout <= 0:
+                                raise asyncio.TimeoutError
+                            msg = await ws.receive(timeout=timeout)
                         except asyncio.TimeoutError:
                             self._record_error("Inactivity timeout")
                             disconnect_reason = "inactivity timeout"
                             break
 
                         if msg.type == WSMsgType.TEXT:
-                            self._handle_message(msg.data, cfg)
+                            last_frame = time.monotonic()
+                            self._link.frame(last_frame)
+                            self._count_turn_frame()
+                            if awaiting_hello:
+                                awaiting_hello = False
+                                if self._learn_server_self(msg.data):
+                                    await self._send_target_diff(ws)
+                            if self._should_offload(msg.data):
+                                await self._offload_message(msg.data, cfg)
+                            else:
+                                self._handle_message(msg.data, cfg)
+                        elif msg.type == WSMsgType.PONG:
+                            self._link.pong(msg.data, time.monotonic())
+                        elif msg.type == WSMsgType.PING:
+                            await ws.pong(msg.data)
                         elif msg.type in (WSMsgType.CLOSED, WSMsgType.CLOSE, WSMsgType.CLOSING):
                             disconnect_reason = "websocket closed"
                             break
@@ -540,7 +1167,12 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._record_error(f"Unexpected: {type(ex).__name__}: {ex}")
                 _LOGGER.exception("Unexpected error in Signal K loop: %s", ex)
             finally:
+                if probe is not None:
+                    probe.cancel()
                 self._ws = None
+                self._subscribed = {}
+                self._subscribed_targets = ()
+                self._clear_retimed()
                 if self._state == ConnectionState.CONNECTED:
                     _LOGGER.info("Disconnected from Signal K")
                 if (
@@ -566,86 +1198,499 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._set_state(ConnectionState.DISCONNECTED)
 
+    def _base_plan(self, path: str) -> SubscriptionPlan:
+        plan = self._plans.get(path)
+        return plan if plan is not None else SubscriptionPlan(self._periods.get(path))
+
+    def _plan_for(self, path: str) -> SubscriptionPlan:
+        plan = self._base_plan(path)
+        learned = self._cadence.period_for(path)
+        if learned is None or learned <= (plan.period or DEFAULT_PERIOD_MS):
+            return plan
+        return replace(plan, period=min(learned, MAX_LEARNED_PERIOD_MS))
+
+    def _requested_subscriptions(self) -> dict[str, SubscriptionPlan]:
+        stream = self._stream
+        if stream is None or not stream.shared:
+            return {path: self._plan_for(path) for path in self._paths}
+        # Union of every entry on the connection; the faster of each limit wins.
+        requested: dict[str, SubscriptionPlan] = {}
+        for member in stream.members:
+            for path in member._paths:
+                plan = member._plan_for(path)
+                current = requested.get(path)
+                requested[path] = plan if current is None else merge_plans(current, plan)
+        return requested
+
+    async def _probe_link(self, ws) -> None:
+        while not ws.closed:
+            # Wait on the stop event rather than sleeping, so stopping ends the probe at once
+            # and the probe never shares a timer with the reconnect backoff.
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), PING_INTERVAL_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                pass
+            payload = self._link.start_ping(time.monotonic())
+            if payload is None:
+                # Like aiohttp's heartbeat: an unanswered ping means the link is gone, even if
+                # the socket has not noticed yet. Closing wakes the receive loop.
+                self._record_error("Ping timeout")
+                await ws.close()
+                return
+            try:
+                await ws.ping(payload)
+            except (ClientError, ConnectionError):
+                # The receive loop reports the broken socket itself.
+                return
+
+    def _set_keepalive(self, requested: Mapping[str, SubscriptionPlan]) -> None:
+        # Instant subscriptions carry no keepalive, so they say nothing about silence.
+        periods = [
+            plan.period or DEFAULT_PERIOD_MS
+            for plan in requested.values()
+            if plan.policy != POLICY_INSTANT
+        ]
+        self._keepalive_seconds = max(periods) / 1000.0 if periods else None
+
     async def _send_subscribe(self, ws) -> None:
+        requested = self._requested_subscriptions()
         payload = build_subscribe_payload(
             "vessels.self",
-            [{"path": path, "period": self._periods.get(path)} for path in self._paths],
+            [plan.as_subscription(path) for path, plan in requested.items()],
             fmt=DEFAULT_FORMAT,
             policy=DEFAULT_POLICY,
         )
         _LOGGER.debug("Signal K subscribe payload: %s", payload)
-        await ws.send_str(json.dumps(payload))
-        _LOGGER.info("Sent subscribe for %s paths", len(self._paths))
+        await ws.send_str(dumps(payload))
+        self._subscribed = requested
+        self._clear_retimed()
+        self._set_keepalive(requested)
+        _LOGGER.info("Sent subscribe for %s paths", len(requested))
+        await self._send_target_diff(ws)
+
+    async def _send_target_diff(self, ws) -> None:
+        targets = self._decode_targets(self.config)
+        requested = targets.patterns if targets is not None else ()
+        previous = self._subscribed_targets
+        removed = [path for path in previous if path not in requested]
+        added = [path for path in requested if path not in previous]
+        if removed:
+            payload = build_unsubscribe_payload("vessels.*", removed)
+            _LOGGER.debug("Signal K target unsubscribe payload: %s", payload)
+            await ws.send_str(dumps(payload))
+        if added:
+            payload = build_subscribe_payload(
+                "vessels.*",
+                [
+                    {"path": path, "period": _AIS_PERIOD_MS, "minPeriod": _AIS_MIN_PERIOD_MS}
+                    for path in added
+                ],
+                fmt=DEFAULT_FORMAT,
+                policy=DEFAULT_POLICY,
+            )
+            _LOGGER.debug("Signal K target subscribe payload: %s", payload)
+            await ws.send_str(dumps(payload))
+        self._subscribed_targets = requested
+
+    async def _send_subscription_diff(self, ws) -> None:
+        # Servers may replay cached values for every path in a subscribe, so only the
+        # changes go out; reconnects still send the full set through _send_subscribe.
+        requested = self._requested_subscriptions()
+        previous = self._subscribed
+        removed = sorted(previous.keys() - requested.keys())
+        added = [
+            path
+            for path, plan in requested.items()
+            if path not in previous or previous[path] != plan
+        ]
+        # A changed plan is an unsubscribe followed by a subscribe at the new rate; every
+        # move of one review goes out in the same pair of messages.
+        changed = [path for path in added if path in previous]
+        if changed and not self._per_path_unsubscribe:
+            # The old subscription would stay next to the new one; only unsubscribing
+            # everything removes it.
+            await self._send_full_resubscribe(ws)
+            _LOGGER.info("Resubscribed to re-time %s paths", len(changed))
+            return
+        if removed or changed:
+            payload = build_unsubscribe_payload("vessels.self", removed + changed)
+            _LOGGER.debug("Signal K unsubscribe payload: %s", payload)
+            await ws.send_str(dumps(payload))
+        if added:
+            payload = build_subscribe_payload(
+                "vessels.self",
+                [requested[path].as_subscription(path) for path in added],
+                fmt=DEFAULT_FORMAT,
+                policy=DEFAULT_POLICY,
+            )
+            _LOGGER.debug("Signal K subscribe payload: %s", payload)
+            await ws.send_str(dumps(payload))
+        self._subscribed = requested
+        for path in removed:
+            self._retimed.pop(path, None)
+        for path in changed:
+            period = requested[path].period or DEFAULT_PERIOD_MS
+            if period > (previous[path].period or DEFAULT_PERIOD_MS):
+                self._retimed[path] = period / 1000.0
+            else:
+                self._retimed.pop(path, None)
+            self._retime_repeats.pop(path, None)
+        self._set_keepalive(requested)
+        # Entries sharing the connection may add or drop other-vessel paths too.
+        await self._send_target_diff(ws)
+        _LOGGER.info(
+            "Updated subscription: %s added, %s removed, %s re-timed",
+            len(added) - len(changed),
+            len(removed),
+            len(changed),
+        )
+
+    def _clear_retimed(self) -> None:
+        self._retimed = {}
+        self._retime_repeats = {}
+
+    def _check_retimed(self, batch: DecodedBatch, cache: Mapping[str, Any]) -> None:
+        # Runs on the entry that sent the subscription, before `cache` takes the batch.
+        retimed = self._retimed
+        for path, value in batch.values.items():
+            keepalive = retimed.get(path)
+            if keepalive is None or path not in cache or cache[path] != value:
+                continue
+            received = batch.received[path]
+            source = batch.sources.get(path)
+            last = self._retime_repeats.get(path)
+            self._retime_repeats[path] = (received, source)
+            # Another source's keepalive is not a second subscription.
+            if last is None or last[1] != source or received - last[0] >= keepalive / 2:
+                continue
+            self._retime_violations += 1
+            if self._retime_violations < _RETIME_VIOLATIONS:
+                continue
+            _LOGGER.info(
+                "Signal K server ignores per-path unsubscribe; re-timing now resubscribes"
+            )
+            self._per_path_unsubscribe = False
+            self._clear_retimed()
+            self.hass.async_create_task(self._async_resubscribe_all())
+            return
+
+    async def _async_resubscribe_all(self) -> None:
+        ws = self._ws
+        if ws is not None and not ws.closed and self._state == ConnectionState.CONNECTED:
+            await self._send_full_resubscribe(ws)
+
+    async def _send_full_resubscribe(self, ws) -> None:
+        payload = build_unsubscribe_payload("*", ["*"])
+        _LOGGER.debug("Signal K unsubscribe payload: %s", payload)
+        await ws.send_str(dumps(payload))
+        self._subscribed_targets = ()
+        await self._send_subscribe(ws)
 
     def _handle_message(self, text: str, cfg: SignalKConfig) -> None:
         # Keep parsing and notification routing localized to avoid churn in the main loop.
-        self._stats.messages += 1
+        self._mark_received()
+        # Filter by vessel context so data from other vessels cannot pollute this entry.
+        # One walk yields values, sources and notifications; notifications never reach the
+        # sensor cache because they have their own event pipeline.
+        batch = decode_frames(
+            ((text, time.time()),),
+            self._context_matcher_for(cfg),
+            self._decode_interest(),
+            self._decode_targets(cfg),
+        )
+        self._dispatch_batch(batch, cfg)
+
+    def _mark_received(self) -> None:
         self._last_message = dt_util.utcnow()
         if self._first_message_at is None:
             self._first_message_at = self._last_message
 
+    def _count_turn_frame(self) -> None:
+        self._turn_frames += 1
+        if self._turn_frames == 1:
+            self.hass.loop.call_soon(self._end_frame_turn)
+        elif self._turn_frames == _BACKLOG_FRAMES:
+            self._offload_stats["backlog_turns"] += 1
+
+    def _end_frame_turn(self) -> None:
+        self._turn_frames = 0
+
+    def _should_offload(self, text: str) -> bool:
+        if self._decode_task is not None or self._frame_queue:
+            return True  # Keep frames in order while a batch is in flight.
+        if self._turn_frames >= _BACKLOG_FRAMES:
+            return True
+        if self._offload_bytes and len(text) >= self._offload_bytes:
+            return True
+        return bool(self._offload_rate) and self._coalesce.ingest_rate >= self._offload_rate
+
+    async def _offload_message(self, text: str, cfg: SignalKConfig) -> None:
+        self._mark_received()
+        self._frame_queue.append((text, time.time()))
+        if self._decode_task is None:
+            self._decode_task = self.hass.async_create_task(self._drain_frames(cfg))
+        if len(self._frame_queue) >= _FRAME_QUEUE_LIMIT:
+            # Backpressure: stop reading the socket until the worker has caught up.
+            self._offload_stats["queue_full_waits"] += 1
+            await asyncio.shield(self._decode_task)
+
+    async def _drain_frames(self, cfg: SignalKConfig) -> None:
         try:
-            obj = json.loads(text)
-        except json.JSONDecodeError:
-            self._stats.parse_errors += 1
+            while self._frame_queue:
+                frames, self._frame_queue = self._frame_queue, []
+                batch = await self.hass.async_add_executor_job(
+                    decode_frames,
+                    frames,
+                    self._context_matcher_for(cfg),
+                    self._decode_interest(),
+                    self._decode_targets(cfg),
+                )
+                self._offload_stats["batches"] += 1
+                self._offload_stats["frames"] += len(frames)
+                self._offload_stats["max_batch"] = max(
+                    self._offload_stats["max_batch"], len(frames)
+                )
+                self._dispatch_batch(batch, cfg)
+        finally:
+            self._decode_task = None
+
+    def _dispatch_batch(self, batch: DecodedBatch, cfg: SignalKConfig) -> None:
+        stream = self._stream
+        if stream is None or not stream.shared:
+            self._apply_batch(batch, cfg)
+            return
+        # Decoded once for the whole connection; each entry applies only its own paths, and
+        # traffic counters stay with this entry, which read the frames.
+        for member in list(stream.members):
+            member_cfg = cfg if member is self else member.config
+            if member is not self:
+                member._mark_received()
+            member._apply_batch(
+                batch.restrict(
+                    member._path_interest,
+                    member._target_interest(member_cfg),
+                    counters=member is self,
+                ),
+                member_cfg,
+            )
+
+    def _apply_batch(self, batch: DecodedBatch, cfg: SignalKConfig) -> None:
+        tick = time.monotonic()
+        self._stats.messages += batch.frames
+        self._rates["messages"].add(tick, batch.frames)
+        self._rates["bytes"].add(tick, batch.size)
+        self._payload_bytes += batch.size
+        group_bytes = self._group_bytes
+        for group, size in batch.group_bytes.items():
+            group_bytes[group] = group_bytes.get(group, 0.0) + size
+        if batch.parse_errors:
+            self._stats.parse_errors += batch.parse_errors
             self._log_rate_limited(
                 logging.WARNING,
                 "Signal K message parse error (invalid JSON).",
                 key="parse_error",
             )
+        if batch.first_received is None:
             return
+        # Superseded values never reach the cache; notifications are never collapsed.
+        self._offload_stats["collapsed_values"] += batch.collapsed
+        self._offload_stats["dropped_frames"] += batch.dropped
+
+        self._latency.record("decode", ALL_GROUPS, batch.decoded_at - batch.first_received)
+        if batch.source_labels:
+            self._source_rates.record(tick, batch.source_labels)
+        if batch.notifications and self.notifications_enabled:
+            for notification in batch.notifications:
+                self._fire_notification(notification, cfg)
+        if batch.targets and self._ais is not None:
+            self._apply_targets(self._ais, batch.targets)
 
-        # Filter by vessel context so data from other vessels cannot pollute this entry.
-        contexts = self._expected_contexts(cfg)
-        changed = extract_values(obj, contexts)
-        notifications = extract_notifications(obj, contexts)
-        if notifications:
-            # Keep notifications out of the sensor cache; they have their own event pipeline.
-            if self.notifications_enabled:
-                for notification in notifications:
-                    self._fire_notification(notification, cfg)
-            for notification in notifications:
-                changed.pop(notification["path"], None)
-
-        sources = extract_sources(obj, contexts)
         source_changed = False
-        for path, source in sources.items():
-            if path.startswith("notifications."):
-                continue
+        for path, source in batch.sources.items():
             if self._last_source_by_path.get(path) != source:
                 self._last_source_by_path[path] = source
+                self._dirty_paths.add(path)
                 source_changed = True
+        changed = batch.values
         if not changed:
             if source_changed:
                 # Source changes should still be reflected without forcing value churn.
                 self._schedule_flush()
             return
 
+        self._rates["values"].add(tick, len(batch.value_paths))
+        self._path_rates.record(tick, batch.value_paths)
+
         now = dt_util.utcnow()
+        deadline = self.hass.loop.time() + DEFAULT_STALE_SECONDS
+        deadlines = self._stale_deadlines
+        timestamps = batch.timestamps
+        received = batch.received
+        pending = self._pending_latency
         for path in changed:
             self._last_update_by_path[path] = now
-
+            pending[path] = (received[path], timestamps.get(path))
+            if path not in deadlines:
+                heapq.heappush(self._stale_heap, (deadline, path))
+            deadlines[path] = deadline
+        if self._stale_unsub is None and self._streaming:
+            self._schedule_stale_checks()
+        if self._learn_periods:
+            # Compared against the cache before it is updated; unchanged keepalives are no change.
+            self._cadence.observe(time.time(), changed, self._data_cache)
+            if self._cadence_unsub is None and self._streaming:
+                self._cadence_unsub = self.hass.loop.call_later(
+                    REVIEW_INTERVAL_SECONDS, self._review_cadence
+                )
+
+        owner = self._stream.owner if self._stream is not None else None
+        sender = owner if owner is not None else self
+        if sender._retimed:
+            sender._check_retimed(batch, self._data_cache)
         self._data_cache.update(changed)
+        self._dirty_paths.update(changed)
+        # Shallow water should not wait out a long window chosen for a busy bus.
+        urgent = self._urgent_depth > 0 and has_urgent_depth(changed, self._urgent_depth)
+        self._schedule_flush(urgent=urgent)
+
+    def _apply_targets(self, ais: AisTargets, targets: dict[str, dict[str, Any]]) -> None:
+        evicted = ais.update(targets, time.monotonic(), dt_util.utcnow())
+        updated = [context for context in targets if context not in evicted]
+        # Target contexts never collide with value paths, so they share the dirty set.
+        self._dirty_paths.update(updated)
+        self._notify_ais(updated, evicted)
+        if self._ais_unsub is None and self._streaming:
+            self._ais_unsub = self.hass.loop.call_later(
+                EXPIRY_INTERVAL_SECONDS, self._expire_targets
+            )
         self._schedule_flush()
 
-    def _schedule_flush(self, immediate: bool = False) -> None:
+    @callback
+    def _expire_targets(self) -> None:
+        self._ais_unsub = None
+        if self._ais is None:
+            return
+        expired = self._ais.expire(time.monotonic())
+        if expired:
+            self._notify_ais([], expired)
+        if len(self._ais):
+            self._ais_unsub = self.hass.loop.call_later(
+                EXPIRY_INTERVAL_SECONDS, self._expire_targets
+            )
+
+    def _review_cadence(self) -> None:
+        self._cadence_unsub = None
+        bases: dict[str, int] = {}
+        for path in self._paths:
+            plan = self._base_plan(path)
+            # Instant subscriptions send no keepalive to stretch.
+            if plan.policy != POLICY_INSTANT:
+                bases[path] = plan.period or DEFAULT_PERIOD_MS
+        moved = self._cadence.review(time.time(), bases)
+        # Learned cadences persist with the snapshot even when no period moved.
+        self._snapshot.schedule_save()
+        if not self._streaming:
+            return
+        if moved:
+            owner = self._stream.owner if self._stream is not None else None
+            target = owner if owner is not None else self
+            self.hass.async_create_task(target._async_resubscribe())
+        self._cadence_unsub = self.hass.loop.call_later(
+            REVIEW_INTERVAL_SECONDS, self._review_cadence
+        )
+
+    def _notify_ais(self, updated: list[str], removed: list[str]) -> None:
+        for listener in list(self._ais_listeners):
+            try:
+                listener(updated, removed)
+            except Exception:  # pragma: no cover - defensive
+                _LOGGER.exception("Signal K AIS listener failed")
+
+    def _prune_uninteresting_paths(self) -> None:
+        interest = self._path_interest
+        if interest is None:
+            return
+        # Drop values for paths we no longer subscribe to so the cache tracks enabled entities.
+        for cache in (
+            self._data_cache,
+            self._last_update_by_path,
+            self._last_source_by_path,
+            self._stale_deadlines,
+            self._pending_latency,
+            self._flush_times,
+            self._server_times,
+        ):
+            for path in [path for path in cache if not interest.matches(path)]:
+                del cache[path]
+        deadlines = self._stale_deadlines
+        self._stale_heap = [item for item in self._stale_heap if item[1] in deadlines]
+        heapq.heapify(self._stale_heap)
+
+    def _schedule_flush(
+        self, immediate: bool = False, *, all_paths: bool = False, urgent: bool = False
+    ) -> None:
+        if all_paths:
+            # Availability depends on connection state and staleness, which affect every path.
+            self._refresh_all_paths = True
         if immediate:
             if self._flush_handle is not None:
                 self._flush_handle.cancel()
                 self._flush_handle = None
-            # Always pass a fresh dict to HA to keep coordinator updates immutable.
-            self.async_set_updated_data(dict(self._data_cache))
+            self._publish()
             return
 
-        if self._flush_handle is not None:
-            return
+        delay = self._coalesce.min_seconds if urgent else self._coalesce.seconds
+        handle = self._flush_handle
+        if handle is not None:
+            if not urgent or handle.when() - self.hass.loop.time() <= delay:
+                return
+            # Pull a pending long-window flush forward; urgent flushes still coalesce at the
+            # minimum window so a shallow reading streaming in cannot flush per message.
+            handle.cancel()
 
         # Coalesce bursts of deltas so HA only processes state updates at a steady cadence.
-        self._flush_handle = self.hass.loop.call_later(_COALESCE_SECONDS, self._flush_updates)
+        self._flush_handle = self.hass.loop.call_later(delay, self._flush_updates)
 
     def _flush_updates(self) -> None:
         self._flush_handle = None
-        self.async_set_updated_data(dict(self._data_cache))
+        self._publish()
+
+    def _publish(self) -> None:
+        # Publish the dirty set plus a read-only view of the cache; nothing is copied, so the
+        # cost scales with how many paths changed rather than how many paths exist.
+        self._changed_paths = frozenset(self._dirty_paths)
+        self._dirty_paths.clear()
+        self._coalesce.record_flush(time.monotonic(), self._stats.messages)
+        if self._pending_latency:
+            self._record_flush_latency()
+        self.async_set_updated_data(MappingProxyType(self._data_cache))
+        if self._changed_paths and self._streaming:
+            self._snapshot.schedule_save()
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        data = encode_snapshot(
+            self._data_cache, self._last_update_by_path, self._last_source_by_path
+        )
+        if self._learn_periods:
+            data["cadence"] = self._cadence.as_storage(time.time())
+        return data
+
+    def _record_flush_latency(self) -> None:
+        # Server timestamps are only parsed here, once per flushed path, not per value.
+        flushed = time.time()
+        record = self._latency.record
+        for path, (received, timestamp) in self._pending_latency.items():
+            group = path_group(path)
+            record("coalesce", group, flushed - received)
+            self._flush_times[path] = flushed
+            server = parse_server_timestamp(timestamp) if timestamp else None
+            if server is None:
+                self._server_times.pop(path, None)
+                continue
+            self._server_times[path] = server
+            record("network", group, received - server)
+        self._pending_latency.clear()
 
     def _set_state(self, state: ConnectionState) -> None:
         if self._state == state:
@@ -654,6 +1699,7 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._state = state
         if state == ConnectionState.CONNECTED:
             self._last_error = None
+            self._warm_start = False
             if previous != ConnectionState.CONNECTED:  # pragma: no branch
                 _LOGGER.info("Signal K connection restored")
         elif previous == ConnectionState.CONNECTED and state in (
@@ -662,7 +1708,11 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ):
             _LOGGER.warning("Signal K connection unavailable")
         # Health sensors reflect state transitions immediately.
-        self._schedule_flush(immediate=True)
+        self._schedule_flush(immediate=True, all_paths=True)
+        stream = self._stream
+        if stream is not None and stream.owner is self:
+            for follower in stream.followers:
+                follower._set_state(state)
 
     def _record_error(self, message: str) -> None:
         self._last_error = message[:200]
@@ -683,6 +1733,59 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._log_times[key] = now
         _LOGGER.log(level, message)
 
+    def _learn_server_self(self, text: str) -> bool:
+        # The hello frame names the server's own context; a hash vessel id cannot match it.
+        try:
+            hello = loads(text)
+        except JSONDecodeError:
+            return False
+        if not isinstance(hello, dict) or "updates" in hello:
+            return False
+        server_self = hello.get("self")
+        if not isinstance(server_self, str) or not server_self.startswith("vessels."):
+            return False
+        if server_self == self._server_self:
+            return False
+        stream = self._stream
+        members = stream.members if stream is not None else [self]
+        for member in members:
+            member._server_self = server_self
+            member._context_matcher = None
+        self._refresh_stream()
+        return True
+
+    def _self_context_known(self, cfg: SignalKConfig) -> bool:
+        return _identifies_context(cfg.vessel_id) or self._server_self is not None
+
+    def _context_matcher_for(self, cfg: SignalKConfig, *, rebuild: bool = False) -> ContextMatcher:
+        matcher = self._context_matcher
+        if rebuild or matcher is None or self._context_vessel_id != cfg.vessel_id:
+            # Once our own context is known any other URN context belongs to another vessel
+            # (AIS) and is dropped before decoding. A hash vessel id never appears in deltas,
+            # so until the hello names the server's self every URN context is accepted.
+            matcher = ContextMatcher(
+                self._expected_contexts(cfg),
+                self_urn_fallback=not self._self_context_known(cfg),
+            )
+            self._context_matcher = matcher
+            self._context_vessel_id = cfg.vessel_id
+        return matcher
+
+    def _target_interest(self, cfg: SignalKConfig) -> PathInterest | None:
+        # Other vessels can only be told apart from our own once our context is known.
+        return self._ais_interest if self._self_context_known(cfg) else None
+
+    def _decode_interest(self) -> PathInterest | None:
+        stream = self._stream
+        return stream.interest if stream is not None and stream.shared else self._path_interest
+
+    def _decode_targets(self, cfg: SignalKConfig) -> PathInterest | None:
+        stream = self._stream
+        if stream is not None and stream.shared:
+            # Members share the vessel id (it is part of the stream key) and the hello.
+            return stream.targets if self._self_context_known(cfg) else None
+        return self._target_interest(cfg)
+
     def _expected_contexts(self, cfg: SignalKConfig) -> list[str]:
         contexts = ["vessels.self"]
         vessel_id = cfg.vessel_id
@@ -692,6 +1795,8 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else:
                 contexts.append(f"vessels.{vessel_id}")
                 contexts.append(vessel_id)
+        if self._server_self and not _identifies_context(vessel_id):
+            contexts.append(self._server_self)
         return contexts
 
     def _fire_notification(self, notification: dict[str, Any], cfg: SignalKConfig) -> None:
@@ -719,24 +1824,12 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else:
                 message = path
 
-        signature = self._notification_signature(value, state, message, method, source)
+        signature = notification_signature(value, state, message, method, source)
         now = time.monotonic()
-        last = self._notification_cache.get(path)
-        if last:
-            last_signature, last_timestamp, last_seen = last
-            if timestamp and timestamp == last_timestamp and signature == last_signature:
-                return
-            if (
-                not timestamp
-                and signature == last_signature
-                and now - last_seen < _NOTIFICATION_DEDUPE_SECONDS
-            ):
-                return
+        if self._notification_dedupe.is_duplicate(path, signature, timestamp, now):
+            return
 
-        self._notification_cache[path] = (signature, timestamp, now)
         received_at = dt_util.utcnow()
-        if self._first_notification_at is None:
-            self._first_notification_at = received_at
         event_data = {
             "path": path,
             "value": value,
@@ -750,7 +1843,21 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "entry_id": self._entry.entry_id,
             "received_at": received_at,
         }
+        if not self._notification_limiter.allow(path, (state, message, method), now):
+            if self._notification_summary:
+                self._hold_notification_repeat(event_data)
+            return
+        held = self._notification_repeats.pop(path, None)
+        if held is not None:
+            # Summarize the held repeats first so the entity never steps back to an older state.
+            self._emit_notification_summary(*held, cfg)
+        self._emit_notification(event_data, cfg)
+
+    def _emit_notification(self, event_data: dict[str, Any], cfg: SignalKConfig) -> None:
+        if self._first_notification_at is None:
+            self._first_notification_at = event_data["received_at"]
         self._notification_count += 1
+        self._rates["notifications"].add(time.monotonic())
         self._last_notification = event_data
         _LOGGER.debug("Signal K notification: %s", event_data)
         if self.notifications_enabled:
@@ -762,22 +1869,28 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             event_type = notification_event_type(cfg.vessel_name)
             self.hass.bus.async_fire(event_type, event_data)
 
-    @staticmethod
-    def _notification_signature(
-        value: Any,
-        state: Any,
-        message: Any,
-        method: Any,
-        source: str | None,
-    ) -> tuple[Any, ...]:
-        if isinstance(value, (dict, list)):
-            try:
-                value_repr = json.dumps(value, sort_keys=True, default=str)
-            except TypeError:
-                value_repr = repr(value)
-        else:
-            value_repr = repr(value)
-        return (state, message, method, source, value_repr)
+    def _hold_notification_repeat(self, event_data: dict[str, Any]) -> None:
+        path = event_data["path"]
+        held = self._notification_repeats.get(path)
+        self._notification_repeats[path] = (event_data, held[1] + 1 if held else 1)
+        if self._summary_handle is None:
+            self._summary_handle = self.hass.loop.call_later(
+                _NOTIFICATION_SUMMARY_SECONDS, self._flush_notification_repeats
+            )
+
+    @callback
+    def _flush_notification_repeats(self) -> None:
+        self._summary_handle = None
+        held, self._notification_repeats = self._notification_repeats, {}
+        cfg = self.config
+        for event_data, repeated in held.values():
+            self._emit_notification_summary(event_data, repeated, cfg)
+
+    def _emit_notification_summary(
+        self, event_data: dict[str, Any], repeated: int, cfg: SignalKConfig
+    ) -> None:
+        self._notification_summaries += 1
+        self._emit_notification({**event_data, "repeated": repeated}, cfg)
 
     @staticmethod
     def _build_ssl_param(cfg: SignalKConfig) -> ssl.SSLContext | bool | None:
@@ -796,12 +1909,36 @@ class SignalKCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.hass.async_create_task(reauth_coro)
 
     def _schedule_stale_checks(self) -> None:
-        if self._stale_unsub is not None:
+        if not self._stale_heap:
             return
-        self._stale_unsub = self.hass.loop.call_later(_STALE_CHECK_SECONDS, self._stale_tick)
+        when = self._stale_heap[0][0] + _STALE_GRACE_SECONDS
+        if self._stale_unsub is not None:
+            # Live values get a fixed timeout and never expire before the armed head, but
+            # restored values keep their age and may; only then is the timer moved earlier.
+            if self._stale_unsub.when() <= when:
+                return
+            self._stale_unsub.cancel()
+        self._stale_unsub = self.hass.loop.call_at(when, self._stale_tick)
 
     def _stale_tick(self) -> None:
         self._stale_unsub = None
-        self._schedule_flush(immediate=True)
+        now = self.hass.loop.time()
+        heap = self._stale_heap
+        deadlines = self._stale_deadlines
+        stale: list[str] = []
+        while heap and heap[0][0] <= now:
+            _, path = heapq.heappop(heap)
+            deadline = deadlines.get(path)
+            if deadline is None:
+                continue  # Pruned since it was scheduled.
+            if deadline > now:
+                heapq.heappush(heap, (deadline, path))
+                continue
+            del deadlines[path]
+            stale.append(path)
+        if stale:
+            # Only the entities whose path expired are re-evaluated, right as it expires.
+            self._dirty_paths.update(stale)
+            self._schedule_flush(immediate=True)
         if not self._stop_event.is_set():
             self._schedule_stale_checks()
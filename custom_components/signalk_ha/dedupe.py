@@ -0,0 +1,185 @@
+"""Notification dedupe with cheap value signatures, and per-path storm control."""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Any
+
+# Without a server timestamp, an identical notification within this window is a resend.
+DEDUPE_SECONDS = 5.0
+# Paths not seen for this long are forgotten; a later repeat fires again.
+TTL_SECONDS = 3600.0
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def value_signature(value: Any) -> Any:
+    """Return a comparable, hashable stand-in for a notification value.
+
+    Scalars are tagged with their type and flat objects (the usual ``state``/``message``/
+    ``method`` shape) become a frozenset of items. Only nested values pay for canonical JSON.
+    """
+    if isinstance(value, _SCALARS):
+        return _typed(value)
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            if isinstance(item, _SCALARS):
+                items.append((key, _typed(item)))
+            elif isinstance(item, list) and all(isinstance(part, _SCALARS) for part in item):
+                items.append((key, tuple(_typed(part) for part in item)))
+            else:
+                break
+        else:
+            try:
+                return frozenset(items)
+            except TypeError:
+                # Unhashable keys cannot come from JSON, but fall through to be safe.
+                pass
+    elif isinstance(value, list) and all(isinstance(part, _SCALARS) for part in value):
+        return tuple(_typed(part) for part in value)
+    try:
+        return json.dumps(value, sort_keys=True, default=str)
+    except TypeError:
+        return repr(value)
+
+
+def _typed(item: Any) -> tuple[str, Any]:
+    # 1, 1.0 and True compare (and hash) equal; JSON tells them apart, so must we.
+    return (type(item).__name__, item)
+
+
+def notification_signature(
+    value: Any,
+    state: Any,
+    message: Any,
+    method: Any,
+    source: str | None,
+) -> tuple[Any, ...]:
+    return (state, message, method, source, value_signature(value))
+
+
+class NotificationDedupe:
+    """Last signature per notification path, bounded by size (LRU) and idle time (TTL).
+
+    Entries are kept in last-seen order, so both evictions pop from the front and checking a
+    notification is O(1) amortized however many paths the server publishes.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        *,
+        window: float = DEDUPE_SECONDS,
+        ttl: float = TTL_SECONDS,
+    ) -> None:
+        self._max_size = max(max_size, 1)
+        self._window = window
+        self._ttl = ttl
+        # path -> (signature, server timestamp, fired at, last seen)
+        self._entries: OrderedDict[str, tuple[tuple[Any, ...], str | None, float, float]] = (
+            OrderedDict()
+        )
+        self._suppressed = 0
+        self._lru_evictions = 0
+        self._ttl_evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_duplicate(
+        self, path: str, signature: tuple[Any, ...], timestamp: str | None, now: float
+    ) -> bool:
+        """Return True for a resend of the last notification on `path`; otherwise record it."""
+        self._expire(now)
+        entries = self._entries
+        last = entries.get(path)
+        if last is not None:
+            last_signature, last_timestamp, fired_at, _ = last
+            if signature == last_signature and (
+                (timestamp and timestamp == last_timestamp)
+                or (not timestamp and now - fired_at < self._window)
+            ):
+                # Seeing a duplicate keeps the entry alive so the repeat stays suppressed.
+                entries[path] = (last_signature, last_timestamp, fired_at, now)
+                entries.move_to_end(path)
+                self._suppressed += 1
+                return True
+            entries.move_to_end(path)
+        entries[path] = (signature, timestamp, now, now)
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
+            self._lru_evictions += 1
+        return False
+
+    def _expire(self, now: float) -> None:
+        entries = self._entries
+        cutoff = now - self._ttl
+        while entries:
+            path, entry = next(iter(entries.items()))
+            if entry[3] > cutoff:
+                return
+            del entries[path]
+            self._ttl_evictions += 1
+
+    def as_dict(self, now: float) -> dict[str, float | int]:
+        self._expire(now)
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl_seconds": self._ttl,
+            "suppressed": self._suppressed,
+            "lru_evictions": self._lru_evictions,
+            "ttl_evictions": self._ttl_evictions,
+        }
+
+
+class NotificationRateLimiter:
+    """Per-path token buckets for notifications that repeat without changing.
+
+    Each path may fire `burst` notifications back to back and then one per refill interval.
+    A change of `key` (the caller passes state, message and method) always passes and does not
+    use a token, so limiting can only delay repeats, never hide an escalation or a new message.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int, max_size: int) -> None:
+        self._rate = max(rate_per_minute, 0.0) / 60.0
+        self._burst = max(burst, 1)
+        self._max_size = max(max_size, 1)
+        # path -> (tokens, updated at, last key); same LRU bound as the dedupe cache. A
+        # forgotten path starts with a full bucket, which is all eviction can cost.
+        self._buckets: OrderedDict[str, tuple[float, float, Any]] = OrderedDict()
+        self._limited = 0
+
+    def allow(self, path: str, key: Any, now: float) -> bool:
+        if not self._rate:
+            return True
+        buckets = self._buckets
+        bucket = buckets.pop(path, None)
+        if bucket is None:
+            tokens = float(self._burst)
+            changed = False
+        else:
+            last_tokens, updated_at, last_key = bucket
+            tokens = min(last_tokens + (now - updated_at) * self._rate, float(self._burst))
+            changed = key != last_key
+        if changed:
+            allowed = True
+        elif tokens >= 1.0:
+            tokens -= 1.0
+            allowed = True
+        else:
+            allowed = False
+            self._limited += 1
+        buckets[path] = (tokens, now, key)
+        if len(buckets) > self._max_size:
+            buckets.popitem(last=False)
+        return allowed
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "rate_per_minute": round(self._rate * 60.0, 2),
+            "burst": self._burst,
+            "tracked_paths": len(self._buckets),
+            "limited": self._limited,
+        }
@@ -6,6 +6,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
+from .codec import BACKEND as JSON_BACKEND
+from .codec import TYPED_DELTAS
 from .const import CONF_SERVER_ID, CONF_SERVER_VERSION
 from .schema import SCHEMA_VERSION
 
@@ -66,16 +68,32 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             "last_success": auth_last_success_iso,
         },
         "connection_state": coordinator.connection_state,
+        "shared_connection": coordinator.shared_connection,
+        "link": coordinator.link_quality,
+        "transfer": coordinator.transfer,
         "last_error": coordinator.last_error,
         "counters": coordinator.counters,
+        "json_codec": {"backend": JSON_BACKEND, "typed_deltas": TYPED_DELTAS},
+        "coalescing": coordinator.coalescing,
+        "decode_offload": coordinator.offload,
+        "ingest_rates_per_second": coordinator.ingest_rates,
+        "top_paths": coordinator.top_paths(),
+        "top_sources": coordinator.top_sources(),
+        "latency_ms": coordinator.latency,
         "reconnect_count": coordinator.reconnect_count,
         "last_backoff_seconds": coordinator.last_backoff,
         "last_message": last_message_iso,
         "last_rest_refresh": last_refresh_iso,
+        "discovery_from_cache": discovery.from_cache,
         "subscribed_path_count": len(coordinator.subscribed_paths),
+        "subscription_plan": coordinator.subscription_plan,
+        "learned_periods": coordinator.learned_periods,
+        "ais": coordinator.ais,
         "notifications": {
             "count": coordinator.notification_count,
             "last": last_notification,
+            "dedupe": coordinator.notification_dedupe,
+            "rate_limit": coordinator.notification_rate_limit,
         },
         "metadata_conflicts": [
             {
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from collections import Counter
-from dataclasses import dataclass, field, replace
-from typing import Any, Iterable
+from dataclasses import asdict, dataclass, field, replace
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 
 from .const import DEFAULT_PERIOD_MS, DEFAULT_POSITION_TOLERANCE_M, SK_PATH_POSITION
 from .mapping import Conversion, apply_conversion, lookup_mapping
+from .planner import SubscriptionPlan, build_plans
 from .schema import SCHEMA_GROUPS, lookup_schema
 
 _RESERVED_KEYS = {
@@ -97,9 +100,21 @@ class DiscoveryResult:
     conflicts: list[MetadataConflict]
     paths: frozenset[str] = field(init=False)
     path_kinds: frozenset[tuple[str, str]] = field(init=False)
+    # Subscription period per path, built once per refresh rather than per registry change.
+    periods: Mapping[str, int] = field(init=False)
+    # Subscription plan per path, derived from the write throttle of the entities reading it.
+    plans: Mapping[str, SubscriptionPlan] = field(init=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "paths", frozenset(spec.path for spec in self.entities))
+        object.__setattr__(
+            self,
+            "periods",
+            MappingProxyType(
+                {spec.path: spec.period_ms for spec in self.entities if spec.period_ms}
+            ),
+        )
+        object.__setattr__(self, "plans", MappingProxyType(build_plans(self.entities)))
         object.__setattr__(
             self,
             "path_kinds",
@@ -123,6 +138,57 @@ def discover_entities(data: dict[str, Any], scopes: Iterable[str]) -> DiscoveryR
     )
 
 
+def discovery_result_to_dict(result: DiscoveryResult) -> dict[str, Any]:
+    """Serialize a result for the on-disk discovery cache."""
+    entities = []
+    for spec in result.entities:
+        item = asdict(spec)
+        for key in ("device_class", "state_class", "conversion"):
+            if item[key] is not None:
+                item[key] = item[key].value
+        entities.append(item)
+    conflicts = [
+        {
+            "path": conflict.path,
+            "meta_units": conflict.meta_units,
+            "expected_units": list(conflict.expected_units),
+        }
+        for conflict in result.conflicts
+    ]
+    return {"entities": entities, "conflicts": conflicts}
+
+
+def discovery_result_from_dict(data: Any) -> DiscoveryResult | None:
+    """Rebuild a cached result; returns None if anything no longer matches this version."""
+    try:
+        entities = [
+            DiscoveredEntity(
+                **{
+                    **item,
+                    "device_class": _enum_or_none(SensorDeviceClass, item["device_class"]),
+                    "state_class": _enum_or_none(SensorStateClass, item["state_class"]),
+                    "conversion": _enum_or_none(Conversion, item["conversion"]),
+                }
+            )
+            for item in data["entities"]
+        ]
+        conflicts = [
+            MetadataConflict(
+                path=item["path"],
+                meta_units=item["meta_units"],
+                expected_units=tuple(item["expected_units"]),
+            )
+            for item in data["conflicts"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return DiscoveryResult(entities=entities, conflicts=conflicts)
+
+
+def _enum_or_none(enum_type: type[Enum], value: Any) -> Any:
+    return None if value is None else enum_type(value)
+
+
 def _walk(
     node: dict[str, Any],
     prefix: str,
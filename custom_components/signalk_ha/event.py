@@ -85,7 +85,9 @@ class SignalKNotificationEvent(CoordinatorEntity, EventEntity):
     _attr_event_types = list(NOTIFICATION_EVENT_TYPES)
 
     def __init__(self, coordinator: SignalKCoordinator, entry: ConfigEntry, path: str) -> None:
-        super().__init__(coordinator)
+        # Notification paths never enter the value cache, so this entity only wakes on
+        # connection changes that affect availability.
+        super().__init__(coordinator, context=path)
         self._entry = entry
         self._path = path
         self._attr_unique_id = f"signalk:{entry.entry_id}:{path}"
@@ -178,6 +180,7 @@ def _notification_attributes(event_data: dict[str, Any]) -> dict[str, Any]:
         "vessel_name",
         "entry_id",
         "value",
+        "repeated",
     ):
         value = event_data.get(key)
         if value is not None:
@@ -1,7 +1,8 @@
-"""Geo-location entity for vessel position updates."""
+"""Geo-location entities for the vessel position and, when enabled, AIS targets."""
 
 from __future__ import annotations
 
+import asyncio
 import math
 import time
 from typing import Any
@@ -14,6 +15,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
+from .ais import target_mmsi
 from .const import (
     DEFAULT_MAX_IDLE_WRITE_SECONDS,
     DEFAULT_MIN_UPDATE_MS,
@@ -50,6 +52,10 @@ async def async_setup_entry(
     )
     entry.async_on_unload(discovery.async_add_listener(listener.handle_update))
 
+    if coordinator.ais_enabled:
+        targets = _SignalKAisListener(coordinator, async_add_entities)
+        entry.async_on_unload(coordinator.async_add_ais_listener(targets.handle_targets))
+
 
 def _should_create_geolocation(discovery: SignalKDiscoveryCoordinator) -> bool:
     data = discovery.data
@@ -81,7 +87,8 @@ class SignalKPositionGeolocation(CoordinatorEntity, GeolocationEvent):
         discovery: SignalKDiscoveryCoordinator,
         entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        # Bound to the position path so other path updates do not wake this entity.
+        super().__init__(coordinator, context=SK_PATH_POSITION)
         self._entry = entry
         self._discovery = discovery
         self._attr_device_info = build_device_info(entry)
@@ -94,10 +101,12 @@ class SignalKPositionGeolocation(CoordinatorEntity, GeolocationEvent):
         self._last_write: float | None = None
         self._last_available: bool | None = None
         self._last_seen_at: dt_util.dt | None = None
+        self._recheck_handle: asyncio.TimerHandle | None = None
 
     @property
     def available(self) -> bool:
-        if not self.coordinator.is_connected:
+        # Restored snapshot values are shown until the first connection, while fresh.
+        if not self.coordinator.is_connected and not self.coordinator.warm_start:
             return False
         if not _path_available(self._discovery):
             return False
@@ -140,7 +149,7 @@ class SignalKPositionGeolocation(CoordinatorEntity, GeolocationEvent):
         data["tolerance"] = DEFAULT_POSITION_TOLERANCE_M
         if self._description:
             data["description"] = self._description
-        source = self.coordinator.last_source_by_path.get(SK_PATH_POSITION)
+        source = self.coordinator.last_source_for(SK_PATH_POSITION)
         if source:
             data["source"] = source
         last_seen = _last_seen(self.coordinator)
@@ -160,6 +169,29 @@ class SignalKPositionGeolocation(CoordinatorEntity, GeolocationEvent):
             if last_seen is not None:
                 self._last_seen_at = last_seen
             self.async_write_ha_state()
+            self.coordinator.record_state_write(SK_PATH_POSITION)
+        else:
+            self._schedule_throttle_recheck()
+
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        if self._recheck_handle is not None:
+            self._recheck_handle.cancel()
+            self._recheck_handle = None
+
+    def _schedule_throttle_recheck(self) -> None:
+        # Only position deltas wake this entity, so look again when the throttle window
+        # closes rather than leaving a skipped position until the next delta.
+        if self._recheck_handle is not None or self._last_write is None or self.hass is None:
+            return
+        remaining = self._last_write + DEFAULT_MIN_UPDATE_MS / 1000.0 - time.monotonic()
+        if remaining > 0:
+            self._recheck_handle = self.hass.loop.call_later(remaining, self._throttle_recheck)
+
+    @callback
+    def _throttle_recheck(self) -> None:
+        self._recheck_handle = None
+        self._handle_coordinator_update()
 
     def _coords(self) -> tuple[float, float] | None:
         lat = self.latitude
@@ -193,7 +225,7 @@ class SignalKPositionGeolocation(CoordinatorEntity, GeolocationEvent):
         return coords != self._last_coords
 
     def _current_seen_at(self) -> dt_util.dt | None:
-        return self.coordinator.last_update_by_path.get(SK_PATH_POSITION)
+        return self.coordinator.last_update_for(SK_PATH_POSITION)
 
 
 def _coord_distance(a: tuple[float, float], b: tuple[float, float]) -> float:
@@ -215,14 +247,14 @@ def _coord_distance(a: tuple[float, float], b: tuple[float, float]) -> float:
 
 
 def _last_seen(coordinator: SignalKCoordinator) -> str | None:
-    timestamp = coordinator.last_update_by_path.get(SK_PATH_POSITION)
+    timestamp = coordinator.last_update_for(SK_PATH_POSITION)
     if not timestamp:
         return None
     return dt_util.as_utc(timestamp).isoformat()
 
 
 def _is_stale(coordinator: SignalKCoordinator) -> bool:
-    timestamp = coordinator.last_update_by_path.get(SK_PATH_POSITION)
+    timestamp = coordinator.last_update_for(SK_PATH_POSITION)
     if not timestamp:
         return True
     age = dt_util.utcnow() - timestamp
@@ -279,3 +311,147 @@ class _SignalKDiscoveryListener:
         self._async_add_entities(
             [SignalKPositionGeolocation(self._coordinator, self._discovery, self._entry)]
         )
+
+
+class SignalKAisTargetGeolocation(CoordinatorEntity, GeolocationEvent):
+    """Another vessel on the stream; created on its first position and removed on expiry.
+
+    Targets come and go by the hundreds, so they are not registered (no unique id) and the
+    entity lives only as long as the target stays in the coordinator's cache.
+    """
+
+    _attr_source = "Signal K AIS"
+    _attr_icon = "mdi:ferry"
+
+    def __init__(self, coordinator: SignalKCoordinator, context: str) -> None:
+        # Bound to the target context, so only updates for this vessel wake the entity.
+        super().__init__(coordinator, context=context)
+        self._target_context = context
+        self._mmsi = target_mmsi(context)
+        self._attr_name = f"AIS {self._mmsi or context.removeprefix('vessels.')}"
+        self._remove_when_added = False
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._remove_when_added:
+            # The target expired or was evicted before the platform added the entity.
+            self.hass.async_create_task(self.async_remove(force_remove=True))
+
+    @callback
+    def async_remove_target(self) -> None:
+        """Remove the entity now, or as soon as it is added if it is still pending."""
+        if self.hass is None:
+            self._remove_when_added = True
+            return
+        self.hass.async_create_task(self.async_remove(force_remove=True))
+
+    @callback
+    def async_keep_target(self) -> None:
+        """Cancel a removal that has not happened yet, for a target that came back."""
+        self._remove_when_added = False
+
+    @property
+    def available(self) -> bool:
+        if not self.coordinator.is_connected:
+            return False
+        return self._position() is not None
+
+    @property
+    def latitude(self) -> float | None:
+        position = self._position()
+        return position[0] if position else None
+
+    @property
+    def longitude(self) -> float | None:
+        position = self._position()
+        return position[1] if position else None
+
+    @property
+    def distance(self) -> float | None:
+        position = self._position()
+        own = self.coordinator.data.get(SK_PATH_POSITION) if self.coordinator.data else None
+        own_coords = _position_coords(own)
+        if position is None or own_coords is None:
+            return None
+        # Geo-location distances are reported in kilometers.
+        return round(_coord_distance(own_coords, position) / 1000.0, 3)
+
+    @property
+    def state_attributes(self) -> dict[str, Any]:
+        data = super().state_attributes
+        data["context"] = self._target_context
+        if self._mmsi:
+            data["mmsi"] = self._mmsi
+        target = self.coordinator.ais_target(self._target_context)
+        if target is None:
+            return data
+        for path, value in target.values.items():
+            if path != SK_PATH_POSITION:
+                data[path] = value
+        if target.last_seen is not None:
+            data["last_seen"] = dt_util.as_utc(target.last_seen).isoformat()
+        return data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # The server's minPeriod already throttles targets; every wake is a real update.
+        self.async_write_ha_state()
+
+    def _position(self) -> tuple[float, float] | None:
+        target = self.coordinator.ais_target(self._target_context)
+        if target is None:
+            return None
+        return _position_coords(target.values.get(SK_PATH_POSITION))
+
+
+def _position_coords(raw: Any) -> tuple[float, float] | None:
+    if not isinstance(raw, dict):
+        return None
+    latitude = raw.get("latitude")
+    longitude = raw.get("longitude")
+    if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
+        return None
+    return (float(latitude), float(longitude))
+
+
+class _SignalKAisListener:
+    def __init__(
+        self, coordinator: SignalKCoordinator, async_add_entities: AddEntitiesCallback
+    ) -> None:
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._entities: dict[str, SignalKAisTargetGeolocation] = {}
+        # Removed before the platform added them; they go once added unless the target returns.
+        self._pending_removal: dict[str, SignalKAisTargetGeolocation] = {}
+
+    @callback
+    def handle_targets(self, updated: list[str], removed: list[str]) -> None:
+        pending = self._pending_removal
+        for context in [context for context, entity in pending.items() if entity.hass]:
+            del pending[context]
+        for context in removed:
+            entity = self._entities.pop(context, None)
+            if entity is None:
+                continue
+            entity.async_remove_target()
+            if entity.hass is None:
+                pending[context] = entity
+        created: list[SignalKAisTargetGeolocation] = []
+        for context in updated:
+            if context in self._entities:
+                continue
+            entity = pending.pop(context, None)
+            if entity is not None and entity.hass is None:
+                # Still waiting to be added, so the same entity takes the target back.
+                entity.async_keep_target()
+                self._entities[context] = entity
+                continue
+            target = self._coordinator.ais_target(context)
+            # Created lazily: a target without a position has nothing to show on a map.
+            if target is None or _position_coords(target.values.get(SK_PATH_POSITION)) is None:
+                continue
+            entity = SignalKAisTargetGeolocation(self._coordinator, context)
+            self._entities[context] = entity
+            created.append(entity)
+        if created:
+            self._async_add_entities(created)
@@ -0,0 +1,86 @@
+"""Latency samples per pipeline stage and path group, summarized as percentiles."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from typing import Iterable
+
+# Stages, in pipeline order:
+# network: server timestamp -> WebSocket receive (subject to clock skew between hosts)
+# decode: WebSocket receive -> delta decoded
+# coalesce: WebSocket receive -> coordinator flush
+# dispatch: coordinator flush -> async_write_ha_state (includes entity throttling)
+# end_to_end: server timestamp -> async_write_ha_state
+LATENCY_STAGES = ("network", "decode", "coalesce", "dispatch", "end_to_end")
+ALL_GROUPS = "all"
+# Recent samples kept per stage and group; percentiles describe current behaviour, not history.
+_SAMPLES = 512
+_PERCENTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+
+def path_group(path: str) -> str:
+    return path.split(".", 1)[0]
+
+
+def parse_server_timestamp(value: str) -> float | None:
+    """Convert a Signal K ISO 8601 timestamp to epoch seconds, or None if unparseable."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return parsed.timestamp()
+
+
+def _percentiles(samples: Iterable[float]) -> dict[str, float | int]:
+    ordered = sorted(samples)
+    count = len(ordered)
+    summary: dict[str, float | int] = {"count": count}
+    for label, quantile in _PERCENTILES:
+        # Nearest-rank percentile; reported in milliseconds.
+        index = min(count - 1, max(0, int(quantile * count + 0.5) - 1))
+        summary[label] = round(ordered[index] * 1000.0, 1)
+    return summary
+
+
+class LatencyTracker:
+    """Bounded per-(stage, group) sample windows."""
+
+    def __init__(self, samples: int = _SAMPLES) -> None:
+        self._samples = samples
+        self._windows: dict[tuple[str, str], deque[float]] = {}
+
+    def record(self, stage: str, group: str, seconds: float) -> None:
+        window = self._windows.get((stage, group))
+        if window is None:
+            window = self._windows[(stage, group)] = deque(maxlen=self._samples)
+        window.append(seconds)
+
+    def summary(self, stage: str, group: str = ALL_GROUPS) -> dict[str, float | int] | None:
+        """Percentiles for one stage; the "all" group merges every group's samples."""
+        if group == ALL_GROUPS:
+            samples = [
+                sample
+                for (name, _), window in self._windows.items()
+                if name == stage
+                for sample in window
+            ]
+        else:
+            samples = list(self._windows.get((stage, group), ()))
+        if not samples:
+            return None
+        return _percentiles(samples)
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        result: dict[str, dict[str, dict[str, float | int]]] = {}
+        for stage in LATENCY_STAGES:
+            groups = sorted(group for name, group in self._windows if name == stage)
+            if not groups:
+                continue
+            stage_summary = {group: _percentiles(self._windows[(stage, group)]) for group in groups}
+            if len(groups) > 1:
+                stage_summary[ALL_GROUPS] = self.summary(stage)  # type: ignore[assignment]
+            result[stage] = stage_summary
+        return result
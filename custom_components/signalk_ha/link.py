@@ -0,0 +1,123 @@
+"""Link quality of the WebSocket stream: ping RTT, frame inter-arrival and idle timeout."""
+
+from __future__ import annotations
+
+# Application-level pings replace aiohttp's heartbeat so the round trip can be measured.
+PING_INTERVAL_SECONDS = 20.0
+# Used until frames have been observed, and when nothing is subscribed.
+DEFAULT_INACTIVITY_SECONDS = 45.0
+# Silence tolerated, in multiples of the expected gap between frames.
+_INACTIVITY_FACTOR = 3.0
+_MIN_INACTIVITY_SECONDS = 20.0
+_MAX_INACTIVITY_SECONDS = 180.0
+# Longest keepalive whose silence the inactivity timeout still tolerates.
+MAX_KEEPALIVE_SECONDS = _MAX_INACTIVITY_SECONDS / _INACTIVITY_FACTOR
+# RFC 6298 gains for the smoothed mean and mean deviation.
+_ALPHA = 0.125
+_BETA = 0.25
+
+
+class SmoothedEstimate:
+    """Exponentially smoothed mean and mean deviation (jitter), as TCP estimates RTT."""
+
+    __slots__ = ("mean", "deviation", "last", "samples")
+
+    def __init__(self) -> None:
+        self.mean = 0.0
+        self.deviation = 0.0
+        self.last = 0.0
+        self.samples = 0
+
+    def add(self, sample: float) -> None:
+        if self.samples:
+            self.deviation += _BETA * (abs(self.mean - sample) - self.deviation)
+            self.mean += _ALPHA * (sample - self.mean)
+        else:
+            self.mean = sample
+            self.deviation = sample / 2.0
+        self.last = sample
+        self.samples += 1
+
+    @property
+    def upper(self) -> float:
+        # Same margin as the TCP retransmission timeout: mean plus four deviations.
+        return self.mean + 4.0 * self.deviation
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        if not self.samples:
+            return {"mean_ms": None, "jitter_ms": None, "last_ms": None, "samples": 0}
+        return {
+            "mean_ms": round(self.mean * 1000.0, 1),
+            "jitter_ms": round(self.deviation * 1000.0, 1),
+            "last_ms": round(self.last * 1000.0, 1),
+            "samples": self.samples,
+        }
+
+
+class LinkQuality:
+    """Ping round trips and frame gaps of one connection, and the idle timeout they imply.
+
+    Estimates survive reconnects (they describe the link, not one socket); only the
+    outstanding ping and the previous frame time are per connection.
+    """
+
+    def __init__(self) -> None:
+        self.rtt = SmoothedEstimate()
+        self.frames = SmoothedEstimate()
+        self._sequence = 0
+        self._outstanding: tuple[bytes, float] | None = None
+        self._last_frame: float | None = None
+        self._missed_pongs = 0
+
+    @property
+    def missed_pongs(self) -> int:
+        return self._missed_pongs
+
+    def reset_connection(self) -> None:
+        self._outstanding = None
+        self._last_frame = None
+
+    def start_ping(self, now: float) -> bytes | None:
+        """Return the next ping payload, or None when the previous ping was never answered."""
+        if self._outstanding is not None:
+            self._missed_pongs += 1
+            self._outstanding = None
+            return None
+        self._sequence += 1
+        payload = self._sequence.to_bytes(8, "big")
+        self._outstanding = (payload, now)
+        return payload
+
+    def pong(self, payload: bytes, now: float) -> None:
+        outstanding = self._outstanding
+        # Unsolicited pongs (RFC 6455 allows them) carry no timing information.
+        if outstanding is None or payload != outstanding[0]:
+            return
+        self._outstanding = None
+        self.rtt.add(now - outstanding[1])
+
+    def frame(self, now: float) -> None:
+        last = self._last_frame
+        self._last_frame = now
+        if last is not None:
+            self.frames.add(now - last)
+
+    def inactivity_timeout(self, keepalive_seconds: float | None) -> float:
+        """Seconds of silence after which the connection is presumed dead.
+
+        `keepalive_seconds` is the longest subscribed period: a server honouring keepalives
+        sends every path with data at least that often. Slower observed gaps widen it.
+        """
+        if keepalive_seconds is None or not self.frames.samples:
+            return DEFAULT_INACTIVITY_SECONDS
+        expected = max(keepalive_seconds, self.frames.upper)
+        timeout = _INACTIVITY_FACTOR * expected + self.rtt.upper
+        return min(max(timeout, _MIN_INACTIVITY_SECONDS), _MAX_INACTIVITY_SECONDS)
+
+    def as_dict(self, keepalive_seconds: float | None) -> dict[str, object]:
+        return {
+            "rtt": self.rtt.as_dict(),
+            "frame_interval": self.frames.as_dict(),
+            "missed_pongs": self._missed_pongs,
+            "inactivity_timeout_s": round(self.inactivity_timeout(keepalive_seconds), 1),
+        }
@@ -2,9 +2,97 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from typing import Any, Iterable
 
+from .codec import UNSET, DeltaFrame, JSONDecodeError, loads_delta
+
+# Servers repeat a handful of contexts all day; AIS targets add a bounded long tail.
+_CONTEXT_CACHE_SIZE = 256
+# Large vessels publish a few thousand distinct paths; verdicts beyond that are recomputed.
+_PATH_CACHE_SIZE = 4096
+_CONTEXT_PREFIX = '{"context":"'
+# Byte accounting groups for frames that carry no path of ours, and for other vessels.
+UNATTRIBUTED_GROUP = "other"
+TARGETS_GROUP = "targets"
+# Verdict caches are shared by the event loop and the decode worker (decode_frames).
+_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class DecodedDelta:
+    """Everything the coordinator needs from one delta, collected in a single walk."""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
+    timestamps: dict[str, str] = field(default_factory=dict)
+    notifications: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class DecodedBatch:
+    """Several frames decoded and merged; later frames win for each path."""
+
+    frames: int = 0
+    # Frame length in characters; Signal K text frames are ASCII JSON, so this tracks bytes.
+    size: int = 0
+    parse_errors: int = 0
+    values: dict[str, Any] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
+    timestamps: dict[str, str] = field(default_factory=dict)
+    # Receive time (epoch seconds) of the frame that supplied each merged value.
+    received: dict[str, float] = field(default_factory=dict)
+    notifications: list[dict[str, Any]] = field(default_factory=list)
+    # Every value path and source label in arrival order, before merging, for rate tables.
+    value_paths: list[str] = field(default_factory=list)
+    source_labels: list[str] = field(default_factory=list)
+    first_received: float | None = None
+    decoded_at: float = 0.0
+    # Values overwritten by a later frame in the same batch, and frames left with nothing to
+    # apply because every value and source they carried was overwritten.
+    collapsed: int = 0
+    dropped: int = 0
+    # Latest target-path values per other-vessel context, when targets are requested.
+    targets: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Payload bytes per top-level path group; each frame is split evenly over its values.
+    group_bytes: dict[str, float] = field(default_factory=dict)
+
+    def restrict(
+        self,
+        interest: PathInterest | None,
+        targets: PathInterest | None,
+        *,
+        counters: bool = True,
+    ) -> DecodedBatch:
+        """Return the part of a shared batch one subscriber asked for.
+
+        Dicts the subscriber would keep whole are shared rather than copied; callers treat
+        batches as read-only. Notifications are kept as they are. Frame, byte and collapse
+        counters describe the whole connection, so with ``counters=False`` they are zeroed
+        and only the subscriber that owns the socket counts them.
+        """
+        restricted = replace(self, targets={})
+        if not counters:
+            restricted.frames = restricted.size = restricted.parse_errors = 0
+            restricted.collapsed = restricted.dropped = 0
+            restricted.group_bytes = {}
+        if interest is not None:
+            match = interest.matches
+            restricted.values = {p: v for p, v in self.values.items() if match(p)}
+            restricted.sources = {p: s for p, s in self.sources.items() if match(p)}
+            restricted.timestamps = {p: t for p, t in self.timestamps.items() if match(p)}
+            restricted.received = {p: r for p, r in self.received.items() if match(p)}
+            restricted.value_paths = [p for p in self.value_paths if match(p)]
+        if targets is not None:
+            match = targets.matches
+            for context, values in self.targets.items():
+                target_values = {p: v for p, v in values.items() if match(p)}
+                if target_values:
+                    restricted.targets[context] = target_values
+        return restricted
+
 
 def _context_matches(expected: str | None, incoming: str | None) -> bool:
     if not expected:
@@ -27,141 +115,455 @@ def _context_matches(expected: str | None, incoming: str | None) -> bool:
     return False
 
 
-def extract_values(
-    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
-) -> dict[str, Any]:
-    if not isinstance(delta_obj, dict):
-        return {}
+class ContextMatcher:
+    """Compiled vessel-context filter with a bounded verdict cache.
 
-    # Drop deltas from other vessels to keep the cache strictly per entry.
-    if expected_contexts and "context" in delta_obj:
-        incoming = delta_obj.get("context")
-        if not any(_context_matches(expected, incoming) for expected in expected_contexts):
-            return {}
+    Build one per connection; each distinct incoming context is evaluated once and then
+    resolved with a single dict lookup. ``self_urn_fallback`` accepts any ``vessels.urn:``
+    context for ``vessels.self``; it is only for when the vessel id is unknown, since it
+    would also accept other vessels.
+    """
 
-    updates = delta_obj.get("updates")
-    if not isinstance(updates, list):
-        return {}
+    def __init__(
+        self,
+        expected_contexts: Iterable[str] | None,
+        *,
+        cache_size: int = _CONTEXT_CACHE_SIZE,
+        self_urn_fallback: bool = True,
+    ) -> None:
+        self._expected = tuple(expected_contexts or ())
+        self._cache: dict[str, bool] = {}
+        self._cache_size = max(1, cache_size)
+        # Compile the _context_matches cascade into set/tuple checks evaluated once per miss.
+        self._match_all = not self._expected or any(not expected for expected in self._expected)
+        exact: set[str] = set()
+        prefixes: list[str] = []
+        suffixes: list[str] = []
+        fragments: list[str] = []
+        for expected in self._expected:
+            exact.add(expected)
+            if expected.endswith(".*"):
+                prefixes.append(expected[:-1])
+            if expected.startswith("mmsi:"):
+                mmsi = expected.split(":", 1)[1]
+                if mmsi:
+                    fragments.append(mmsi)
+            if expected.startswith(("urn:", "mrn:")):
+                suffixes.append(expected)
+                exact.add(f"vessels.{expected}")
+            if expected == "vessels.self" and self_urn_fallback:
+                prefixes.append("vessels.urn:")
+        self._exact = frozenset(exact)
+        self._prefixes = tuple(prefixes)
+        self._suffixes = tuple(suffixes)
+        self._fragments = tuple(fragments)
 
-    changed: dict[str, Any] = {}
-    for update in updates:
-        if not isinstance(update, dict):
-            continue
-        values = update.get("values")
-        if not isinstance(values, list):
-            continue
-        for value in values:
-            if not isinstance(value, dict):
-                continue
-            path = value.get("path")
-            if not isinstance(path, str):
-                continue
-            if "value" not in value:
-                continue
-            changed[path] = value.get("value")
+    @property
+    def expected_contexts(self) -> tuple[str, ...]:
+        return self._expected
 
-    return changed
+    @property
+    def cache_size(self) -> int:
+        return len(self._cache)
 
+    def matches(self, incoming: Any) -> bool:
+        if self._match_all or not incoming:
+            return True
+        if not isinstance(incoming, str):
+            return False
+        verdict = self._cache.get(incoming)
+        if verdict is not None:
+            return verdict
+        verdict = (
+            incoming in self._exact
+            or incoming.startswith(self._prefixes)
+            or incoming.endswith(self._suffixes)
+            or any(fragment in incoming for fragment in self._fragments)
+        )
+        _remember(self._cache, self._cache_size, incoming, verdict)
+        return verdict
 
-def extract_sources(
-    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
-) -> dict[str, str]:
-    if not isinstance(delta_obj, dict):
-        return {}
 
-    if expected_contexts and "context" in delta_obj:
-        incoming = delta_obj.get("context")
-        if not any(_context_matches(expected, incoming) for expected in expected_contexts):
-            return {}
+def peek_context(text: str) -> str | None:
+    """Return the context of a serialized delta without decoding it, when cheaply possible.
 
-    updates = delta_obj.get("updates")
-    if not isinstance(updates, list):
-        return {}
+    Signal K servers serialize ``context`` first; anything else falls back to a full decode.
+    """
+    if not text.startswith(_CONTEXT_PREFIX):
+        return None
+    start = len(_CONTEXT_PREFIX)
+    end = text.find('"', start)
+    if end < 0:
+        return None
+    context = text[start:end]
+    if "\\" in context:
+        return None
+    return context
 
-    sources: dict[str, str] = {}
-    for update in updates:
-        if not isinstance(update, dict):
-            continue
-        update_source = update.get("$source")
-        if not isinstance(update_source, str):
-            update_source = None
-        values = update.get("values")
-        if not isinstance(values, list):
-            continue
-        for value in values:
-            if not isinstance(value, dict):
-                continue
-            path = value.get("path")
-            if not isinstance(path, str):
-                continue
-            value_source = value.get("$source")
-            source = value_source if isinstance(value_source, str) else update_source
-            if source is None:
-                continue
-            sources[path] = source
 
-    return sources
+class _TrieNode:
+    __slots__ = ("children", "any_segment", "terminal", "any_tail")
 
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.any_segment: _TrieNode | None = None
+        self.terminal = False
+        self.any_tail = False
 
-def extract_notifications(
-    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
-) -> list[dict[str, Any]]:
+
+class PathInterest:
+    """Set of subscribed path patterns, compiled into an exact set plus a segment trie.
+
+    A ``*`` segment matches exactly one segment, and a trailing ``*`` matches one or more
+    remaining segments (``navigation.*``). Verdicts are memoized in a bounded cache.
+    """
+
+    def __init__(self, patterns: Iterable[str], *, cache_size: int = _PATH_CACHE_SIZE) -> None:
+        self._patterns = tuple(sorted({pattern for pattern in patterns if pattern}))
+        self._exact = frozenset(pattern for pattern in self._patterns if "*" not in pattern)
+        self._root = _TrieNode()
+        self._has_wildcards = False
+        self._cache: dict[str, bool] = {}
+        self._cache_size = max(1, cache_size)
+        for pattern in self._patterns:
+            if "*" in pattern:
+                self._has_wildcards = True
+                self._insert(pattern.split("."))
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        return self._patterns
+
+    def matches(self, path: str) -> bool:
+        if path in self._exact:
+            return True
+        if not self._has_wildcards:
+            return False
+        verdict = self._cache.get(path)
+        if verdict is None:
+            verdict = self._walk(self._root, path.split("."), 0)
+            _remember(self._cache, self._cache_size, path, verdict)
+        return verdict
+
+    def _insert(self, segments: list[str]) -> None:
+        node = self._root
+        last = len(segments) - 1
+        for index, segment in enumerate(segments):
+            if segment == "*" and index == last:
+                node.any_tail = True
+                return
+            if segment == "*":
+                if node.any_segment is None:
+                    node.any_segment = _TrieNode()
+                node = node.any_segment
+            else:
+                node = node.children.setdefault(segment, _TrieNode())
+        node.terminal = True
+
+    def _walk(self, node: _TrieNode, segments: list[str], index: int) -> bool:
+        if index == len(segments):
+            return node.terminal
+        if node.any_tail:
+            return True
+        child = node.children.get(segments[index])
+        if child is not None and self._walk(child, segments, index + 1):
+            return True
+        if node.any_segment is not None:
+            return self._walk(node.any_segment, segments, index + 1)
+        return False
+
+
+def _remember(cache: dict[str, bool], size: int, key: str, verdict: bool) -> None:
+    # Lookups are plain dict reads; only eviction plus insert must not interleave.
+    with _CACHE_LOCK:
+        if len(cache) >= size:
+            # Dicts keep insertion order, so this evicts the oldest verdict.
+            cache.pop(next(iter(cache), None), None)
+        cache[key] = verdict
+
+
+def decode_delta(
+    delta_obj: dict[str, Any],
+    expected_contexts: ContextMatcher | Iterable[str] | None,
+    interest: PathInterest | None = None,
+) -> DecodedDelta:
+    """Walk a delta once and split it into values, sources, timestamps and notifications.
+
+    Notification paths never land in ``values``/``sources``/``timestamps``; they carry their
+    own source and timestamp so the event pipeline stays independent of the sensor cache.
+    When ``interest`` is given, other paths outside it are skipped before anything is built.
+    """
+    if DeltaFrame is not None and isinstance(delta_obj, DeltaFrame):
+        return _decode_frame(delta_obj, expected_contexts, interest)  # pragma: no cover
     if not isinstance(delta_obj, dict):
-        return []
+        return DecodedDelta()
 
-    if expected_contexts and "context" in delta_obj:
-        incoming = delta_obj.get("context")
-        if not any(_context_matches(expected, incoming) for expected in expected_contexts):
-            return []
+    # Drop deltas from other vessels to keep the cache strictly per entry.
+    if "context" in delta_obj and not _context_accepted(
+        expected_contexts, delta_obj.get("context")
+    ):
+        return DecodedDelta()
 
     updates = delta_obj.get("updates")
     if not isinstance(updates, list):
-        return []
+        return DecodedDelta()
 
+    values: dict[str, Any] = {}
+    sources: dict[str, str] = {}
+    timestamps: dict[str, str] = {}
     notifications: list[dict[str, Any]] = []
     for update in updates:
         if not isinstance(update, dict):
             continue
+        entries = update.get("values")
+        if not isinstance(entries, list):
+            continue
         update_source = update.get("$source")
         if not isinstance(update_source, str):
             update_source = None
         update_timestamp = update.get("timestamp")
         if not isinstance(update_timestamp, str):
             update_timestamp = None
-        values = update.get("values")
-        if not isinstance(values, list):
-            continue
-        for value in values:
-            if not isinstance(value, dict):
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            path = entry.get("path")
+            if not isinstance(path, str):
+                continue
+            is_notification = path.startswith("notifications.")
+            if not is_notification and interest is not None and not interest.matches(path):
                 continue
-            path = value.get("path")
-            if not isinstance(path, str) or not path.startswith("notifications."):
+            source = entry.get("$source")
+            if not isinstance(source, str):
+                source = update_source
+            timestamp = entry.get("timestamp")
+            if not isinstance(timestamp, str):
+                timestamp = update_timestamp
+            has_value = "value" in entry
+            if is_notification:
+                if not has_value:
+                    continue
+                notification: dict[str, Any] = {"path": path, "value": entry["value"]}
+                if source is not None:
+                    notification["source"] = source
+                if timestamp is not None:
+                    notification["timestamp"] = timestamp
+                notifications.append(notification)
                 continue
-            if "value" not in value:
+            # Sources are tracked even for value-less entries so attribution stays current.
+            if source is not None:
+                sources[path] = source
+            if not has_value:
                 continue
-            entry: dict[str, Any] = {"path": path, "value": value.get("value")}
-            value_source = value.get("$source")
-            if isinstance(value_source, str):
-                entry["source"] = value_source
-            elif update_source is not None:
-                entry["source"] = update_source
-            value_timestamp = value.get("timestamp")
-            if isinstance(value_timestamp, str):
-                entry["timestamp"] = value_timestamp
-            elif update_timestamp is not None:
-                entry["timestamp"] = update_timestamp
-            notifications.append(entry)
-
-    return notifications
+            values[path] = entry["value"]
+            if timestamp is not None:
+                timestamps[path] = timestamp
+
+    return DecodedDelta(
+        values=values, sources=sources, timestamps=timestamps, notifications=notifications
+    )
+
+
+def _decode_frame(
+    frame: Any,
+    expected_contexts: ContextMatcher | Iterable[str] | None,
+    interest: PathInterest | None,
+) -> DecodedDelta:  # pragma: no cover - msgspec only
+    # Same walk as decode_delta, but over msgspec structs whose types are already validated.
+    if not _context_accepted(expected_contexts, frame.context):
+        return DecodedDelta()
+
+    values: dict[str, Any] = {}
+    sources: dict[str, str] = {}
+    timestamps: dict[str, str] = {}
+    notifications: list[dict[str, Any]] = []
+    for update in frame.updates:
+        update_source = update.source
+        update_timestamp = update.timestamp
+        for entry in update.values:
+            path = entry.path
+            is_notification = path.startswith("notifications.")
+            if not is_notification and interest is not None and not interest.matches(path):
+                continue
+            source = entry.source if entry.source is not None else update_source
+            timestamp = entry.timestamp if entry.timestamp is not None else update_timestamp
+            has_value = entry.value is not UNSET
+            if is_notification:
+                if not has_value:
+                    continue
+                notification: dict[str, Any] = {"path": path, "value": entry.value}
+                if source is not None:
+                    notification["source"] = source
+                if timestamp is not None:
+                    notification["timestamp"] = timestamp
+                notifications.append(notification)
+                continue
+            if source is not None:
+                sources[path] = source
+            if not has_value:
+                continue
+            values[path] = entry.value
+            if timestamp is not None:
+                timestamps[path] = timestamp
+
+    return DecodedDelta(
+        values=values, sources=sources, timestamps=timestamps, notifications=notifications
+    )
+
+
+def _context_accepted(
+    expected_contexts: ContextMatcher | Iterable[str] | None, incoming: Any
+) -> bool:
+    if not expected_contexts:
+        return True
+    if isinstance(expected_contexts, ContextMatcher):
+        return expected_contexts.matches(incoming)
+    return any(_context_matches(expected, incoming) for expected in expected_contexts)
+
+
+def _delta_context(delta_obj: Any) -> str | None:
+    if isinstance(delta_obj, dict):
+        context = delta_obj.get("context")
+    else:
+        context = getattr(delta_obj, "context", None)
+    return context if isinstance(context, str) and context else None
+
+
+def decode_frames(
+    frames: Iterable[tuple[str, float]],
+    expected_contexts: ContextMatcher | Iterable[str] | None,
+    interest: PathInterest | None = None,
+    targets: PathInterest | None = None,
+) -> DecodedBatch:
+    """Decode raw ``(text, received_at)`` frames in order and merge them into one batch.
+
+    Pure and self-contained so it can run in a worker thread; the caller applies the batch
+    on the event loop. Values collapse to the latest per path, but notifications are kept in
+    full since each one is an event. With ``targets``, other vessels' values on those paths
+    are collected per context instead of being dropped.
+    """
+    batch = DecodedBatch()
+    values = batch.values
+    group_bytes = batch.group_bytes
+    # Index of the frame that supplied each merged value/source, to count superseded frames.
+    value_owner: dict[str, int] = {}
+    source_owner: dict[str, int] = {}
+    notifying: set[int] = set()
+    contributing = 0
+    for index, (text, received) in enumerate(frames):
+        size = len(text)
+        batch.frames += 1
+        batch.size += size
+        incoming = peek_context(text)
+        foreign = incoming is not None and not _context_accepted(expected_contexts, incoming)
+        if foreign and targets is None:
+            # Other vessels' deltas (AIS) are rejected before paying for a JSON decode.
+            _add_bytes(group_bytes, UNATTRIBUTED_GROUP, size)
+            continue
+        try:
+            obj = loads_delta(text)
+        except JSONDecodeError:
+            batch.parse_errors += 1
+            _add_bytes(group_bytes, UNATTRIBUTED_GROUP, size)
+            continue
+        if batch.first_received is None:
+            batch.first_received = received
+        if targets is not None and incoming is None:
+            incoming = _delta_context(obj)
+            foreign = incoming is not None and not _context_accepted(expected_contexts, incoming)
+        if foreign:
+            # Other vessels only contribute target paths; their notifications are not ours.
+            target_values = decode_delta(obj, None, targets).values
+            if target_values:
+                batch.targets.setdefault(incoming, {}).update(target_values)
+            _add_bytes(group_bytes, TARGETS_GROUP, size)
+            continue
+        decoded = decode_delta(obj, expected_contexts, interest)
+        _split_bytes(group_bytes, decoded, size)
+        if decoded.values or decoded.sources or decoded.notifications:
+            contributing += 1
+        if decoded.notifications:
+            batch.notifications.extend(decoded.notifications)
+            notifying.add(index)
+        if decoded.sources:
+            batch.sources.update(decoded.sources)
+            batch.source_labels.extend(decoded.sources.values())
+            source_owner.update(dict.fromkeys(decoded.sources, index))
+        if decoded.values:
+            if values:
+                batch.collapsed += len(values.keys() & decoded.values.keys())
+            values.update(decoded.values)
+            timestamps = batch.timestamps
+            if timestamps:
+                # A value without a timestamp must not inherit the one it superseded.
+                for path in decoded.values.keys() - decoded.timestamps.keys():
+                    timestamps.pop(path, None)
+            timestamps.update(decoded.timestamps)
+            batch.received.update(dict.fromkeys(decoded.values, received))
+            batch.value_paths.extend(decoded.values)
+            value_owner.update(dict.fromkeys(decoded.values, index))
+    if contributing > 1:
+        surviving = set(value_owner.values())
+        surviving.update(source_owner.values())
+        surviving.update(notifying)
+        batch.dropped = contributing - len(surviving)
+    batch.decoded_at = time.time()
+    return batch
+
+
+def _add_bytes(group_bytes: dict[str, float], group: str, size: float) -> None:
+    group_bytes[group] = group_bytes.get(group, 0.0) + size
+
+
+def _split_bytes(group_bytes: dict[str, float], decoded: DecodedDelta, size: int) -> None:
+    counts: dict[str, int] = {}
+    for path in decoded.values:
+        group = path.partition(".")[0]
+        counts[group] = counts.get(group, 0) + 1
+    if decoded.notifications:
+        counts["notifications"] = len(decoded.notifications)
+    if not counts:
+        _add_bytes(group_bytes, UNATTRIBUTED_GROUP, size)
+        return
+    if len(counts) == 1:
+        _add_bytes(group_bytes, next(iter(counts)), size)
+        return
+    total = sum(counts.values())
+    for group, count in counts.items():
+        _add_bytes(group_bytes, group, size * count / total)
+
+
+def extract_values(
+    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
+) -> dict[str, Any]:
+    decoded = decode_delta(delta_obj, expected_contexts)
+    changed = dict(decoded.values)
+    for notification in decoded.notifications:
+        changed[notification["path"]] = notification["value"]
+    return changed
+
+
+def extract_sources(
+    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
+) -> dict[str, str]:
+    decoded = decode_delta(delta_obj, expected_contexts)
+    sources = dict(decoded.sources)
+    for notification in decoded.notifications:
+        if "source" in notification:
+            sources[notification["path"]] = notification["source"]
+    return sources
+
+
+def extract_notifications(
+    delta_obj: dict[str, Any], expected_contexts: Iterable[str] | None
+) -> list[dict[str, Any]]:
+    return decode_delta(delta_obj, expected_contexts).notifications
 
 
 def parse_delta_text(text: str, expected_contexts: Iterable[str] | None) -> dict[str, Any]:
     try:
-        obj = json.loads(text)
-    except json.JSONDecodeError:
-        return {}
-
-    if not isinstance(obj, dict):
+        obj = loads_delta(text)
+    except JSONDecodeError:
         return {}
 
     return extract_values(obj, expected_contexts)
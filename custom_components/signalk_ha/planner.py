@@ -0,0 +1,132 @@
+"""Per-path subscription plans derived from how Home Assistant consumes each path."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from .const import (
+    DEFAULT_MAX_IDLE_WRITE_SECONDS,
+    DEFAULT_MIN_UPDATE_MS,
+    DEFAULT_PERIOD_MS,
+    DEFAULT_POLICY,
+    DEFAULT_STALE_SECONDS,
+)
+from .subscription import MIN_PERIOD_FLOOR_MS, build_subscribe_payload
+
+if TYPE_CHECKING:
+    from .discovery import DiscoveredEntity
+
+POLICY_INSTANT = "instant"
+POLICY_FIXED = "fixed"
+# Longest keepalive worth asking for: entities need a message before they go stale, and the
+# idle refresh only writes when one arrives.
+MAX_PERIOD_MS = int(min(DEFAULT_MAX_IDLE_WRITE_SECONDS, DEFAULT_STALE_SECONDS / 2) * 1000)
+
+_MS_PER_HOUR = 3_600_000
+
+
+@dataclass(frozen=True)
+class SubscriptionPlan:
+    """What to ask the server for one path: keepalive `period`, rate cap `min_period`, policy.
+
+    None leaves the value to `build_subscribe_payload`, which is what a bare period always got.
+    """
+
+    period: int | None = None
+    min_period: int | None = None
+    policy: str = DEFAULT_POLICY
+
+    def as_subscription(self, path: str) -> dict[str, Any]:
+        return {
+            "path": path,
+            "period": self.period,
+            "minPeriod": self.min_period,
+            "policy": self.policy,
+        }
+
+
+# Notifications are state changes, not samples: resending unchanged ones only feeds the dedupe.
+NOTIFICATIONS_PLAN = SubscriptionPlan(period=DEFAULT_PERIOD_MS, policy=POLICY_INSTANT)
+
+
+def plan_for_entity(spec: DiscoveredEntity) -> SubscriptionPlan:
+    """Plan one entity so the server sends nothing its write throttle would discard."""
+    if spec.min_update_seconds is None:
+        throttle_ms = DEFAULT_MIN_UPDATE_MS
+    else:
+        throttle_ms = int(spec.min_update_seconds * 1000)
+    min_period = max(throttle_ms, MIN_PERIOD_FLOOR_MS)
+    # A keepalive faster than the throttle is dropped as well; past the staleness budget the
+    # entity would flap unavailable.
+    period = min(max(spec.period_ms or DEFAULT_PERIOD_MS, min_period), MAX_PERIOD_MS)
+    return SubscriptionPlan(period=period, min_period=min(min_period, period))
+
+
+def build_plans(entities: Iterable[DiscoveredEntity]) -> dict[str, SubscriptionPlan]:
+    plans: dict[str, SubscriptionPlan] = {}
+    for spec in entities:
+        plan = plan_for_entity(spec)
+        current = plans.get(spec.path)
+        plans[spec.path] = plan if current is None else merge_plans(current, plan)
+    return plans
+
+
+def merge_plans(first: SubscriptionPlan, second: SubscriptionPlan) -> SubscriptionPlan:
+    """Plan serving both consumers of a path: the faster of each limit wins."""
+    if first == second:
+        return first
+    period = min(first.period or DEFAULT_PERIOD_MS, second.period or DEFAULT_PERIOD_MS)
+    min_period = min(
+        first.min_period or min(DEFAULT_MIN_UPDATE_MS, period),
+        second.min_period or min(DEFAULT_MIN_UPDATE_MS, period),
+    )
+    # Keepalives are needed as soon as either consumer relies on them.
+    policies = {first.policy, second.policy}
+    policy = first.policy if len(policies) == 1 else DEFAULT_POLICY
+    return SubscriptionPlan(period=period, min_period=min(min_period, period), policy=policy)
+
+
+def estimate_savings(
+    planned: Mapping[str, SubscriptionPlan],
+    baseline: Mapping[str, SubscriptionPlan],
+    bytes_per_message: float | None,
+) -> dict[str, Any]:
+    """Messages per hour the server may send under each set of plans, and the difference.
+
+    "static" assumes no value ever changes (keepalives only); "busy" assumes every path changes
+    faster than its minPeriod. Real traffic falls between the two.
+    """
+    planned_rates = _messages_per_hour(planned)
+    baseline_rates = _messages_per_hour(baseline)
+    saved = {
+        regime: round(baseline_rates[regime] - planned_rates[regime], 1) for regime in planned_rates
+    }
+    policies: dict[str, int] = {}
+    for plan in planned.values():
+        policies[plan.policy] = policies.get(plan.policy, 0) + 1
+    return {
+        "paths": len(planned),
+        "policies": policies,
+        "messages_per_hour": {"baseline": baseline_rates, "planned": planned_rates},
+        "estimated_messages_saved_per_hour": saved,
+        "estimated_bytes_saved_per_hour": (
+            {regime: round(count * bytes_per_message) for regime, count in saved.items()}
+            if bytes_per_message
+            else None
+        ),
+    }
+
+
+def _messages_per_hour(plans: Mapping[str, SubscriptionPlan]) -> dict[str, float]:
+    # Sanitize through the payload builder so the estimate matches what is actually sent.
+    payload = build_subscribe_payload(
+        "vessels.self", [plan.as_subscription(path) for path, plan in plans.items()]
+    )
+    static = busy = 0.0
+    for item in payload["subscribe"]:
+        policy = item["policy"]
+        if policy != POLICY_INSTANT:
+            static += _MS_PER_HOUR / item["period"]
+        busy += _MS_PER_HOUR / (item["period"] if policy == POLICY_FIXED else item["minPeriod"])
+    return {"static": round(static, 1), "busy": round(busy, 1)}
@@ -0,0 +1,86 @@
+"""One WebSocket per Signal K server, shared by every config entry streaming from it."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .parser import PathInterest
+
+if TYPE_CHECKING:
+    from .coordinator import SignalKCoordinator
+
+_DATA_KEY = f"{DOMAIN}_streams"
+
+StreamKey = tuple[str, str, str]
+
+
+def stream_key(ws_url: str, token: str | None, vessel_id: str | None) -> StreamKey:
+    # Entries only share a socket when the server would send each of them the same deltas.
+    return (ws_url, token or "", vessel_id or "")
+
+
+class SharedStream:
+    """Coordinators attached to one server connection.
+
+    The first member owns the socket and subscribes the union of every member's paths; the
+    others follow its connection state and receive each decoded batch from it.
+    """
+
+    def __init__(self, key: StreamKey) -> None:
+        self.key = key
+        self.members: list[SignalKCoordinator] = []
+        # Merged filters the owner decodes with while more than one member is attached.
+        self.interest: PathInterest | None = None
+        self.targets: PathInterest | None = None
+
+    @property
+    def owner(self) -> SignalKCoordinator | None:
+        return self.members[0] if self.members else None
+
+    @property
+    def followers(self) -> list[SignalKCoordinator]:
+        return self.members[1:]
+
+    @property
+    def shared(self) -> bool:
+        return len(self.members) > 1
+
+
+def join_stream(hass: HomeAssistant, key: StreamKey, member: SignalKCoordinator) -> SharedStream:
+    streams: dict[StreamKey, SharedStream] = hass.data.setdefault(_DATA_KEY, {})
+    stream = streams.get(key)
+    if stream is None:
+        stream = streams[key] = SharedStream(key)
+    if member not in stream.members:
+        stream.members.append(member)
+    return stream
+
+
+def leave_stream(hass: HomeAssistant, stream: SharedStream, member: SignalKCoordinator) -> None:
+    if member in stream.members:
+        stream.members.remove(member)
+    if not stream.members:
+        streams: dict[StreamKey, SharedStream] = hass.data.get(_DATA_KEY, {})
+        if streams.get(stream.key) is stream:
+            del streams[stream.key]
+
+
+def merge_interests(interests: Iterable[PathInterest | None]) -> PathInterest | None:
+    """Union of path filters; a member without a filter accepts every path, so does the union."""
+    patterns: list[str] = []
+    for interest in interests:
+        if interest is None:
+            return None
+        patterns.extend(interest.patterns)
+    return PathInterest(patterns)
+
+
+def merge_targets(targets: Iterable[PathInterest | None]) -> PathInterest | None:
+    """Union of target (AIS) path filters; None when no member tracks targets."""
+    patterns = [
+        pattern for interest in targets if interest is not None for pattern in interest.patterns
+    ]
+    return PathInterest(patterns) if patterns else None
@@ -0,0 +1,133 @@
+"""Sliding-window rate counters for ingest health metrics."""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Iterable
+
+# Window lengths (seconds) reported for every counter, keyed by their diagnostics label.
+RATE_WINDOWS: dict[str, int] = {"1m": 60, "15m": 900, "1h": 3600}
+_KEYED_MINUTES = 15
+
+
+class SlidingRate:
+    """Count events in one-second buckets and report rates over several trailing windows.
+
+    The ring covers the longest window and each window keeps a running sum, so recording is
+    O(1) and reading is O(1) apart from retiring the seconds that elapsed since the last call.
+    """
+
+    def __init__(self, windows: Iterable[int] = RATE_WINDOWS.values()) -> None:
+        self._windows = tuple(windows)
+        self._horizon = max(self._windows)
+        self._buckets = [0] * self._horizon
+        self._sums = [0] * len(self._windows)
+        self._second: int | None = None
+        self._started: int | None = None
+
+    def add(self, now: float, amount: int = 1) -> None:
+        second = int(now)
+        self._advance(second)
+        self._buckets[second % self._horizon] += amount
+        sums = self._sums
+        for index in range(len(sums)):
+            sums[index] += amount
+
+    def rates(self, now: float) -> tuple[float, ...]:
+        """Events per second over each window, scaled to uptime while a window is filling."""
+        second = int(now)
+        self._advance(second)
+        if self._started is None:
+            return tuple(0.0 for _ in self._windows)
+        covered = second - self._started + 1
+        return tuple(
+            total / min(window, covered) for total, window in zip(self._sums, self._windows)
+        )
+
+    def _advance(self, second: int) -> None:
+        current = self._second
+        if current is None:
+            self._second = self._started = second
+            return
+        if second <= current:
+            return
+        self._second = second
+        buckets = self._buckets
+        horizon = self._horizon
+        if second - current >= horizon:
+            # Idle for longer than the longest window; nothing is left to retire one by one.
+            buckets[:] = [0] * horizon
+            self._sums = [0] * len(self._windows)
+            return
+        sums = self._sums
+        for step in range(current + 1, second + 1):
+            for index, window in enumerate(self._windows):
+                expired = step - window
+                if expired >= 0:
+                    sums[index] -= buckets[expired % horizon]
+            buckets[step % horizon] = 0
+
+
+class KeyedRates:
+    """Per-key counts over the last few minutes, used for the chattiest-path tables.
+
+    Recording touches one dict entry; minute rollovers fold the finished minute into running
+    totals so a top-N query only has to merge the current minute.
+    """
+
+    def __init__(self, minutes: int = _KEYED_MINUTES) -> None:
+        self._minutes = minutes
+        self._current: dict[str, int] = {}
+        self._history: deque[dict[str, int]] = deque()
+        self._totals: dict[str, int] = {}
+        self._minute: int | None = None
+        self._started_at: float | None = None
+
+    def record(self, now: float, keys: Iterable[str]) -> None:
+        if self._started_at is None:
+            self._started_at = now
+        self._advance(int(now // 60))
+        current = self._current
+        for key in keys:
+            current[key] = current.get(key, 0) + 1
+
+    def top(self, now: float, limit: int) -> list[tuple[str, float]]:
+        """Return up to `limit` keys with the highest per-minute rate, busiest first."""
+        if self._started_at is None:
+            return []
+        self._advance(int(now // 60))
+        merged = dict(self._totals)
+        for key, count in self._current.items():
+            merged[key] = merged.get(key, 0) + count
+        # Retained minutes plus the running one; early on, only the time seen so far.
+        span = min(now - self._started_at, self._minutes * 60 + now % 60)
+        minutes = max(span, 1.0) / 60.0
+        busiest = heapq.nlargest(limit, merged.items(), key=lambda item: item[1])
+        return [(key, round(count / minutes, 2)) for key, count in busiest]
+
+    def _advance(self, minute: int) -> None:
+        current = self._minute
+        if current is None:
+            self._minute = minute
+            return
+        if minute <= current:
+            return
+        self._minute = minute
+        self._fold(self._current)
+        self._current = {}
+        for _ in range(min(minute - current - 1, self._minutes)):
+            self._fold({})
+
+    def _fold(self, finished: dict[str, int]) -> None:
+        totals = self._totals
+        self._history.append(finished)
+        for key, count in finished.items():
+            totals[key] = totals.get(key, 0) + count
+        if len(self._history) > self._minutes:
+            for key, count in self._history.popleft().items():
+                remaining = totals[key] - count
+                if remaining:
+                    totals[key] = remaining
+                else:
+                    del totals[key]
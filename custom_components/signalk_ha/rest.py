@@ -10,6 +10,7 @@ import async_timeout
 from aiohttp import ClientSession
 
 from .auth import AuthRequired, build_auth_headers, build_ssl_param
+from .codec import loads
 
 
 @dataclass(frozen=True)
@@ -59,7 +60,7 @@ async def async_fetch_discovery(
             if resp.status in (401, 403):
                 raise AuthRequired("Authentication required")
             resp.raise_for_status()
-            data = await resp.json()
+            data = await resp.json(loads=loads)
             if not isinstance(data, dict):
                 raise ValueError("Discovery did not return an object")
             return parse_discovery(data)
@@ -131,7 +132,7 @@ async def async_fetch_vessel_self(
             if resp.status in (401, 403):
                 raise AuthRequired("Authentication required")
             resp.raise_for_status()
-            data = await resp.json()
+            data = await resp.json(loads=loads)
             if not isinstance(data, dict):
                 raise ValueError("vessels/self did not return an object")
             return data
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -20,14 +21,23 @@ from .const import (
     DEFAULT_MIN_UPDATE_MS,
     DEFAULT_STALE_SECONDS,
     HEALTH_SENSOR_CONNECTION_STATE,
+    HEALTH_SENSOR_DATA_RATE,
+    HEALTH_SENSOR_END_TO_END_LATENCY,
+    HEALTH_SENSOR_FRAME_INTERVAL,
     HEALTH_SENSOR_LAST_ERROR,
     HEALTH_SENSOR_LAST_MESSAGE,
     HEALTH_SENSOR_LAST_NOTIFICATION,
+    HEALTH_SENSOR_LINK_JITTER,
+    HEALTH_SENSOR_LINK_RTT,
     HEALTH_SENSOR_MESSAGE_COUNT,
+    HEALTH_SENSOR_MESSAGE_RATE,
     HEALTH_SENSOR_MESSAGES_PER_HOUR,
     HEALTH_SENSOR_NOTIFICATION_COUNT,
+    HEALTH_SENSOR_NOTIFICATION_RATE,
     HEALTH_SENSOR_NOTIFICATIONS_PER_HOUR,
+    HEALTH_SENSOR_PAYLOAD_BYTES,
     HEALTH_SENSOR_RECONNECT_COUNT,
+    HEALTH_SENSOR_VALUE_RATE,
 )
 from .coordinator import SignalKCoordinator, SignalKDiscoveryCoordinator
 from .device_info import build_device_info
@@ -124,6 +134,92 @@ async def async_setup_entry(
             enabled_default=False,
             suggested_display_precision=2,
         ),
+        HealthSpec(
+            HEALTH_SENSOR_MESSAGE_RATE,
+            "Message Rate",
+            _windowed_rate("messages", 60.0),
+            attributes_fn=_windowed_rate_attributes("messages", 60.0),
+            unit="1/min",
+            enabled_default=False,
+            suggested_display_precision=1,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_VALUE_RATE,
+            "Value Rate",
+            _windowed_rate("values", 60.0),
+            attributes_fn=_value_rate_attributes,
+            unit="1/min",
+            enabled_default=False,
+            suggested_display_precision=1,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_NOTIFICATION_RATE,
+            "Notification Rate",
+            _windowed_rate("notifications", 60.0),
+            attributes_fn=_windowed_rate_attributes("notifications", 60.0),
+            unit="1/min",
+            enabled_default=False,
+            suggested_display_precision=1,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_DATA_RATE,
+            "Data Rate",
+            _windowed_rate("bytes", 1.0),
+            device_class=SensorDeviceClass.DATA_RATE,
+            attributes_fn=_windowed_rate_attributes("bytes", 1.0),
+            unit="B/s",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_END_TO_END_LATENCY,
+            "End-to-End Latency",
+            _end_to_end_latency,
+            device_class=SensorDeviceClass.DURATION,
+            attributes_fn=_latency_attributes,
+            unit="ms",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_LINK_RTT,
+            "Link RTT",
+            _link_estimate("rtt", "mean_ms"),
+            device_class=SensorDeviceClass.DURATION,
+            attributes_fn=_link_attributes,
+            unit="ms",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_LINK_JITTER,
+            "Link Jitter",
+            _link_estimate("rtt", "jitter_ms"),
+            device_class=SensorDeviceClass.DURATION,
+            unit="ms",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_FRAME_INTERVAL,
+            "Frame Interval",
+            _link_estimate("frame_interval", "mean_ms"),
+            device_class=SensorDeviceClass.DURATION,
+            attributes_fn=_frame_interval_attributes,
+            unit="ms",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
+        HealthSpec(
+            HEALTH_SENSOR_PAYLOAD_BYTES,
+            "Payload Received",
+            lambda coord: coord.transfer["payload_bytes"],
+            device_class=SensorDeviceClass.DATA_SIZE,
+            attributes_fn=_transfer_attributes,
+            unit="B",
+            enabled_default=False,
+            suggested_display_precision=0,
+        ),
     ]
 
     for spec in health_specs:
@@ -179,14 +275,23 @@ class SignalKBaseSensor(CoordinatorEntity, SensorEntity):
         coordinator: SignalKCoordinator,
         discovery: SignalKDiscoveryCoordinator | None,
         entry: ConfigEntry,
+        path: str | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        # A path context makes the coordinator wake this entity only when that path changes.
+        super().__init__(coordinator, context=path)
         self._entry = entry
         self._discovery = discovery
         self._attr_device_info = build_device_info(entry)
         self._last_native_value: Any = None
         self._last_write: float | None = None
         self._last_available: bool | None = None
+        self._recheck_handle: asyncio.TimerHandle | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        if self._recheck_handle is not None:
+            self._recheck_handle.cancel()
+            self._recheck_handle = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -198,6 +303,24 @@ class SignalKBaseSensor(CoordinatorEntity, SensorEntity):
             self._last_write = time.monotonic()
             self._record_write()
             self.async_write_ha_state()
+            if self.coordinator_context is not None:
+                self.coordinator.record_state_write(self.coordinator_context)
+        else:
+            self._schedule_throttle_recheck()
+
+    def _schedule_throttle_recheck(self) -> None:
+        # Path-bound entities are only woken by their own path, so a value skipped by the
+        # write throttle would wait for the next delta; look again when the window closes.
+        if self._recheck_handle is not None or self._last_write is None or self.hass is None:
+            return
+        remaining = self._last_write + self._min_update_seconds() - time.monotonic()
+        if remaining > 0:
+            self._recheck_handle = self.hass.loop.call_later(remaining, self._throttle_recheck)
+
+    @callback
+    def _throttle_recheck(self) -> None:
+        self._recheck_handle = None
+        self._handle_coordinator_update()
 
     def _should_write_state(self, value: Any, available: bool) -> bool:
         if self._last_write is None:
@@ -251,7 +374,7 @@ class SignalKSensor(SignalKBaseSensor):
         entry: ConfigEntry,
         spec: DiscoveredEntity,
     ) -> None:
-        super().__init__(coordinator, discovery, entry)
+        super().__init__(coordinator, discovery, entry, spec.path)
         self._spec = spec
         self._attr_name = spec.name
         self._attr_unique_id = f"signalk:{entry.entry_id}:{spec.path}"
@@ -267,7 +390,8 @@ class SignalKSensor(SignalKBaseSensor):
 
     @property
     def available(self) -> bool:
-        if not self.coordinator.is_connected:
+        # Restored snapshot values are shown until the first connection, while fresh.
+        if not self.coordinator.is_connected and not self.coordinator.warm_start:
             return False
         if not _path_available(self._spec.path, self._discovery):
             return False
@@ -294,7 +418,7 @@ class SignalKSensor(SignalKBaseSensor):
         }
         if self._spec.description:
             attrs["description"] = self._spec.description
-        source = self.coordinator.last_source_by_path.get(self._spec.path)
+        source = self.coordinator.last_source_for(self._spec.path)
         if source:
             attrs["source"] = source
         if self._spec.tolerance is not None:
@@ -325,7 +449,7 @@ class SignalKSensor(SignalKBaseSensor):
             self._last_seen_at = last_seen
 
     def _current_seen_at(self) -> dt_util.dt | None:
-        return self.coordinator.last_update_by_path.get(self._spec.path)
+        return self.coordinator.last_update_for(self._spec.path)
 
 
 class SignalKHealthSensor(SignalKBaseSensor):
@@ -397,14 +521,14 @@ class _SignalKDiscoveryListener:
 
 
 def _last_seen(path: str, coordinator: SignalKCoordinator) -> str | None:
-    timestamp = coordinator.last_update_by_path.get(path)
+    timestamp = coordinator.last_update_for(path)
     if not timestamp:
         return None
     return dt_util.as_utc(timestamp).isoformat()
 
 
 def _is_stale(path: str, coordinator: SignalKCoordinator) -> bool:
-    timestamp = coordinator.last_update_by_path.get(path)
+    timestamp = coordinator.last_update_for(path)
     if not timestamp:
         return True
     age = dt_util.utcnow() - timestamp
@@ -426,3 +550,72 @@ def _last_notification_attributes(coordinator: SignalKCoordinator) -> dict[str,
     if received_at:
         attrs["received_at"] = dt_util.as_utc(received_at).isoformat()
     return attrs
+
+
+def _windowed_rate(metric: str, scale: float) -> Callable[[SignalKCoordinator], float]:
+    # State is the 1-minute window so bursts and stalls show up; scale converts from per-second.
+    def _value(coordinator: SignalKCoordinator) -> float:
+        return round(coordinator.ingest_rate(metric)["1m"] * scale, 2)
+
+    return _value
+
+
+def _windowed_rate_attributes(
+    metric: str, scale: float
+) -> Callable[[SignalKCoordinator], dict[str, Any]]:
+    def _attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+        rates = coordinator.ingest_rate(metric)
+        return {f"rate_{label}": round(rate * scale, 2) for label, rate in rates.items()}
+
+    return _attributes
+
+
+def _value_rate_attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+    attrs = _windowed_rate_attributes("values", 60.0)(coordinator)
+    attrs["top_paths"] = coordinator.top_paths()
+    attrs["top_sources"] = coordinator.top_sources()
+    return attrs
+
+
+def _end_to_end_latency(coordinator: SignalKCoordinator) -> float | None:
+    summary = coordinator.latency_summary("end_to_end")
+    return summary["p95"] if summary else None
+
+
+def _latency_attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+    latency = coordinator.latency
+    attrs: dict[str, Any] = {"groups": latency.get("end_to_end", {})}
+    for stage, groups in latency.items():
+        overall = groups.get("all") or next(iter(groups.values()))
+        attrs[f"{stage}_p95_ms"] = overall["p95"]
+    return attrs
+
+
+def _link_estimate(estimate: str, field: str) -> Callable[[SignalKCoordinator], float | None]:
+    def _value(coordinator: SignalKCoordinator) -> float | None:
+        return coordinator.link_quality[estimate][field]
+
+    return _value
+
+
+def _link_attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+    link = coordinator.link_quality
+    return {
+        "last_rtt_ms": link["rtt"]["last_ms"],
+        "samples": link["rtt"]["samples"],
+        "missed_pongs": link["missed_pongs"],
+        "inactivity_timeout_s": link["inactivity_timeout_s"],
+    }
+
+
+def _frame_interval_attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+    frames = coordinator.link_quality["frame_interval"]
+    return {"jitter_ms": frames["jitter_ms"], "last_ms": frames["last_ms"]}
+
+
+def _transfer_attributes(coordinator: SignalKCoordinator) -> dict[str, Any]:
+    transfer = coordinator.transfer
+    return {
+        "compression_window_bits": transfer["compression_window_bits"],
+        "by_group": transfer["payload_bytes_by_group"],
+    }
@@ -0,0 +1,124 @@
+"""Warm-start snapshot of the latest values, persisted across Home Assistant restarts."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Mapping
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# At most one write per interval; SD-card installs should not see a write per flush.
+SAVE_INTERVAL_SECONDS = 300.0
+
+
+def snapshot_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.snapshot"
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    await Store(hass, STORAGE_VERSION, snapshot_key(entry_id)).async_remove()
+
+
+def encode_snapshot(
+    values: Mapping[str, Any],
+    updates: Mapping[str, datetime],
+    sources: Mapping[str, str],
+) -> dict[str, Any]:
+    """Pack each path as ``[value, received_iso, source]`` to keep the file compact."""
+    paths: dict[str, list[Any]] = {}
+    for path, value in values.items():
+        received = updates.get(path)
+        if received is None:
+            continue
+        paths[path] = [value, received.isoformat(), sources.get(path)]
+    return {"paths": paths}
+
+
+def decode_snapshot(
+    data: Any, now: datetime, max_age_seconds: float
+) -> tuple[dict[str, Any], dict[str, datetime], dict[str, str]]:
+    """Unpack a stored snapshot, skipping malformed entries and values already stale."""
+    values: dict[str, Any] = {}
+    updates: dict[str, datetime] = {}
+    sources: dict[str, str] = {}
+    paths = data.get("paths") if isinstance(data, dict) else None
+    if not isinstance(paths, dict):
+        return values, updates, sources
+    for path, item in paths.items():
+        if not isinstance(item, list) or len(item) != 3:
+            continue
+        value, received_iso, source = item
+        received = dt_util.parse_datetime(received_iso) if isinstance(received_iso, str) else None
+        if received is None or received.tzinfo is None:
+            continue
+        if (now - received).total_seconds() > max_age_seconds:
+            continue
+        values[path] = value
+        updates[path] = received
+        if isinstance(source, str):
+            sources[path] = source
+    return values, updates, sources
+
+
+class SnapshotStore:
+    """Rate-limited persistence of a snapshot produced on demand.
+
+    `data_func` is only called when the store actually writes, so a busy stream costs one
+    serialization per interval no matter how many flushes request a save.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        data_func: Callable[[], dict[str, Any]],
+        *,
+        interval: float = SAVE_INTERVAL_SECONDS,
+    ) -> None:
+        self._hass = hass
+        self._key = snapshot_key(entry_id)
+        self._data_func = data_func
+        self._interval = interval
+        self._store: Store[dict[str, Any]] | None = None
+        self._pending = False
+        self._saves = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._pending
+
+    @property
+    def saves(self) -> int:
+        return self._saves
+
+    async def async_load(self) -> Any:
+        return await self._get_store().async_load()
+
+    def schedule_save(self) -> None:
+        if self._pending:
+            # Never re-arm: Store.async_delay_save restarts its timer on every call, which
+            # would postpone the write indefinitely on a continuously updating stream.
+            return
+        self._pending = True
+        self._get_store().async_delay_save(self._serialize, self._interval)
+
+    async def async_flush(self) -> None:
+        """Write a pending snapshot now, e.g. when the entry unloads."""
+        if self._pending:
+            await self._get_store().async_save(self._serialize())
+
+    def _serialize(self) -> dict[str, Any]:
+        self._pending = False
+        self._saves += 1
+        return self._data_func()
+
+    def _get_store(self) -> Store[dict[str, Any]]:
+        # Created on first use; a coordinator that never starts never touches storage.
+        if self._store is None:
+            self._store = Store(self._hass, STORAGE_VERSION, self._key, atomic_writes=True)
+        return self._store
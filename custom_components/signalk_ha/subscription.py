@@ -13,7 +13,9 @@ from .const import (
 )
 
 # Avoid requesting sub-1s updates; most servers/plugins treat this as a spam signal.
-_MIN_PERIOD_FLOOR_MS = 1000
+MIN_PERIOD_FLOOR_MS = 1000
+# Signal K subscription policies; anything else falls back to the caller's default.
+_POLICIES = frozenset({"instant", "ideal", "fixed"})
 
 
 def build_subscribe_payload(
@@ -47,13 +49,18 @@ def build_subscribe_payload(
                 # MinPeriod caps the fastest update rate the server should send.
                 "minPeriod": min_period,
                 "format": fmt,
-                "policy": policy,
+                # Per-path plans may ask for another policy than the default.
+                "policy": _sanitize_policy(raw.get("policy"), policy),
             }
         )
         seen.add(path)
     return {"context": context, "subscribe": subscribe}
 
 
+def build_unsubscribe_payload(context: str, paths: Iterable[str]) -> dict[str, Any]:
+    return {"context": context, "unsubscribe": [{"path": path} for path in paths]}
+
+
 def _sanitize_period(value: Any) -> int:
     period = _coerce_int(value, DEFAULT_PERIOD_MS)
     if period <= 0:
@@ -62,7 +69,7 @@ def _sanitize_period(value: Any) -> int:
     # Keepalive must be strictly below the staleness timeout so a healthy stream
     # does not mark entities unavailable.
     if stale_limit > 0 and period >= stale_limit:
-        period = max(stale_limit - _MIN_PERIOD_FLOOR_MS, _MIN_PERIOD_FLOOR_MS)
+        period = max(stale_limit - MIN_PERIOD_FLOOR_MS, MIN_PERIOD_FLOOR_MS)
     return period
 
 
@@ -80,6 +87,10 @@ def _sanitize_min_period(value: Any, period: int) -> int:
     return min_period
 
 
+def _sanitize_policy(value: Any, default: str) -> str:
+    return value if value in _POLICIES else default
+
+
 def _coerce_int(value: Any, default: int) -> int:
     try:
         return int(value)
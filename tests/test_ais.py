@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from custom_components.signalk_ha.ais import AisTargets, normalize_target_paths, target_mmsi
+
+_SEEN = datetime(2026, 1, 3, 22, 34, 57, tzinfo=timezone.utc)
+
+
+def _context(mmsi: int) -> str:
+    return f"vessels.urn:mrn:imo:mmsi:{mmsi}"
+
+
+def test_target_mmsi() -> None:
+    assert target_mmsi(_context(222222222)) == "222222222"
+    assert target_mmsi("vessels.urn:mrn:signalk:uuid:abc") is None
+
+
+def test_normalize_target_paths() -> None:
+    assert normalize_target_paths(
+        "navigation.position\n\nnotifications.x\nnavigation.position"
+    ) == ["navigation.position"]
+    assert normalize_target_paths(["navigation.speedOverGround", None]) == [
+        "navigation.speedOverGround"
+    ]
+    assert normalize_target_paths(42) == []
+
+
+def test_ais_targets_merge_values_per_context() -> None:
+    targets = AisTargets(4, 600.0)
+    targets.update({_context(1): {"navigation.position": {"latitude": 1.0}}}, 0.0, _SEEN)
+    targets.update({_context(1): {"navigation.speedOverGround": 3.0}}, 1.0, _SEEN)
+
+    target = targets.get(_context(1))
+    assert target is not None
+    assert target.mmsi == "1"
+    assert target.values == {
+        "navigation.position": {"latitude": 1.0},
+        "navigation.speedOverGround": 3.0,
+    }
+    assert target.last_seen == _SEEN
+    assert target.updated_at == 1.0
+
+
+def test_ais_targets_evict_least_recently_updated() -> None:
+    targets = AisTargets(2, 600.0)
+    targets.update({_context(1): {"p": 1}, _context(2): {"p": 2}}, 0.0, _SEEN)
+    targets.update({_context(1): {"p": 3}}, 1.0, _SEEN)
+
+    assert targets.update({_context(3): {"p": 4}}, 2.0, _SEEN) == [_context(2)]
+    assert len(targets) == 2
+    assert targets.get(_context(2)) is None
+    assert targets.as_dict()["lru_evictions"] == 1
+
+
+def test_ais_targets_expire_by_age() -> None:
+    targets = AisTargets(8, 60.0)
+    targets.update({_context(1): {"p": 1}}, 0.0, _SEEN)
+    targets.update({_context(2): {"p": 2}}, 30.0, _SEEN)
+
+    assert targets.expire(59.0) == []
+    assert targets.expire(61.0) == [_context(1)]
+    assert targets.as_dict() == {
+        "targets": 1,
+        "max_targets": 8,
+        "max_age_seconds": 60.0,
+        "lru_evictions": 0,
+        "age_evictions": 1,
+    }
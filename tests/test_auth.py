@@ -30,7 +30,7 @@ class _MockResponse:
         self._payload = payload
         self.headers = headers or {}
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._payload
 
     async def __aenter__(self):
@@ -0,0 +1,102 @@
+import pytest
+
+from custom_components.signalk_ha.cadence import MAX_LEARNED_PERIOD_MS, CadenceTracker
+from custom_components.signalk_ha.link import LinkQuality
+from custom_components.signalk_ha.planner import MAX_PERIOD_MS
+
+_TANK = "tanks.freshWater.0.currentLevel"
+_WIND = "environment.wind.speedApparent"
+
+
+def _feed(tracker: CadenceTracker, path: str, values: list[float], step: float) -> float:
+    previous: dict[str, float] = {}
+    now = 0.0
+    for value in values:
+        tracker.observe(now, {path: value}, previous)
+        previous[path] = value
+        now += step
+    return now - step
+
+
+def test_static_path_jumps_to_max_period_after_an_hour() -> None:
+    tracker = CadenceTracker()
+    tracker.track([_TANK, "navigation.*"])
+    now = _feed(tracker, _TANK, [0.5] * 10, step=5.0)
+
+    assert tracker.review(now, {_TANK: 5000}) is False
+    now += 3600.0
+    assert tracker.review(now, {_TANK: 5000}) is True
+    assert tracker.period_for(_TANK) == MAX_LEARNED_PERIOD_MS
+    assert tracker.as_dict(now)["raised"][_TANK]["std_dev"] == 0.0
+
+
+def test_fully_learned_keepalive_stays_within_inactivity_timeout() -> None:
+    tracker = CadenceTracker()
+    tracker.track([_TANK])
+    now = _feed(tracker, _TANK, [0.5] * 10, step=5.0)
+    for _ in range(10):
+        now += 3600.0
+        tracker.review(now, {_TANK: 5000})
+    learned = tracker.period_for(_TANK)
+    assert learned == MAX_LEARNED_PERIOD_MS < MAX_PERIOD_MS
+
+    # A bus where every path is static sends one frame per learned keepalive; the link must
+    # tolerate that silence, even a missed keepalive, instead of reconnecting.
+    keepalive = learned / 1000.0
+    link = LinkQuality()
+    for index in range(5):
+        link.frame(index * keepalive)
+    assert 2 * keepalive < link.inactivity_timeout(keepalive)
+
+
+def test_slow_path_raises_one_step_per_review_and_falls_back() -> None:
+    tracker = CadenceTracker()
+    tracker.track([_TANK])
+    # A change every two minutes, with keepalives in between.
+    values = [float(index // 24) for index in range(24 * 8)]
+    now = _feed(tracker, _TANK, values, step=5.0)
+
+    periods = []
+    for _ in range(4):
+        tracker.review(now, {_TANK: 5000})
+        periods.append(tracker.period_for(_TANK))
+    # Doubling stops once another step would exceed a quarter of the change gap.
+    assert periods == [10000, 20000, 40000, 40000]
+
+    # Changes every few seconds again: straight back to the planned period.
+    values = [float(index) for index in range(40)]
+    previous = {_TANK: 7.0}
+    for value in values:
+        now += 5.0
+        tracker.observe(now, {_TANK: value}, previous)
+        previous[_TANK] = value
+    assert tracker.review(now, {_TANK: 5000}) is True
+    assert tracker.period_for(_TANK) is None
+
+
+def test_busy_path_is_never_raised() -> None:
+    tracker = CadenceTracker()
+    tracker.track([_WIND])
+    now = _feed(tracker, _WIND, [float(index % 7) for index in range(1000)], step=1.0)
+
+    assert tracker.review(now, {_WIND: 5000}) is False
+    assert tracker.period_for(_WIND) is None
+    assert tracker.as_dict(now)["tracked_paths"] == 1
+
+
+def test_storage_round_trip_skips_downtime() -> None:
+    tracker = CadenceTracker()
+    tracker.track([_TANK])
+    now = _feed(tracker, _TANK, [0.5] * 10, step=5.0)
+    tracker.review(now + 3600.0, {_TANK: 5000})
+    stored = tracker.as_storage(now + 3600.0)
+
+    restored = CadenceTracker()
+    restored.track([_TANK, _WIND])
+    stored["paths"]["bogus"] = ["x"]
+    assert restored.restore(stored, now + 90000.0) == 1
+    assert restored.period_for(_TANK) == MAX_LEARNED_PERIOD_MS
+    # A day switched off does not count as a day without changes.
+    state = restored.as_dict(now + 90000.0)["raised"][_TANK]
+    assert state["quiet_s"] == pytest.approx(3600.0 + 45.0)
+    assert restored.restore({"paths": []}, now) == 0
@@ -0,0 +1,58 @@
+import pytest
+
+from custom_components.signalk_ha.coalesce import CoalesceWindow, has_urgent_depth
+
+
+def test_coalesce_window_starts_at_minimum() -> None:
+    window = CoalesceWindow(0.1, 2.0)
+    assert window.seconds == 0.1
+    assert window.record_flush(100.0, 0) == 0.1
+    assert window.flushes == 1
+
+
+def test_coalesce_window_grows_with_ingest_rate() -> None:
+    window = CoalesceWindow(0.1, 2.0)
+    window.record_flush(0.0, 0)
+    messages = 0
+    now = 0.0
+    for _ in range(120):
+        now += 0.5
+        messages += 200  # 400 msgs/s
+        window.record_flush(now, messages)
+
+    assert window.ingest_rate == pytest.approx(400.0, rel=0.01)
+    assert window.flush_rate == pytest.approx(2.0, rel=0.01)
+    assert window.seconds == 2.0
+
+
+def test_coalesce_window_shrinks_when_bus_goes_quiet() -> None:
+    window = CoalesceWindow(0.1, 2.0)
+    window.record_flush(0.0, 0)
+    window.record_flush(60.0, 60_000)
+    assert window.seconds == 2.0
+
+    window.record_flush(180.0, 60_010)
+    assert window.seconds == pytest.approx(0.1, abs=0.01)
+
+
+def test_coalesce_window_ignores_non_monotonic_samples() -> None:
+    window = CoalesceWindow(0.5, 0.2)
+    assert window.max_seconds == 0.5
+    window.record_flush(10.0, 5)
+    assert window.record_flush(10.0, 10) == 0.5
+    assert window.as_dict() == {
+        "window_seconds": 0.5,
+        "min_seconds": 0.5,
+        "max_seconds": 0.5,
+        "ingest_rate_per_second": 0.0,
+        "flush_rate_per_second": 0.0,
+        "flushes": 2,
+    }
+
+
+def test_has_urgent_depth() -> None:
+    assert has_urgent_depth({"environment.depth.belowKeel": 1.5}, 2.0)
+    assert not has_urgent_depth({"environment.depth.belowKeel": 2.5}, 2.0)
+    assert not has_urgent_depth({"environment.depth.belowKeel": True}, 2.0)
+    assert not has_urgent_depth({"environment.depth.belowKeel": None}, 2.0)
+    assert not has_urgent_depth({"navigation.speedOverGround": 0.5}, 2.0)
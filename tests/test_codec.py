@@ -0,0 +1,115 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from custom_components.signalk_ha import codec
+from custom_components.signalk_ha import parser as parser_module
+from custom_components.signalk_ha.parser import (
+    DecodedDelta,
+    PathInterest,
+    decode_delta,
+    decode_frames,
+)
+
+
+def test_loads_and_dumps_round_trip() -> None:
+    payload = {"context": "vessels.self", "subscribe": [{"path": "navigation.*", "period": 1000}]}
+    text = codec.dumps(payload)
+    assert isinstance(text, str)
+    assert json.loads(text) == payload
+    assert codec.loads(text) == payload
+
+
+def test_loads_invalid_json_raises_codec_error() -> None:
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads("not json")
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads_delta("not json")
+    # Callers that only know about ValueError keep working.
+    assert issubclass(codec.JSONDecodeError, ValueError)
+
+
+def test_backend_reported() -> None:
+    assert codec.BACKEND in ("orjson", "msgspec", "json")
+    assert codec.TYPED_DELTAS is (codec.DeltaFrame is not None)
+
+
+def test_loads_delta_matches_generic_decode_on_real_data() -> None:
+    data_path = Path(__file__).parent / "testdata.json"
+    contexts = ["vessels.self"]
+    with data_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            text = line.strip()
+            try:
+                expected = decode_delta(json.loads(text), contexts)
+            except json.JSONDecodeError:
+                continue
+            assert decode_delta(codec.loads_delta(text), contexts) == expected
+
+
+def test_loads_delta_tolerates_non_delta_frames() -> None:
+    hello = '{"name":"signalk-server","version":"2.19.0","self":"vessels.urn:x","roles":[]}'
+    assert decode_delta(codec.loads_delta(hello), ["vessels.self"]).values == {}
+    malformed = '{"updates":[{"values":["bad",{"path":"p","value":1}]}]}'
+    assert decode_delta(codec.loads_delta(malformed), None).values == {"p": 1}
+
+
+def _real_frames() -> list[str]:
+    data_path = Path(__file__).parent / "testdata.json"
+    with data_path.open("r", encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def test_typed_delta_decode_matches_generic_decode() -> None:
+    pytest.importorskip("msgspec")
+    contexts = ["vessels.urn:mrn:imo:mmsi:222222222"]
+    interest = PathInterest(["navigation.*", "environment.wind.*"])
+    typed = 0
+    for text in _real_frames():
+        try:
+            generic = json.loads(text)
+        except json.JSONDecodeError:
+            continue
+        frame = codec.loads_delta(text)
+        if isinstance(frame, codec.DeltaFrame):
+            typed += 1
+        assert decode_delta(frame, contexts) == decode_delta(generic, contexts)
+        assert decode_delta(frame, contexts, interest) == decode_delta(generic, contexts, interest)
+        assert decode_delta(frame, ["vessels.other"]) == decode_delta(generic, ["vessels.other"])
+    assert typed
+
+
+def test_typed_decode_frames_matches_generic_decode(monkeypatch) -> None:
+    pytest.importorskip("msgspec")
+    frames = [(text, float(index)) for index, text in enumerate(_real_frames())]
+    contexts = ["vessels.urn:mrn:imo:mmsi:222222222"]
+    typed = decode_frames(frames, contexts)
+    monkeypatch.setattr(parser_module, "loads_delta", codec.loads)
+    generic = decode_frames(frames, contexts)
+    assert typed.values
+    assert replace(typed, decoded_at=0.0) == replace(generic, decoded_at=0.0)
+
+
+def test_typed_decode_falls_back_for_frames_outside_the_schema() -> None:
+    pytest.importorskip("msgspec")
+    # A value key that is absent differs from an explicit null, as in the generic decode.
+    delta = '{"updates":[{"$source":"n2k","values":[{"path":"a.b"},{"path":"c.d","value":null}]}]}'
+    frame = codec.loads_delta(delta)
+    assert isinstance(frame, codec.DeltaFrame)
+    decoded = decode_delta(frame, None)
+    assert decoded == decode_delta(json.loads(delta), None)
+    assert decoded.values == {"c.d": None}
+    assert decoded.sources == {"a.b": "n2k", "c.d": "n2k"}
+    # Unknown fields are skipped, so the server hello is an empty frame.
+    hello = '{"name":"signalk-server","version":"2.19.0","self":"vessels.urn:x","roles":[]}'
+    assert decode_delta(codec.loads_delta(hello), ["vessels.self"]) == DecodedDelta()
+    # Frames that fail validation decode generically and keep the tolerant handling.
+    malformed = '{"updates":[{"values":["bad",{"path":"p","value":1}]}]}'
+    assert isinstance(codec.loads_delta(malformed), dict)
+    assert decode_delta(codec.loads_delta(malformed), None).values == {"p": 1}
+    assert codec.loads_delta("[1, 2]") == [1, 2]
+    assert decode_delta(codec.loads_delta('{"context": 5, "updates": []}'), None) == DecodedDelta()
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads_delta('{"updates":')
@@ -16,6 +16,8 @@ from custom_components.signalk_ha.config_flow import _admin_access_url
 from custom_components.signalk_ha.const import (
     CONF_ACCESS_TOKEN,
     CONF_BASE_URL,
+    CONF_COALESCE_MAX_MS,
+    CONF_COALESCE_MIN_MS,
     CONF_ENABLE_NOTIFICATIONS,
     CONF_GROUPS,
     CONF_HOST,
@@ -25,9 +27,12 @@ from custom_components.signalk_ha.const import (
     CONF_SERVER_ID,
     CONF_SERVER_VERSION,
     CONF_SSL,
+    CONF_URGENT_DEPTH_M,
     CONF_VERIFY_SSL,
     CONF_VESSEL_ID,
     CONF_VESSEL_NAME,
+    DEFAULT_COALESCE_MAX_MS,
+    DEFAULT_COALESCE_MIN_MS,
     DEFAULT_GROUPS,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
@@ -1412,6 +1417,42 @@ async def test_options_flow_updates_refresh_interval(hass, enable_custom_integra
         "notifications.navigation.anchor",
         "notifications.navigation.course.arrival",
     ]
+    assert entry.options[CONF_COALESCE_MIN_MS] == DEFAULT_COALESCE_MIN_MS
+    assert entry.options[CONF_COALESCE_MAX_MS] == DEFAULT_COALESCE_MAX_MS
+    assert entry.options[CONF_URGENT_DEPTH_M] == 0.0
+
+
+async def test_options_flow_orders_coalesce_bounds(hass, enable_custom_integrations) -> None:
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: "sk.local",
+            CONF_PORT: 3000,
+            CONF_SSL: False,
+            CONF_VERIFY_SSL: True,
+            CONF_VESSEL_ID: "mmsi:261006533",
+            CONF_VESSEL_NAME: "ONA",
+        },
+    )
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_REFRESH_INTERVAL_HOURS: 24,
+            CONF_ENABLE_NOTIFICATIONS: False,
+            CONF_COALESCE_MIN_MS: 800,
+            CONF_COALESCE_MAX_MS: 200,
+            CONF_URGENT_DEPTH_M: -1,
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_COALESCE_MIN_MS] == 800
+    assert entry.options[CONF_COALESCE_MAX_MS] == 800
+    assert entry.options[CONF_URGENT_DEPTH_M] == 0.0
 
 
 async def test_auth_form_falls_back_to_access_url(hass) -> None:
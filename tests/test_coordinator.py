@@ -1,5 +1,6 @@
 import asyncio
 import json
+import threading
 import time
 from datetime import timedelta
 from types import SimpleNamespace
@@ -10,23 +11,38 @@ import pytest
 from aiohttp import ClientError, WSMsgType, WSServerHandshakeError
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 import custom_components.signalk_ha.coordinator as coordinator_module
+import custom_components.signalk_ha.parser as parser_module
 from custom_components.signalk_ha.auth import AuthRequired, SignalKAuthManager
 from custom_components.signalk_ha.const import (
+    CONF_AIS_ENABLED,
+    CONF_AIS_MAX_TARGETS,
     CONF_BASE_URL,
+    CONF_COALESCE_MAX_MS,
+    CONF_COALESCE_MIN_MS,
     CONF_ENABLE_NOTIFICATIONS,
+    CONF_GROUPS,
     CONF_HOST,
+    CONF_NOTIFICATION_BURST,
+    CONF_NOTIFICATION_CACHE_SIZE,
+    CONF_NOTIFICATION_RATE_PER_MINUTE,
+    CONF_NOTIFICATION_REPEAT_SUMMARY,
+    CONF_OFFLOAD_FRAME_BYTES,
+    CONF_OFFLOAD_FRAME_RATE,
     CONF_PORT,
     CONF_SERVER_ID,
     CONF_SERVER_VERSION,
     CONF_SSL,
+    CONF_URGENT_DEPTH_M,
     CONF_VERIFY_SSL,
     CONF_VESSEL_ID,
     CONF_VESSEL_NAME,
     CONF_WS_URL,
+    DEFAULT_STALE_SECONDS,
     DOMAIN,
     notification_event_type,
 )
@@ -35,8 +51,11 @@ from custom_components.signalk_ha.coordinator import (
     SignalKCoordinator,
     SignalKDiscoveryCoordinator,
 )
+from custom_components.signalk_ha.dedupe import notification_signature
 from custom_components.signalk_ha.discovery import DiscoveryResult
 from custom_components.signalk_ha.identity import VesselIdentity
+from custom_components.signalk_ha.parser import PathInterest
+from custom_components.signalk_ha.planner import NOTIFICATIONS_PLAN, SubscriptionPlan
 from custom_components.signalk_ha.rest import DiscoveryInfo
 
 
@@ -146,6 +165,28 @@ def test_coordinator_property_accessors() -> None:
     assert coordinator.auth_last_error == "boom"
 
 
+def test_path_accessors_do_not_copy() -> None:
+    coordinator = SignalKCoordinator(
+        Mock(), _make_entry(), Mock(), Mock(), SignalKAuthManager(None)
+    )
+    now = dt_util.utcnow()
+    coordinator._last_update_by_path["navigation.speedOverGround"] = now
+    coordinator._last_source_by_path["navigation.speedOverGround"] = "src1"
+
+    assert coordinator.last_update_for("navigation.speedOverGround") == now
+    assert coordinator.last_source_for("navigation.speedOverGround") == "src1"
+    assert coordinator.last_update_for("navigation.headingTrue") is None
+    assert coordinator.last_source_for("navigation.headingTrue") is None
+
+    view = coordinator.last_update_by_path
+    with pytest.raises(TypeError):
+        view["navigation.headingTrue"] = now  # type: ignore[index]
+    coordinator._last_update_by_path["navigation.headingTrue"] = now
+    assert "navigation.headingTrue" in view
+    with pytest.raises(TypeError):
+        coordinator.last_source_by_path["x"] = "y"  # type: ignore[index]
+
+
 def test_rate_properties_compute_per_hour() -> None:
     coordinator = SignalKCoordinator(
         Mock(), _make_entry(), Mock(), Mock(), SignalKAuthManager(None)
@@ -260,6 +301,85 @@ def test_handle_message_updates_cache(hass) -> None:
         coordinator._flush_handle = None
 
 
+def test_handle_message_rejects_other_vessel_before_decoding(hass, monkeypatch) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    decode = Mock(side_effect=parser_module.decode_delta)
+    monkeypatch.setattr(parser_module, "decode_delta", decode)
+    payload = (
+        '{"context":"vessels.urn:mrn:imo:mmsi:111111111",'
+        '"updates":[{"values":[{"path":"navigation.speedOverGround","value":1.2}]}]}'
+    )
+
+    coordinator._handle_message(payload, coordinator.config)
+    coordinator._handle_message(payload, coordinator.config)
+
+    decode.assert_not_called()
+    assert coordinator._data_cache == {}
+    assert coordinator.message_count == 2
+
+
+def test_context_matcher_is_reused_until_vessel_changes(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    cfg = coordinator.config
+
+    matcher = coordinator._context_matcher_for(cfg)
+    assert coordinator._context_matcher_for(cfg) is matcher
+    assert coordinator._context_matcher_for(cfg, rebuild=True) is not matcher
+
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_VESSEL_ID: "mmsi:111111111"}
+    )
+    rebuilt = coordinator._context_matcher_for(coordinator.config)
+    assert "mmsi:111111111" in rebuilt.expected_contexts
+
+
+def test_hash_vessel_id_keeps_own_urn_until_hello(hass) -> None:
+    entry = _make_entry(options={CONF_AIS_ENABLED: True})
+    entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_VESSEL_ID: "hash:0123456789ab"}
+    )
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    cfg = coordinator.config
+    own = "vessels.urn:mrn:imo:mmsi:261006533"
+    other = "vessels.urn:mrn:imo:mmsi:111111111"
+
+    # A hash id never appears in a delta context, so the server's own URN must still match.
+    matcher = coordinator._context_matcher_for(cfg)
+    assert matcher.matches(own) is True
+    assert coordinator._target_interest(cfg) is None
+
+    hello = json.dumps({"name": "signalk-server", "version": "2.19.0", "self": own})
+    assert coordinator._learn_server_self(hello) is True
+    assert coordinator._learn_server_self(hello) is False
+    learned = coordinator._context_matcher_for(cfg)
+    assert learned.matches(own) is True
+    assert learned.matches(other) is False
+    assert coordinator._target_interest(cfg) is coordinator._ais_interest
+    assert coordinator._ais_interest is not None
+
+    values = [{"path": "navigation.speedOverGround", "value": 1.5}]
+    payload = json.dumps({"context": own, "updates": [{"values": values}]})
+    coordinator._handle_message(payload, cfg)
+    assert coordinator._data_cache["navigation.speedOverGround"] == 1.5
+    coordinator._flush_handle.cancel()
+    coordinator._flush_handle = None
+
+
+def test_learn_server_self_ignores_deltas(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    assert coordinator._learn_server_self("invalid") is False
+    assert coordinator._learn_server_self('{"self":"vessels.urn:x","updates":[]}') is False
+    assert coordinator._learn_server_self('{"self":"urn:x"}') is False
+    assert coordinator._server_self is None
+
+
 def test_handle_message_invalid_json(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -384,8 +504,10 @@ def test_fire_notification_dedupes_without_timestamp(hass) -> None:
         "source": "anchoralarm",
     }
     message = "notifications.navigation.anchor (alert)"
-    signature = coordinator._notification_signature(value, "alert", message, None, "anchoralarm")
-    coordinator._notification_cache[notification["path"]] = (signature, None, time.monotonic())
+    signature = notification_signature(value, "alert", message, None, "anchoralarm")
+    coordinator._notification_dedupe.is_duplicate(
+        notification["path"], signature, None, time.monotonic()
+    )
     coordinator._fire_notification(notification, coordinator.config)
 
     assert events == []
@@ -414,6 +536,103 @@ def test_fire_notification_dedupes_with_timestamp(hass) -> None:
     assert len(events) == 1
 
 
+def test_fire_notification_cache_size_is_configurable(hass) -> None:
+    entry = _make_entry(options={CONF_NOTIFICATION_CACHE_SIZE: 2})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+
+    for name in ("anchor", "depth", "wind"):
+        coordinator._fire_notification(
+            {"path": f"notifications.{name}", "value": {"state": "alert"}}, coordinator.config
+        )
+
+    dedupe = coordinator.notification_dedupe
+    assert dedupe["size"] == 2
+    assert dedupe["max_size"] == 2
+    assert dedupe["lru_evictions"] == 1
+
+
+async def test_fire_notification_rate_limits_repeats_with_summary(hass) -> None:
+    entry = _make_entry(
+        options={
+            CONF_NOTIFICATION_RATE_PER_MINUTE: 6,
+            CONF_NOTIFICATION_BURST: 2,
+            CONF_NOTIFICATION_REPEAT_SUMMARY: True,
+        }
+    )
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    events: list = []
+    hass.bus.async_listen(
+        notification_event_type(entry.data[CONF_VESSEL_NAME]),
+        lambda event: events.append(event),
+    )
+
+    def _notify(state: str, index: int) -> None:
+        coordinator._fire_notification(
+            {
+                "path": "notifications.navigation.anchor",
+                "value": {"state": state},
+                "timestamp": f"2026-01-03T22:34:{index:02d}.000Z",
+            },
+            coordinator.config,
+        )
+
+    for index in range(6):
+        _notify("alert", index)
+    assert coordinator._summary_handle is not None
+    # A state change passes at once, after a summary of the repeats held so far.
+    _notify("alarm", 10)
+    coordinator._summary_handle.cancel()
+    coordinator._flush_notification_repeats()
+    await hass.async_block_till_done()
+
+    assert [(event.data["state"], event.data.get("repeated")) for event in events] == [
+        ("alert", None),
+        ("alert", None),
+        ("alert", 4),
+        ("alarm", None),
+    ]
+    rate_limit = coordinator.notification_rate_limit
+    assert rate_limit["limited"] == 4
+    assert rate_limit["held_paths"] == 0
+    assert rate_limit["summaries"] == 1
+
+
+async def test_fire_notification_limiter_passes_new_message_with_same_state(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    events: list = []
+    hass.bus.async_listen(
+        notification_event_type(entry.data[CONF_VESSEL_NAME]),
+        lambda event: events.append(event),
+    )
+
+    # Past the default burst, a repeat with a new message is news, not a resend.
+    for index in range(8):
+        coordinator._fire_notification(
+            {
+                "path": "notifications.environment.depth.belowKeel",
+                "value": {"state": "alarm", "message": "Shallow water"},
+                "timestamp": f"2026-01-03T22:34:{index:02d}.000Z",
+            },
+            coordinator.config,
+        )
+    coordinator._fire_notification(
+        {
+            "path": "notifications.environment.depth.belowKeel",
+            "value": {"state": "alarm", "message": "Depth 1.2 m"},
+            "timestamp": "2026-01-03T22:34:30.000Z",
+        },
+        coordinator.config,
+    )
+    await hass.async_block_till_done()
+
+    assert events[-1].data["message"] == "Depth 1.2 m"
+    assert coordinator.notification_rate_limit["limited"] == 3
+
+
 async def test_fire_notification_defaults_message(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -480,17 +699,6 @@ async def test_fire_notification_non_dict_value(hass) -> None:
     assert events[0].data["message"] == "notifications.navigation.anchor"
 
 
-def test_notification_signature_handles_bad_keys() -> None:
-    value = {("bad",): "data"}
-    signature = SignalKCoordinator._notification_signature(value, None, None, None, None)
-    assert signature[-1] == repr(value)
-
-
-def test_notification_signature_scalar_value() -> None:
-    signature = SignalKCoordinator._notification_signature(42, None, None, None, None)
-    assert signature[-1] == repr(42)
-
-
 async def test_send_subscribe_payload(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -508,6 +716,59 @@ async def test_send_subscribe_payload(hass) -> None:
     assert payload["subscribe"][0]["minPeriod"] == 1000
 
 
+async def test_ais_targets_subscribed_and_cached_per_vessel(hass) -> None:
+    entry = _make_entry(options={CONF_AIS_ENABLED: True, CONF_AIS_MAX_TARGETS: 1})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._paths = ["navigation.speedOverGround"]
+    changes: list = []
+    coordinator.async_add_ais_listener(lambda updated, removed: changes.append((updated, removed)))
+
+    ws = SimpleNamespace(send_str=AsyncMock())
+    await coordinator._send_subscribe(ws)
+    payloads = [json.loads(call.args[0]) for call in ws.send_str.call_args_list]
+    assert [payload["context"] for payload in payloads] == ["vessels.self", "vessels.*"]
+    assert [item["path"] for item in payloads[1]["subscribe"]] == [
+        "navigation.courseOverGroundTrue",
+        "navigation.position",
+        "navigation.speedOverGround",
+    ]
+
+    def _delta(mmsi: str, path: str, value: Any) -> str:
+        return json.dumps(
+            {
+                "context": f"vessels.urn:mrn:imo:mmsi:{mmsi}",
+                "updates": [{"values": [{"path": path, "value": value}]}],
+            }
+        )
+
+    own = "vessels.urn:mrn:imo:mmsi:261006533"
+    first = "vessels.urn:mrn:imo:mmsi:222222222"
+    coordinator._handle_message(
+        _delta("261006533", "navigation.speedOverGround", 3.0), coordinator.config
+    )
+    coordinator._handle_message(
+        _delta("222222222", "navigation.speedOverGround", 5.0), coordinator.config
+    )
+    coordinator._handle_message(
+        _delta("333333333", "navigation.speedOverGround", 6.0), coordinator.config
+    )
+    if coordinator._flush_handle is not None:
+        coordinator._flush_handle.cancel()
+
+    assert coordinator._data_cache == {"navigation.speedOverGround": 3.0}
+    assert own not in coordinator._dirty_paths
+    assert coordinator.ais_target(first) is None
+    target = coordinator.ais_target("vessels.urn:mrn:imo:mmsi:333333333")
+    assert target is not None
+    assert target.values == {"navigation.speedOverGround": 6.0}
+    assert changes == [
+        ([first], []),
+        (["vessels.urn:mrn:imo:mmsi:333333333"], [first]),
+    ]
+    assert coordinator.ais["lru_evictions"] == 1
+
+
 def test_build_ssl_param() -> None:
     data = dict(_make_entry().data)
     data[CONF_SSL] = True
@@ -529,18 +790,207 @@ def test_build_ssl_param() -> None:
     assert coordinator._build_ssl_param(coordinator.config) is None
 
 
-async def test_async_update_paths_triggers_resubscribe(hass) -> None:
+async def test_async_update_paths_sends_subscription_diff(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
     coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._paths = ["navigation.headingTrue", "navigation.speedOverGround"]
+    coordinator._periods = {"navigation.speedOverGround": 1000}
+    ws = SimpleNamespace(send_str=AsyncMock(), closed=False)
+    await coordinator._send_subscribe(ws)
     coordinator._state = ConnectionState.CONNECTED
-    coordinator._ws = SimpleNamespace(closed=False)
+    coordinator._ws = ws
+    ws.send_str.reset_mock()
 
     with patch.object(coordinator, "_send_subscribe", new=AsyncMock()) as send:
         await coordinator.async_update_paths(
-            ["navigation.speedOverGround"], {"navigation.speedOverGround": 500}
+            ["environment.depth.belowTransducer", "navigation.speedOverGround"],
+            {"navigation.speedOverGround": 1000},
         )
-        send.assert_called_once()
+        send.assert_not_called()
+
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert [item["path"] for item in unsubscribe["unsubscribe"]] == ["navigation.headingTrue"]
+    assert [(item["path"], item["period"]) for item in subscribe["subscribe"]] == [
+        ("environment.depth.belowTransducer", 5000),
+    ]
+
+    ws.send_str.reset_mock()
+    await coordinator.async_update_paths(
+        ["environment.depth.belowTransducer", "navigation.*", "navigation.speedOverGround"],
+        {"navigation.speedOverGround": 1000},
+    )
+    # Adding one path sends only that path.
+    ws.send_str.assert_called_once()
+    payload = json.loads(ws.send_str.call_args.args[0])
+    assert [item["path"] for item in payload["subscribe"]] == ["navigation.*"]
+
+    ws.send_str.reset_mock()
+    await coordinator.async_update_paths(
+        ["environment.depth.belowTransducer", "navigation.*", "navigation.speedOverGround"],
+        {"navigation.speedOverGround": 2000},
+    )
+    # A changed period re-times only that path.
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert unsubscribe == {
+        "context": "vessels.self",
+        "unsubscribe": [{"path": "navigation.speedOverGround"}],
+    }
+    assert [(item["path"], item["period"]) for item in subscribe["subscribe"]] == [
+        ("navigation.speedOverGround", 2000),
+    ]
+
+    ws.send_str.reset_mock()
+    coordinator._per_path_unsubscribe = False
+    await coordinator.async_update_paths(
+        ["environment.depth.belowTransducer", "navigation.*", "navigation.speedOverGround"],
+        {"navigation.speedOverGround": 4000},
+    )
+    # Without per-path unsubscribe the old subscription can only go with all of them.
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert [item["path"] for item in unsubscribe["unsubscribe"]] == ["navigation.speedOverGround"]
+    assert sorted((item["path"], item["period"]) for item in subscribe["subscribe"]) == [
+        ("environment.depth.belowTransducer", 5000),
+        ("navigation.*", 5000),
+        ("navigation.speedOverGround", 4000),
+    ]
+
+
+async def test_subscription_plans_set_min_period_and_policy(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._paths = ["environment.wind.speedApparent", "notifications.*"]
+    coordinator._periods = {"environment.wind.speedApparent": 5000, "notifications.*": 5000}
+    coordinator._plans = {
+        "environment.wind.speedApparent": SubscriptionPlan(period=30000, min_period=30000),
+        "notifications.*": NOTIFICATIONS_PLAN,
+    }
+    ws = SimpleNamespace(send_str=AsyncMock(), closed=False)
+    await coordinator._send_subscribe(ws)
+
+    payload = json.loads(ws.send_str.call_args.args[0])
+    assert [
+        (item["path"], item["period"], item["minPeriod"], item["policy"])
+        for item in payload["subscribe"]
+    ] == [
+        ("environment.wind.speedApparent", 30000, 30000, "ideal"),
+        ("notifications.*", 5000, 5000, "instant"),
+    ]
+    # Notifications have no keepalive, so only the wind period bounds the silence.
+    assert coordinator._keepalive_seconds == 30.0
+    plan = coordinator.subscription_plan
+    assert plan["policies"] == {"ideal": 1, "instant": 1}
+    assert plan["estimated_messages_saved_per_hour"] == {"static": 1320.0, "busy": 600.0}
+    assert plan["estimated_bytes_saved_per_hour"] is None
+
+    coordinator._state = ConnectionState.CONNECTED
+    coordinator._ws = ws
+    ws.send_str.reset_mock()
+    await coordinator.async_update_paths(
+        coordinator._paths,
+        coordinator._periods,
+        plans={"notifications.*": NOTIFICATIONS_PLAN},
+    )
+    # Only the path whose plan changed is re-subscribed.
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert unsubscribe["unsubscribe"] == [{"path": "environment.wind.speedApparent"}]
+    assert [(item["path"], item["minPeriod"]) for item in subscribe["subscribe"]] == [
+        ("environment.wind.speedApparent", 5000)
+    ]
+
+
+async def test_review_raises_period_of_static_path(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    await coordinator.async_update_paths(
+        ["tanks.freshWater.0.currentLevel", "notifications.*"],
+        {"tanks.freshWater.0.currentLevel": 5000, "notifications.*": 5000},
+        plans={"notifications.*": NOTIFICATIONS_PLAN},
+    )
+    ws = SimpleNamespace(send_str=AsyncMock(), closed=False)
+    coordinator._state = ConnectionState.CONNECTED
+    coordinator._ws = ws
+    coordinator._task = Mock()
+    await coordinator._send_subscribe(ws)
+    ws.send_str.reset_mock()
+
+    with patch("custom_components.signalk_ha.coordinator.time.time", return_value=1000.0):
+        for _ in range(3):
+            coordinator._handle_message(
+                json.dumps(
+                    {
+                        "context": "vessels.self",
+                        "updates": [
+                            {"values": [{"path": "tanks.freshWater.0.currentLevel", "value": 0.5}]}
+                        ],
+                    }
+                ),
+                coordinator.config,
+            )
+    assert coordinator._cadence_unsub is not None
+    coordinator._cadence_unsub.cancel()
+
+    with (
+        patch("custom_components.signalk_ha.coordinator.time.time", return_value=5000.0),
+        patch.object(coordinator._snapshot, "schedule_save") as save,
+    ):
+        coordinator._review_cadence()
+    await hass.async_block_till_done()
+    save.assert_called_once()
+
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert unsubscribe["unsubscribe"] == [{"path": "tanks.freshWater.0.currentLevel"}]
+    assert [(item["path"], item["period"]) for item in subscribe["subscribe"]] == [
+        ("tanks.freshWater.0.currentLevel", 60000)
+    ]
+    assert coordinator._retimed == {"tanks.freshWater.0.currentLevel": 60.0}
+    assert coordinator.learned_periods["raised_paths"] == 1
+    assert "tanks.freshWater.0.currentLevel" in coordinator._snapshot_data()["cadence"]["paths"]
+    for handle in (coordinator._cadence_unsub, coordinator._flush_handle, coordinator._stale_unsub):
+        if handle is not None:
+            handle.cancel()
+
+
+async def test_ignored_per_path_unsubscribe_falls_back_to_full_resubscribe(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    tank = "tanks.freshWater.0.currentLevel"
+    coordinator._paths = [tank]
+    coordinator._periods = {tank: 5000}
+    ws = SimpleNamespace(send_str=AsyncMock(), closed=False)
+    await coordinator._send_subscribe(ws)
+    coordinator._state = ConnectionState.CONNECTED
+    coordinator._ws = ws
+    coordinator._task = Mock()
+
+    await coordinator.async_update_paths([tank], {tank: 60000})
+    assert coordinator._retimed == {tank: 60.0}
+    ws.send_str.reset_mock()
+
+    # The old 5 s subscription keeps repeating the unchanged value next to the new one.
+    payload = json.dumps(
+        {"context": "vessels.self", "updates": [{"values": [{"path": tank, "value": 0.5}]}]}
+    )
+    for second in range(0, 30, 5):
+        with patch(
+            "custom_components.signalk_ha.coordinator.time.time", return_value=1000.0 + second
+        ):
+            coordinator._handle_message(payload, coordinator.config)
+    await hass.async_block_till_done()
+
+    assert coordinator._per_path_unsubscribe is False
+    assert coordinator._retimed == {}
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert unsubscribe == {"context": "*", "unsubscribe": [{"path": "*"}]}
+    assert [(item["path"], item["period"]) for item in subscribe["subscribe"]] == [
+        (tank, 60000)
+    ]
+    for handle in (coordinator._cadence_unsub, coordinator._flush_handle, coordinator._stale_unsub):
+        if handle is not None:
+            handle.cancel()
 
 
 def test_auth_failure_triggers_reauth(hass) -> None:
@@ -607,6 +1057,297 @@ def test_schedule_flush_sets_handle(hass) -> None:
     coordinator._flush_handle = None
 
 
+def test_schedule_flush_uses_adaptive_window(hass) -> None:
+    entry = _make_entry(options={CONF_COALESCE_MIN_MS: 50, CONF_COALESCE_MAX_MS: 3000})
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._coalesce.record_flush(0.0, 0)
+    coordinator._coalesce.record_flush(60.0, 60_000)
+
+    coordinator._schedule_flush()
+
+    delay = coordinator._flush_handle.when() - hass.loop.time()
+    assert 2.9 < delay <= 3.0
+    assert coordinator.coalescing["window_seconds"] == 3.0
+    coordinator._flush_handle.cancel()
+    coordinator._flush_handle = None
+
+
+def test_urgent_depth_pulls_flush_forward(hass) -> None:
+    entry = _make_entry(options={CONF_COALESCE_MAX_MS: 3000, CONF_URGENT_DEPTH_M: 2.0})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._coalesce.record_flush(0.0, 0)
+    coordinator._coalesce.record_flush(60.0, 60_000)
+
+    def _depth(value: float) -> str:
+        return json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [{"values": [{"path": "environment.depth.belowKeel", "value": value}]}],
+            }
+        )
+
+    coordinator._handle_message(_depth(5.0), coordinator.config)
+    assert coordinator._flush_handle.when() - hass.loop.time() > 2.0
+
+    coordinator._handle_message(_depth(1.5), coordinator.config)
+    urgent_handle = coordinator._flush_handle
+    assert urgent_handle.when() - hass.loop.time() <= 0.1
+
+    coordinator._handle_message(_depth(1.4), coordinator.config)
+    assert coordinator._flush_handle is urgent_handle
+    assert coordinator.coalescing["urgent_depth_m"] == 2.0
+    urgent_handle.cancel()
+    coordinator._flush_handle = None
+
+
+def test_latency_trail_from_server_timestamp_to_state_write(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    timestamp = (dt_util.utcnow() - timedelta(seconds=2)).isoformat()
+    payload = json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [
+                {
+                    "timestamp": timestamp,
+                    "values": [
+                        {"path": "navigation.speedOverGround", "value": 1.0},
+                        {"path": "environment.depth.belowKeel", "value": 4.0},
+                    ],
+                }
+            ],
+        }
+    )
+
+    coordinator._handle_message(payload, coordinator.config)
+    assert coordinator.latency_summary("decode")["count"] == 1
+    coordinator._flush_handle.cancel()
+    coordinator._flush_updates()
+    coordinator.record_state_write("navigation.speedOverGround")
+    coordinator.record_state_write("navigation.speedOverGround")
+
+    latency = coordinator.latency
+    assert set(latency["coalesce"]) == {"navigation", "environment", "all"}
+    assert latency["network"]["navigation"]["p50"] >= 2000.0
+    assert latency["dispatch"]["navigation"]["count"] == 1
+    assert latency["end_to_end"]["navigation"]["p50"] >= 2000.0
+    assert "environment" not in latency["end_to_end"]
+    assert coordinator._pending_latency == {}
+
+
+async def test_offload_decodes_batches_off_loop(hass) -> None:
+    entry = _make_entry(options={CONF_OFFLOAD_FRAME_BYTES: 10})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    frames = [
+        json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [{"values": [{"path": "navigation.speedOverGround", "value": value}]}],
+            }
+        )
+        for value in (1.0, 2.0, 3.0)
+    ]
+
+    for text in frames:
+        assert coordinator._should_offload(text)
+        await coordinator._offload_message(text, coordinator.config)
+    assert coordinator.offload["active"] is True
+    await hass.async_block_till_done()
+
+    assert coordinator._data_cache == {"navigation.speedOverGround": 3.0}
+    assert coordinator.message_count == 3
+    assert coordinator.offload["frames"] == 3
+    assert coordinator.offload["active"] is False
+    coordinator._flush_handle.cancel()
+    coordinator._flush_handle = None
+
+
+async def test_offload_applies_backpressure(hass, monkeypatch) -> None:
+    monkeypatch.setattr(coordinator_module, "_FRAME_QUEUE_LIMIT", 2)
+    release = threading.Event()
+    decode_frames = coordinator_module.decode_frames
+
+    def _blocked_decode(*args: Any) -> Any:
+        # Hold the worker so frames pile up behind the batch in flight.
+        release.wait(5)
+        return decode_frames(*args)
+
+    monkeypatch.setattr(coordinator_module, "decode_frames", _blocked_decode)
+    entry = _make_entry(options={CONF_OFFLOAD_FRAME_BYTES: 10})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    cfg = coordinator.config
+
+    await coordinator._offload_message("not json", cfg)
+    # Whether the drain task starts eagerly or not, it takes the first frame to the worker.
+    for _ in range(10):
+        if not coordinator._frame_queue:
+            break
+        await asyncio.sleep(0)
+    assert coordinator._frame_queue == []
+    assert coordinator._decode_task is not None
+
+    await coordinator._offload_message("still not json", cfg)
+    assert coordinator.offload["queue_full_waits"] == 0
+    # The third frame fills the queue, so the reader waits for the worker to drain it.
+    reader = asyncio.ensure_future(coordinator._offload_message("nor this", cfg))
+    await asyncio.sleep(0)
+    assert not reader.done()
+    assert coordinator.offload["queue_full_waits"] == 1
+    assert coordinator.offload["queued_frames"] == 2
+
+    release.set()
+    await reader
+    await hass.async_block_till_done()
+
+    assert coordinator._decode_task is None
+    assert coordinator.offload["batches"] == 2
+    assert coordinator.offload["max_batch"] == 2
+    assert coordinator.counters["parse_errors"] == 3
+
+
+async def test_socket_backlog_collapses_pending_values(hass) -> None:
+    entry = _make_entry(options={CONF_OFFLOAD_FRAME_RATE: 0, CONF_OFFLOAD_FRAME_BYTES: 0})
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._fire_notification = Mock()
+
+    def _frame(path: str, value: Any) -> str:
+        return json.dumps(
+            {"context": "vessels.self", "updates": [{"values": [{"path": path, "value": value}]}]}
+        )
+
+    frames = [_frame("navigation.speedOverGround", float(index)) for index in range(40)]
+    frames.insert(36, _frame("notifications.mob", {"state": "alarm", "message": "MOB"}))
+    inline = 0
+    # All frames arrive within one loop turn, as when the socket drains after a stall.
+    for text in frames:
+        coordinator._count_turn_frame()
+        if coordinator._should_offload(text):
+            await coordinator._offload_message(text, coordinator.config)
+        else:
+            coordinator._handle_message(text, coordinator.config)
+            inline += 1
+    await hass.async_block_till_done()
+
+    assert inline == coordinator_module._BACKLOG_FRAMES - 1
+    assert coordinator._data_cache == {"navigation.speedOverGround": 39.0}
+    coordinator._fire_notification.assert_called_once()
+    offload = coordinator.offload
+    assert offload["backlog_turns"] == 1
+    assert offload["frames"] == len(frames) - inline
+    # How the backlog splits into batches depends on when the drain task starts; each speed
+    # frame carries one value, so every collapsed value drops a whole frame.
+    assert offload["collapsed_values"] > 0
+    assert offload["dropped_frames"] == offload["collapsed_values"]
+    assert coordinator._turn_frames == 0
+    coordinator._flush_handle.cancel()
+    coordinator._flush_handle = None
+
+
+def test_should_offload_thresholds(hass) -> None:
+    entry = _make_entry(options={CONF_OFFLOAD_FRAME_RATE: 100, CONF_OFFLOAD_FRAME_BYTES: 0})
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    assert coordinator._should_offload("x" * 100_000) is False
+    coordinator._coalesce.record_flush(0.0, 0)
+    coordinator._coalesce.record_flush(60.0, 60_000)
+    assert coordinator._should_offload("{}") is True
+
+    disabled = SignalKCoordinator(
+        hass,
+        _make_entry(options={CONF_OFFLOAD_FRAME_RATE: 0, CONF_OFFLOAD_FRAME_BYTES: 0}),
+        Mock(),
+        Mock(),
+        SignalKAuthManager(None),
+    )
+    assert disabled._should_offload("x" * 100_000) is False
+    disabled._frame_queue.append(("{}", 0.0))
+    assert disabled._should_offload("{}") is True
+
+
+async def test_restore_snapshot_seeds_caches_until_connected(hass, hass_storage) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    now = dt_util.utcnow()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.snapshot",
+        "data": {
+            "paths": {
+                "navigation.speedOverGround": [5.5, (now - timedelta(seconds=60)).isoformat(), "s"],
+                "design.beam": [7.09, (now - timedelta(hours=2)).isoformat(), None],
+            }
+        },
+    }
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+
+    await coordinator.async_restore_snapshot()
+
+    assert coordinator.data == {"navigation.speedOverGround": 5.5}
+    assert coordinator.last_source_for("navigation.speedOverGround") == "s"
+    assert coordinator.warm_start is True
+    deadline = coordinator._stale_deadlines["navigation.speedOverGround"]
+    assert deadline == pytest.approx(hass.loop.time() + DEFAULT_STALE_SECONDS - 60, abs=1)
+
+    coordinator._task = Mock()
+    coordinator._set_state(ConnectionState.CONNECTED)
+    assert coordinator.warm_start is False
+    coordinator._handle_message(
+        json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [{"values": [{"path": "navigation.speedOverGround", "value": 6.0}]}],
+            }
+        ),
+        coordinator.config,
+    )
+    coordinator._schedule_flush(immediate=True)
+    assert coordinator._snapshot.pending is True
+    coordinator._task = None
+    await coordinator.async_stop()
+    stored = hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"]["data"]
+    assert stored["paths"]["navigation.speedOverGround"][0] == 6.0
+
+
+async def test_restore_snapshot_moves_stale_timer_earlier(hass, hass_storage) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    now = dt_util.utcnow()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.snapshot",
+        "data": {
+            "paths": {
+                "navigation.speedOverGround": [5.5, (now - timedelta(seconds=60)).isoformat(), "s"]
+            }
+        },
+    }
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._task = Mock()
+    coordinator._handle_message(
+        json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [{"values": [{"path": "navigation.headingTrue", "value": 1.0}]}],
+            }
+        ),
+        coordinator.config,
+    )
+    armed = coordinator._stale_unsub.when()
+
+    # The restored value is already a minute old, so it expires before the live one.
+    await coordinator.async_restore_snapshot()
+
+    assert coordinator._stale_unsub.when() == pytest.approx(armed - 60, abs=1)
+    coordinator._task = None
+    await coordinator.async_stop()
+
+
 def test_schedule_flush_immediate_resets_handle(hass) -> None:
     coordinator = SignalKCoordinator(hass, _make_entry(), Mock(), Mock(), SignalKAuthManager(None))
     coordinator.async_set_updated_data = Mock()
@@ -630,6 +1371,69 @@ def test_flush_updates_resets_handle(hass) -> None:
     coordinator.async_set_updated_data.assert_called_once()
 
 
+def test_flush_publishes_dirty_paths_and_read_only_view(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._handle_message(
+        json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [
+                    {
+                        "$source": "src1",
+                        "values": [{"path": "navigation.speedOverGround", "value": 1.2}],
+                    }
+                ],
+            }
+        ),
+        coordinator.config,
+    )
+    if coordinator._flush_handle is not None:
+        coordinator._flush_handle.cancel()
+
+    coordinator._flush_updates()
+
+    assert coordinator.changed_paths == frozenset({"navigation.speedOverGround"})
+    assert coordinator.data["navigation.speedOverGround"] == 1.2
+    with pytest.raises(TypeError):
+        coordinator.data["navigation.speedOverGround"] = 2.0
+    # The view tracks the live cache without copying it.
+    coordinator._data_cache["navigation.headingTrue"] = 0.5
+    assert coordinator.data["navigation.headingTrue"] == 0.5
+
+    coordinator._flush_updates()
+    assert coordinator.changed_paths == frozenset()
+
+
+def test_path_listeners_only_wake_for_their_path(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    calls: list[str] = []
+    remove_speed = coordinator.async_add_listener(
+        lambda: calls.append("speed"), "navigation.speedOverGround"
+    )
+    coordinator.async_add_listener(lambda: calls.append("heading"), "navigation.headingTrue")
+    coordinator.async_add_listener(lambda: calls.append("health"))
+
+    coordinator._dirty_paths.add("navigation.speedOverGround")
+    coordinator._flush_updates()
+    assert calls == ["health", "speed"]
+
+    calls.clear()
+    coordinator._schedule_flush(immediate=True, all_paths=True)
+    assert sorted(calls) == ["heading", "health", "speed"]
+
+    calls.clear()
+    remove_speed()
+    remove_speed()
+    coordinator._dirty_paths.add("navigation.speedOverGround")
+    coordinator._flush_updates()
+    assert calls == ["health"]
+    assert "navigation.speedOverGround" not in coordinator._path_listeners
+
+
 def test_handle_message_sources_only_schedules_flush(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -681,20 +1485,39 @@ def test_start_reauth_noop_when_started(hass) -> None:
 def test_schedule_stale_checks_is_idempotent(hass) -> None:
     coordinator = SignalKCoordinator(hass, _make_entry(), Mock(), Mock(), SignalKAuthManager(None))
     coordinator._schedule_stale_checks()
+    assert coordinator._stale_unsub is None
+
+    coordinator._stale_heap = [(hass.loop.time() + 60, "navigation.speedOverGround")]
+    coordinator._schedule_stale_checks()
     handle = coordinator._stale_unsub
     coordinator._schedule_stale_checks()
     assert coordinator._stale_unsub is handle
-    if handle:
-        handle.cancel()
-        coordinator._stale_unsub = None
+    handle.cancel()
+    coordinator._stale_unsub = None
 
 
-def test_stale_tick_reschedules(hass) -> None:
+def test_stale_tick_notifies_only_expired_paths(hass) -> None:
     coordinator = SignalKCoordinator(hass, _make_entry(), Mock(), Mock(), SignalKAuthManager(None))
     coordinator._schedule_flush = Mock()
     coordinator._schedule_stale_checks = Mock()
+    now = hass.loop.time()
+    coordinator._stale_deadlines = {
+        "navigation.speedOverGround": now - 1,
+        "navigation.headingTrue": now + 100,
+    }
+    # headingTrue was refreshed after its heap entry was pushed; pruned paths linger lazily.
+    coordinator._stale_heap = [
+        (now - 5, "navigation.headingTrue"),
+        (now - 2, "design.draft"),
+        (now - 1, "navigation.speedOverGround"),
+    ]
+
     coordinator._stale_tick()
+
     coordinator._schedule_flush.assert_called_once_with(immediate=True)
+    assert coordinator._dirty_paths == {"navigation.speedOverGround"}
+    assert coordinator._stale_deadlines == {"navigation.headingTrue": now + 100}
+    assert coordinator._stale_heap == [(now + 100, "navigation.headingTrue")]
     coordinator._schedule_stale_checks.assert_called_once()
 
 
@@ -706,10 +1529,41 @@ def test_stale_tick_does_not_reschedule_when_stopping(hass) -> None:
 
     coordinator._stale_tick()
 
-    coordinator._schedule_flush.assert_called_once_with(immediate=True)
+    coordinator._schedule_flush.assert_not_called()
     coordinator._schedule_stale_checks.assert_not_called()
 
 
+def test_handle_message_tracks_stale_deadlines(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    payload = json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [{"values": [{"path": "navigation.speedOverGround", "value": 1.0}]}],
+        }
+    )
+
+    coordinator._handle_message(payload, coordinator.config)
+    first = coordinator._stale_deadlines["navigation.speedOverGround"]
+    assert coordinator._stale_unsub is None
+    coordinator._task = Mock()
+    coordinator._handle_message(payload, coordinator.config)
+
+    assert coordinator._stale_deadlines["navigation.speedOverGround"] >= first
+    assert coordinator._stale_heap == [(first, "navigation.speedOverGround")]
+    assert coordinator._stale_unsub is not None
+    coordinator._stale_unsub.cancel()
+    coordinator._flush_handle.cancel()
+    # Streaming also starts the cadence review timer.
+    coordinator._cadence_unsub.cancel()
+
+    coordinator._path_interest = PathInterest(["navigation.headingTrue"])
+    coordinator._prune_uninteresting_paths()
+    assert coordinator._stale_deadlines == {}
+    assert coordinator._stale_heap == []
+
+
 async def test_run_processes_messages_and_disconnects(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -772,6 +1626,107 @@ async def test_run_processes_messages_and_disconnects(hass) -> None:
         coordinator._flush_handle = None
 
 
+async def test_run_answers_pings_and_times_pongs(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    session = Mock()
+    stop_event = asyncio.Event()
+    payload = json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [{"values": [{"path": "navigation.speedOverGround", "value": 1.2}]}],
+        }
+    )
+    coordinator = SignalKCoordinator(hass, entry, session, Mock(), SignalKAuthManager(None))
+
+    class _FakeWS:
+        def __init__(self):
+            self.closed = False
+            self.pong = AsyncMock()
+            self.timeouts: list[float] = []
+            self._messages = [
+                SimpleNamespace(type=WSMsgType.PING, data=b"server"),
+                SimpleNamespace(type=WSMsgType.TEXT, data=payload),
+                SimpleNamespace(type=WSMsgType.PONG, data=b"unsolicited"),
+                SimpleNamespace(type=WSMsgType.TEXT, data=payload),
+                SimpleNamespace(type=WSMsgType.CLOSED),
+            ]
+
+        async def receive(self, timeout=None):
+            self.timeouts.append(timeout)
+            message = self._messages.pop(0)
+            if message.type == WSMsgType.PONG:
+                # Answer a ping sent by the probe, then an unsolicited pong.
+                ping = coordinator._link.start_ping(time.monotonic())
+                coordinator._link.pong(ping, time.monotonic())
+            return message
+
+        async def send_str(self, data):
+            return None
+
+        async def close(self):
+            self.closed = True
+
+        def exception(self):
+            return None
+
+    class _WSContext:
+        def __init__(self, ws):
+            self._ws = ws
+
+        async def __aenter__(self):
+            return self._ws
+
+        async def __aexit__(self, exc_type, exc, tb):
+            stop_event.set()
+            return False
+
+    ws = _FakeWS()
+    session.ws_connect = Mock(return_value=_WSContext(ws))
+    coordinator._paths = ["navigation.speedOverGround"]
+    coordinator._periods = {"navigation.speedOverGround": 1000}
+    coordinator._stop_event = stop_event
+
+    await coordinator._run()
+
+    assert session.ws_connect.call_args.kwargs["autoping"] is False
+    assert session.ws_connect.call_args.kwargs["compress"] == 15
+    assert coordinator.transfer["payload_bytes"] == 2 * len(payload)
+    ws.pong.assert_awaited_once_with(b"server")
+    link = coordinator.link_quality
+    assert link["rtt"]["samples"] == 1
+    assert link["frame_interval"]["samples"] == 1
+    assert link["missed_pongs"] == 0
+    # Before any frame the default applies; afterwards the 1 s keepalive sets the floor.
+    assert ws.timeouts[0] == pytest.approx(45.0, abs=0.5)
+    assert ws.timeouts[-1] <= 20.0
+    if coordinator._flush_handle is not None:
+        coordinator._flush_handle.cancel()
+        coordinator._flush_handle = None
+
+
+async def test_probe_link_closes_socket_after_missed_pong(hass, monkeypatch) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    monkeypatch.setattr(coordinator_module, "PING_INTERVAL_SECONDS", 0)
+    ws = SimpleNamespace(closed=False, ping=AsyncMock())
+
+    async def _close() -> None:
+        ws.closed = True
+
+    ws.close = _close
+
+    await coordinator._probe_link(ws)
+
+    ws.ping.assert_awaited_once()
+    assert coordinator.link_quality["missed_pongs"] == 1
+    assert coordinator.last_error == "Ping timeout"
+    if coordinator._flush_handle is not None:
+        coordinator._flush_handle.cancel()
+        coordinator._flush_handle = None
+
+
 async def test_run_exits_when_stop_event_set(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -1196,6 +2151,54 @@ async def test_discovery_coordinator_discovery_failure(hass) -> None:
     assert discovery.last_refresh is not None
 
 
+async def test_discovery_cache_round_trip(hass, hass_storage) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **_make_entry().data,
+            CONF_SERVER_ID: "signalk-server-node",
+            CONF_SERVER_VERSION: "2.20.0",
+        },
+    )
+    entry.add_to_hass(hass)
+    vessel = {
+        "name": "ONA",
+        "mmsi": "261006533",
+        "navigation": {"speedOverGround": {"value": 3.2, "meta": {"units": "m/s"}}},
+    }
+    discovery = SignalKDiscoveryCoordinator(hass, entry, Mock(), SignalKAuthManager(None))
+
+    with (
+        patch(
+            "custom_components.signalk_ha.coordinator.async_fetch_discovery",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "custom_components.signalk_ha.coordinator.async_fetch_vessel_self",
+            new=AsyncMock(return_value=vessel),
+        ),
+    ):
+        result = await discovery._async_update_data()
+        assert f"{DOMAIN}.{entry.entry_id}.discovery" in hass_storage
+        # An unchanged vessel does not rewrite the cache on the next refresh.
+        with patch.object(Store, "async_save", new=AsyncMock()) as save:
+            await discovery._async_update_data()
+        save.assert_not_called()
+
+    cached = SignalKDiscoveryCoordinator(hass, entry, Mock(), SignalKAuthManager(None))
+    assert await cached.async_load_cache() is True
+    assert cached.data == result
+    assert cached.data.entities[0].conversion == result.entities[0].conversion
+    assert cached.from_cache is True
+    assert discovery.from_cache is False
+
+    # A different group selection describes different entities, so the cache is ignored.
+    hass.config_entries.async_update_entry(entry, options={CONF_GROUPS: ["navigation"]})
+    other = SignalKDiscoveryCoordinator(hass, entry, Mock(), SignalKAuthManager(None))
+    assert await other.async_load_cache() is False
+    assert other.data is None
+
+
 def test_discovery_coordinator_updates_device_registry_fields(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -1334,6 +2337,7 @@ async def test_coordinator_async_start_creates_background_task(hass, monkeypatch
     entry = _make_entry()
     mock_hass = SimpleNamespace(
         loop=hass.loop,
+        data={},
         async_create_background_task=Mock(),
         async_create_task=Mock(),
     )
@@ -1363,6 +2367,7 @@ async def test_coordinator_async_start_fallback_task(hass, monkeypatch) -> None:
     entry = _make_entry()
     mock_hass = SimpleNamespace(
         loop=hass.loop,
+        data={},
         async_create_task=Mock(),
     )
     coordinator = SignalKCoordinator(mock_hass, entry, Mock(), Mock(), SignalKAuthManager(None))
@@ -1398,6 +2403,87 @@ async def test_coordinator_async_start_noop_when_running(hass) -> None:
     assert coordinator._task is existing_task
 
 
+@pytest.mark.real_ws_start
+async def test_entries_on_same_server_share_one_connection(hass) -> None:
+    first_entry, second_entry = _make_entry(), _make_entry()
+    first_entry.add_to_hass(hass)
+    second_entry.add_to_hass(hass)
+    first = SignalKCoordinator(hass, first_entry, Mock(), Mock(), SignalKAuthManager(None))
+    second = SignalKCoordinator(hass, second_entry, Mock(), Mock(), SignalKAuthManager(None))
+
+    async def _noop_run() -> None:
+        return None
+
+    first._run = _noop_run
+    second._run = _noop_run
+
+    await first.async_start()
+    await first.async_update_paths(
+        ["navigation.speedOverGround"], {"navigation.speedOverGround": 2000}
+    )
+    ws = SimpleNamespace(send_str=AsyncMock(), closed=False, close=AsyncMock())
+    await first._send_subscribe(ws)
+    first._ws = ws
+    first._set_state(ConnectionState.CONNECTED)
+    ws.send_str.reset_mock()
+
+    await second.async_start()
+    assert second._task is None
+    assert second.connection_state == "connected"
+    assert first.shared_connection == {"entries": 2, "owner": True}
+    assert second.shared_connection == {"entries": 2, "owner": False}
+
+    # The owner widens its subscription; the faster period wins for a shared path.
+    await second.async_update_paths(
+        ["environment.depth.belowTransducer", "navigation.speedOverGround"],
+        {"navigation.speedOverGround": 1000},
+    )
+    unsubscribe, subscribe = (json.loads(call.args[0]) for call in ws.send_str.call_args_list)
+    assert [item["path"] for item in unsubscribe["unsubscribe"]] == ["navigation.speedOverGround"]
+    assert sorted((item["path"], item["period"]) for item in subscribe["subscribe"]) == [
+        ("environment.depth.belowTransducer", 5000),
+        ("navigation.speedOverGround", 1000),
+    ]
+
+    # One decode, fanned out to each entry's own paths.
+    first._handle_message(
+        json.dumps(
+            {
+                "context": "vessels.self",
+                "updates": [
+                    {
+                        "values": [
+                            {"path": "navigation.speedOverGround", "value": 3.0},
+                            {"path": "environment.depth.belowTransducer", "value": 7.5},
+                            {"path": "navigation.headingTrue", "value": 1.0},
+                        ]
+                    }
+                ],
+            }
+        ),
+        first.config,
+    )
+    assert first._data_cache == {"navigation.speedOverGround": 3.0}
+    assert second._data_cache == {
+        "navigation.speedOverGround": 3.0,
+        "environment.depth.belowTransducer": 7.5,
+    }
+    assert second.last_message is not None
+    # Traffic and link stats belong to the connection, which the owner reports.
+    assert first.transfer["payload_bytes"] > 0
+    assert second.transfer["payload_bytes"] == 0
+    assert second.counters["messages"] == 0
+    assert second.compression == first.compression
+    assert second.link_quality == first.link_quality
+
+    # Stopping the owner hands the connection to the remaining entry.
+    await first.async_stop()
+    assert second._task is not None
+    assert second.shared_connection == {"entries": 1, "owner": True}
+    await second.async_stop()
+    assert not hass.data[f"{DOMAIN}_streams"]
+
+
 async def test_coordinator_async_stop_cleans_resources(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -1426,6 +2512,43 @@ async def test_coordinator_async_stop_without_resources(hass) -> None:
     assert coordinator._ws is None
 
 
+async def test_async_update_paths_filters_and_prunes_cache(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._data_cache = {"navigation.speedOverGround": 1.0, "design.beam": 7.09}
+    coordinator._last_update_by_path = {"design.beam": dt_util.utcnow()}
+    coordinator._last_source_by_path = {"design.beam": "defaults"}
+
+    await coordinator.async_update_paths(["navigation.*", "notifications.*"])
+
+    assert coordinator._data_cache == {"navigation.speedOverGround": 1.0}
+    assert coordinator._last_update_by_path == {}
+    assert coordinator._last_source_by_path == {}
+
+    payload = json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [
+                {
+                    "$source": "src1",
+                    "values": [
+                        {"path": "navigation.headingTrue", "value": 1.0},
+                        {"path": "design.draft", "value": {"maximum": 1.25}},
+                    ],
+                }
+            ],
+        }
+    )
+    coordinator._handle_message(payload, coordinator.config)
+    assert "design.draft" not in coordinator._data_cache
+    assert "design.draft" not in coordinator._last_source_by_path
+    assert coordinator._data_cache["navigation.headingTrue"] == 1.0
+    if coordinator._flush_handle is not None:
+        coordinator._flush_handle.cancel()
+        coordinator._flush_handle = None
+
+
 async def test_async_update_paths_no_change(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
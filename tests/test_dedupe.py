@@ -0,0 +1,137 @@
+import json
+
+from custom_components.signalk_ha.dedupe import (
+    NotificationDedupe,
+    NotificationRateLimiter,
+    notification_signature,
+    value_signature,
+)
+
+
+def _signature(state: str) -> tuple:
+    return notification_signature({"state": state}, state, "anchor", None, "anchoralarm")
+
+
+def test_value_signature_scalar_value() -> None:
+    assert value_signature(42) == value_signature(42)
+    assert value_signature(None) == value_signature(None)
+    assert value_signature(None) != value_signature("None")
+
+
+def test_value_signature_keeps_json_types_apart() -> None:
+    assert value_signature({"v": 1}) != value_signature({"v": True})
+    assert value_signature({"v": 1}) != value_signature({"v": 1.0})
+    assert value_signature(1) != value_signature(True)
+    assert value_signature([0]) != value_signature([False])
+    # A string scalar never collides with the canonical JSON of a nested value.
+    nested = {"data": {"a": 1}}
+    assert value_signature(json.dumps(nested, sort_keys=True)) != value_signature(nested)
+
+
+def test_value_signature_flat_object_ignores_key_order() -> None:
+    first = {"state": "alarm", "method": ["visual", "sound"], "message": "Anchor"}
+    second = {"message": "Anchor", "state": "alarm", "method": ["visual", "sound"]}
+    assert value_signature(first) == value_signature(second)
+    assert isinstance(value_signature(first), frozenset)
+    assert value_signature(first) != value_signature({**first, "method": ["visual"]})
+
+
+def test_value_signature_nested_value_uses_canonical_json() -> None:
+    first = {"state": "alert", "data": {"b": 1, "a": [1, 2]}}
+    second = {"data": {"a": [1, 2], "b": 1}, "state": "alert"}
+    assert value_signature(first) == value_signature(second)
+    assert isinstance(value_signature(first), str)
+
+
+def test_value_signature_handles_bad_keys() -> None:
+    value = {"data": {("bad",): "data"}}
+    assert value_signature(value) == repr(value)
+
+
+def test_dedupe_suppresses_same_timestamp() -> None:
+    dedupe = NotificationDedupe(8)
+    stamp = "2026-01-03T22:34:57.853Z"
+    assert not dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 0.0)
+    assert dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 100.0)
+    # A state change always fires, even with the same timestamp.
+    assert not dedupe.is_duplicate("notifications.a", _signature("alarm"), stamp, 100.0)
+
+
+def test_dedupe_without_timestamp_uses_window() -> None:
+    dedupe = NotificationDedupe(8, window=5.0)
+    assert not dedupe.is_duplicate("notifications.a", _signature("alert"), None, 0.0)
+    assert dedupe.is_duplicate("notifications.a", _signature("alert"), None, 4.0)
+    assert not dedupe.is_duplicate("notifications.a", _signature("alert"), None, 6.0)
+    assert dedupe.as_dict(6.0)["suppressed"] == 1
+
+
+def test_dedupe_evicts_least_recently_seen_path() -> None:
+    dedupe = NotificationDedupe(2)
+    stamp = "2026-01-03T22:34:57.853Z"
+    dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 0.0)
+    dedupe.is_duplicate("notifications.b", _signature("alert"), stamp, 1.0)
+    # Touching "a" makes "b" the least recently seen entry.
+    assert dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 2.0)
+    dedupe.is_duplicate("notifications.c", _signature("alert"), stamp, 3.0)
+
+    assert len(dedupe) == 2
+    assert dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 4.0)
+    assert not dedupe.is_duplicate("notifications.b", _signature("alert"), stamp, 5.0)
+    assert dedupe.as_dict(5.0)["lru_evictions"] == 2
+
+
+def test_dedupe_expires_idle_paths() -> None:
+    dedupe = NotificationDedupe(8, ttl=60.0)
+    stamp = "2026-01-03T22:34:57.853Z"
+    dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 0.0)
+    dedupe.is_duplicate("notifications.b", _signature("alert"), stamp, 30.0)
+
+    assert dedupe.as_dict(70.0) == {
+        "size": 1,
+        "max_size": 8,
+        "ttl_seconds": 60.0,
+        "suppressed": 0,
+        "lru_evictions": 0,
+        "ttl_evictions": 1,
+    }
+    assert not dedupe.is_duplicate("notifications.a", _signature("alert"), stamp, 71.0)
+
+
+def test_rate_limiter_allows_burst_then_refill_rate() -> None:
+    limiter = NotificationRateLimiter(6, 2, 8)  # one token every 10 seconds
+    assert limiter.allow("notifications.a", "alert", 0.0)
+    assert limiter.allow("notifications.a", "alert", 0.1)
+    assert not limiter.allow("notifications.a", "alert", 0.2)
+    assert limiter.allow("notifications.a", "alert", 10.2)
+    assert not limiter.allow("notifications.a", "alert", 10.3)
+    assert limiter.as_dict()["limited"] == 2
+
+
+def test_rate_limiter_always_passes_state_changes() -> None:
+    limiter = NotificationRateLimiter(6, 1, 8)
+    assert limiter.allow("notifications.a", "normal", 0.0)
+    assert not limiter.allow("notifications.a", "normal", 0.1)
+    assert limiter.allow("notifications.a", "alarm", 0.2)
+    assert limiter.allow("notifications.a", "normal", 0.3)
+    # Other paths have their own buckets.
+    assert limiter.allow("notifications.b", "normal", 0.3)
+
+
+def test_rate_limiter_passes_changed_message_with_same_state() -> None:
+    limiter = NotificationRateLimiter(6, 1, 8)
+    assert limiter.allow("notifications.a", ("alarm", "Depth 3 m", ["sound"]), 0.0)
+    assert not limiter.allow("notifications.a", ("alarm", "Depth 3 m", ["sound"]), 0.1)
+    assert limiter.allow("notifications.a", ("alarm", "Depth 2 m", ["sound"]), 0.2)
+    assert limiter.allow("notifications.a", ("alarm", "Depth 2 m", ["visual"]), 0.3)
+
+
+def test_rate_limiter_disabled_and_bounded() -> None:
+    disabled = NotificationRateLimiter(0, 1, 8)
+    assert all(disabled.allow("notifications.a", "alert", 0.0) for _ in range(10))
+
+    limiter = NotificationRateLimiter(6, 1, 2)
+    for name in ("a", "b", "c"):
+        limiter.allow(f"notifications.{name}", "alert", 0.0)
+    assert limiter.as_dict()["tracked_paths"] == 2
+    # The evicted path starts over with a full bucket.
+    assert limiter.allow("notifications.a", "alert", 0.1)
@@ -34,6 +34,20 @@ async def test_diagnostics_redacts_urls(hass) -> None:
         connection_state="connected",
         last_error=None,
         counters={"messages": 0, "parse_errors": 0, "reconnects": 0},
+        coalescing={"window_seconds": 0.1, "flush_rate_per_second": 0.0},
+        ingest_rates={"messages": {"1m": 0.0, "15m": 0.0, "1h": 0.0}},
+        top_paths=lambda: [],
+        top_sources=lambda: [],
+        latency={},
+        notification_dedupe={"size": 0},
+        notification_rate_limit={"limited": 0},
+        ais={"enabled": False},
+        shared_connection={"entries": 1, "owner": True},
+        link_quality={"missed_pongs": 0},
+        transfer={"payload_bytes": 0},
+        subscription_plan={"paths": 0},
+        learned_periods={"enabled": True},
+        offload={"active": False},
         reconnect_count=0,
         last_message=None,
         last_update_by_path={},
@@ -42,7 +56,7 @@ async def test_diagnostics_redacts_urls(hass) -> None:
         notification_count=0,
         last_notification=None,
     )
-    discovery = SimpleNamespace(conflicts=[], last_refresh=None)
+    discovery = SimpleNamespace(conflicts=[], last_refresh=None, from_cache=False)
     auth = SignalKAuthManager("token123")
     auth.mark_success()
     entry.runtime_data = SignalKRuntimeData(
@@ -58,6 +72,18 @@ async def test_diagnostics_redacts_urls(hass) -> None:
     assert diagnostics["last_update_by_path"] == {}
     assert diagnostics["notifications"]["count"] == 0
     assert diagnostics["notifications"]["last"] is None
+    assert diagnostics["notifications"]["dedupe"] == {"size": 0}
+    assert diagnostics["notifications"]["rate_limit"] == {"limited": 0}
+    assert diagnostics["ais"] == {"enabled": False}
+    assert diagnostics["shared_connection"] == {"entries": 1, "owner": True}
+    assert diagnostics["link"] == {"missed_pongs": 0}
+    assert diagnostics["transfer"] == {"payload_bytes": 0}
+    assert diagnostics["subscription_plan"] == {"paths": 0}
+    assert diagnostics["learned_periods"] == {"enabled": True}
+    assert diagnostics["json_codec"]["backend"] in ("orjson", "msgspec", "json")
+    assert diagnostics["coalescing"]["window_seconds"] == 0.1
+    assert diagnostics["ingest_rates_per_second"]["messages"]["1m"] == 0.0
+    assert diagnostics["top_paths"] == []
     assert diagnostics["config"]["server_id"] == "signalk-server-node"
     assert diagnostics["config"]["server_version"] == "2.19.0"
 
@@ -95,6 +121,20 @@ async def test_diagnostics_handles_none_timestamps(hass) -> None:
         connection_state="connected",
         last_error=None,
         counters={"messages": 0, "parse_errors": 0, "reconnects": 0},
+        coalescing={"window_seconds": 0.1, "flush_rate_per_second": 0.0},
+        ingest_rates={"messages": {"1m": 0.0, "15m": 0.0, "1h": 0.0}},
+        top_paths=lambda: [],
+        top_sources=lambda: [],
+        latency={},
+        notification_dedupe={"size": 0},
+        notification_rate_limit={"limited": 0},
+        ais={"enabled": False},
+        shared_connection={"entries": 1, "owner": True},
+        link_quality={"missed_pongs": 0},
+        transfer={"payload_bytes": 0},
+        subscription_plan={"paths": 0},
+        learned_periods={"enabled": True},
+        offload={"active": False},
         reconnect_count=0,
         last_message=None,
         last_update_by_path={"navigation.speedOverGround": None},
@@ -103,7 +143,7 @@ async def test_diagnostics_handles_none_timestamps(hass) -> None:
         notification_count=0,
         last_notification=None,
     )
-    discovery = SimpleNamespace(conflicts=[], last_refresh=None)
+    discovery = SimpleNamespace(conflicts=[], last_refresh=None, from_cache=False)
     entry.runtime_data = SignalKRuntimeData(
         coordinator=coordinator,
         discovery=discovery,
@@ -132,6 +172,20 @@ async def test_diagnostics_last_notification(hass) -> None:
         connection_state="connected",
         last_error=None,
         counters={"messages": 0, "parse_errors": 0, "reconnects": 0},
+        coalescing={"window_seconds": 0.1, "flush_rate_per_second": 0.0},
+        ingest_rates={"messages": {"1m": 0.0, "15m": 0.0, "1h": 0.0}},
+        top_paths=lambda: [],
+        top_sources=lambda: [],
+        latency={},
+        notification_dedupe={"size": 0},
+        notification_rate_limit={"limited": 0},
+        ais={"enabled": False},
+        shared_connection={"entries": 1, "owner": True},
+        link_quality={"missed_pongs": 0},
+        transfer={"payload_bytes": 0},
+        subscription_plan={"paths": 0},
+        learned_periods={"enabled": True},
+        offload={"active": False},
         reconnect_count=0,
         last_message=None,
         last_update_by_path={},
@@ -145,7 +199,7 @@ async def test_diagnostics_last_notification(hass) -> None:
             "received_at": dt_util.utcnow(),
         },
     )
-    discovery = SimpleNamespace(conflicts=[], last_refresh=None)
+    discovery = SimpleNamespace(conflicts=[], last_refresh=None, from_cache=False)
     entry.runtime_data = SignalKRuntimeData(
         coordinator=coordinator,
         discovery=discovery,
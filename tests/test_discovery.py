@@ -38,6 +38,10 @@ def test_discovery_result_indexes() -> None:
     result = discover_entities(data, scopes=("navigation",))
     assert "navigation.speedOverGround" in result.paths
     assert ("navigation.position", "geo_location") in result.path_kinds
+    assert result.periods.keys() == result.paths
+    assert all(period > 0 for period in result.periods.values())
+    assert result.plans.keys() == result.paths
+    assert all(plan.min_period <= plan.period for plan in result.plans.values())
 
 
 def test_discovery_walks_children_when_value_present() -> None:
@@ -1,12 +1,15 @@
 import time
 from datetime import timedelta
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
+import pytest
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.signalk_ha.ais import AisTargets
 from custom_components.signalk_ha.auth import SignalKAuthManager
 from custom_components.signalk_ha.const import (
     CONF_BASE_URL,
@@ -24,6 +27,7 @@ from custom_components.signalk_ha.const import (
 from custom_components.signalk_ha.coordinator import ConnectionState, SignalKCoordinator
 from custom_components.signalk_ha.discovery import DiscoveredEntity, DiscoveryResult
 from custom_components.signalk_ha.geo_location import (
+    SignalKAisTargetGeolocation,
     SignalKPositionGeolocation,
     _coord_distance,
     _is_stale,
@@ -32,6 +36,7 @@ from custom_components.signalk_ha.geo_location import (
     _position_spec_known,
     _registry_has_geolocation,
     _should_create_geolocation,
+    _SignalKAisListener,
     _SignalKDiscoveryListener,
 )
 from custom_components.signalk_ha.runtime import SignalKRuntimeData
@@ -679,3 +684,65 @@ def test_geo_location_should_write_state_when_coords_cleared() -> None:
     geo._last_write = time.monotonic() - (DEFAULT_MIN_UPDATE_MS / 1000.0)
 
     assert geo._should_write_state(None, True) is True
+
+
+def test_ais_listener_creates_entities_lazily_and_removes_expired(hass) -> None:
+    entry = _make_entry()
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._state = ConnectionState.CONNECTED
+    coordinator._ais = AisTargets(10, 600.0)
+    coordinator.data = {"navigation.position": {"latitude": 60.0, "longitude": 25.0}}
+    context = "vessels.urn:mrn:imo:mmsi:222222222"
+    async_add = Mock()
+    listener = _SignalKAisListener(coordinator, async_add)
+
+    coordinator._ais.update({context: {"navigation.speedOverGround": 5.0}}, 0.0, dt_util.utcnow())
+    listener.handle_targets([context], [])
+    async_add.assert_not_called()
+
+    position = {"latitude": 60.01, "longitude": 25.0}
+    coordinator._ais.update({context: {"navigation.position": position}}, 1.0, dt_util.utcnow())
+    listener.handle_targets([context], [])
+    listener.handle_targets([context], [])
+    async_add.assert_called_once()
+    entity = async_add.call_args.args[0][0]
+    assert isinstance(entity, SignalKAisTargetGeolocation)
+    assert entity.name == "AIS 222222222"
+    assert entity.available is True
+    assert (entity.latitude, entity.longitude) == (60.01, 25.0)
+    assert entity.distance == pytest.approx(1.112, abs=0.001)
+    attributes = entity.state_attributes
+    assert attributes["mmsi"] == "222222222"
+    assert attributes["navigation.speedOverGround"] == 5.0
+    assert "last_seen" in attributes
+
+    entity.hass = Mock()
+    listener.handle_targets([], [context])
+    entity.hass.async_create_task.assert_called_once()
+    entity.hass.async_create_task.call_args.args[0].close()
+
+
+async def test_ais_listener_removes_target_gone_before_entity_added(hass, monkeypatch) -> None:
+    entry = _make_entry()
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._ais = AisTargets(10, 600.0)
+    context = "vessels.urn:mrn:imo:mmsi:222222222"
+    position = {"latitude": 60.01, "longitude": 25.0}
+    coordinator._ais.update({context: {"navigation.position": position}}, 0.0, dt_util.utcnow())
+    async_add = Mock()
+    listener = _SignalKAisListener(coordinator, async_add)
+    listener.handle_targets([context], [])
+    entity = async_add.call_args.args[0][0]
+
+    # Evicted and back again before the platform added the entity: it is kept.
+    listener.handle_targets([], [context])
+    listener.handle_targets([context], [])
+    async_add.assert_called_once()
+
+    # Evicted for good: the entity removes itself once it is added.
+    listener.handle_targets([], [context])
+    monkeypatch.setattr(CoordinatorEntity, "async_added_to_hass", AsyncMock())
+    entity.hass = Mock()
+    await entity.async_added_to_hass()
+    entity.hass.async_create_task.assert_called_once()
+    entity.hass.async_create_task.call_args.args[0].close()
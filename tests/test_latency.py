@@ -0,0 +1,50 @@
+from custom_components.signalk_ha.latency import (
+    LatencyTracker,
+    parse_server_timestamp,
+    path_group,
+)
+
+
+def test_path_group() -> None:
+    assert path_group("navigation.speedOverGround") == "navigation"
+    assert path_group("design") == "design"
+
+
+def test_parse_server_timestamp() -> None:
+    assert parse_server_timestamp("1970-01-01T00:00:01.500Z") == 1.5
+    assert parse_server_timestamp("2026-01-03T22:34:57") is None
+    assert parse_server_timestamp("not a time") is None
+
+
+def test_latency_tracker_percentiles() -> None:
+    tracker = LatencyTracker(samples=100)
+    assert tracker.summary("network") is None
+    assert tracker.as_dict() == {}
+
+    for index in range(1, 101):
+        tracker.record("network", "navigation", index / 1000.0)
+    tracker.record("network", "environment", 1.0)
+
+    assert tracker.summary("network", "navigation") == {
+        "count": 100,
+        "p50": 50.0,
+        "p95": 95.0,
+        "p99": 99.0,
+    }
+    overall = tracker.summary("network")
+    assert overall["count"] == 101
+    assert overall["p99"] == 100.0
+    assert tracker.summary("network", "tanks") is None
+
+    summary = tracker.as_dict()
+    assert set(summary["network"]) == {"navigation", "environment", "all"}
+
+
+def test_latency_tracker_keeps_recent_samples() -> None:
+    tracker = LatencyTracker(samples=2)
+    tracker.record("decode", "all", 10.0)
+    tracker.record("decode", "all", 0.001)
+    tracker.record("decode", "all", 0.002)
+    assert tracker.as_dict() == {
+        "decode": {"all": {"count": 2, "p50": 1.0, "p95": 2.0, "p99": 2.0}}
+    }
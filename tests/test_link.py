@@ -0,0 +1,56 @@
+import pytest
+
+from custom_components.signalk_ha.link import DEFAULT_INACTIVITY_SECONDS, LinkQuality
+
+
+def test_rtt_is_smoothed_with_jitter() -> None:
+    link = LinkQuality()
+    for sent, received in ((0.0, 0.1), (20.0, 20.1), (40.0, 40.5)):
+        link.pong(link.start_ping(sent), received)
+
+    rtt = link.as_dict(None)["rtt"]
+    assert rtt["samples"] == 3
+    assert rtt["last_ms"] == 500.0
+    # One slow pong moves the mean by an eighth of the difference.
+    assert rtt["mean_ms"] == pytest.approx(150.0)
+    assert rtt["jitter_ms"] > 0
+
+
+def test_unmatched_pong_is_ignored_and_missed_pong_counted() -> None:
+    link = LinkQuality()
+    link.start_ping(0.0)
+    link.pong(b"other", 0.1)
+    assert link.rtt.samples == 0
+
+    assert link.start_ping(20.0) is None
+    assert link.missed_pongs == 1
+    # The next interval starts a fresh ping.
+    assert link.start_ping(40.0) is not None
+
+
+def test_frame_gaps_reset_per_connection() -> None:
+    link = LinkQuality()
+    link.frame(0.0)
+    link.frame(1.0)
+    link.reset_connection()
+    link.frame(100.0)
+    assert link.frames.samples == 1
+    assert link.frames.mean == 1.0
+
+
+def test_inactivity_timeout_follows_keepalive_and_observed_gaps() -> None:
+    link = LinkQuality()
+    assert link.inactivity_timeout(5.0) == DEFAULT_INACTIVITY_SECONDS
+    for index in range(20):
+        link.frame(index * 0.1)
+    assert link.inactivity_timeout(None) == DEFAULT_INACTIVITY_SECONDS
+    # Fast frames and a 5 s keepalive hit the floor; slow periods raise it up to the cap.
+    assert link.inactivity_timeout(5.0) == 20.0
+    assert link.inactivity_timeout(30.0) == pytest.approx(90.0, abs=0.5)
+    assert link.inactivity_timeout(600.0) == 180.0
+
+    slow = LinkQuality()
+    for index in range(20):
+        slow.frame(index * 10.0)
+    # A server sending less often than its keepalive promises widens the timeout.
+    assert slow.inactivity_timeout(5.0) >= 30.0
@@ -1,11 +1,22 @@
 import json
+import threading
+from dataclasses import replace
+
+import pytest
 
 from custom_components.signalk_ha.parser import (
+    ContextMatcher,
+    DecodedBatch,
+    DecodedDelta,
+    PathInterest,
     _context_matches,
+    decode_delta,
+    decode_frames,
     extract_notifications,
     extract_sources,
     extract_values,
     parse_delta_text,
+    peek_context,
 )
 
 
@@ -290,3 +301,426 @@ def test_extract_notifications_skips_invalid_entries() -> None:
     assert extract_notifications(payload, None) == [
         {"path": "notifications.navigation.anchor", "value": 1}
     ]
+
+
+def test_decode_delta_splits_values_sources_and_notifications() -> None:
+    payload = {
+        "context": "vessels.self",
+        "updates": [
+            {
+                "$source": "src1",
+                "timestamp": "2026-01-03T22:34:57.853Z",
+                "values": [
+                    {"path": "navigation.speedOverGround", "value": 1.2},
+                    {
+                        "path": "navigation.headingTrue",
+                        "value": 3.4,
+                        "$source": "src2",
+                        "timestamp": "2026-01-03T22:35:00.000Z",
+                    },
+                    {"path": "navigation.courseOverGroundTrue", "$source": "src3"},
+                    {"path": "notifications.navigation.anchor", "value": {"state": "alert"}},
+                ],
+            }
+        ],
+    }
+
+    decoded = decode_delta(payload, ["vessels.self"])
+
+    assert decoded.values == {
+        "navigation.speedOverGround": 1.2,
+        "navigation.headingTrue": 3.4,
+    }
+    assert decoded.sources == {
+        "navigation.speedOverGround": "src1",
+        "navigation.headingTrue": "src2",
+        "navigation.courseOverGroundTrue": "src3",
+    }
+    assert decoded.timestamps == {
+        "navigation.speedOverGround": "2026-01-03T22:34:57.853Z",
+        "navigation.headingTrue": "2026-01-03T22:35:00.000Z",
+    }
+    assert decoded.notifications == [
+        {
+            "path": "notifications.navigation.anchor",
+            "value": {"state": "alert"},
+            "source": "src1",
+            "timestamp": "2026-01-03T22:34:57.853Z",
+        }
+    ]
+
+
+def test_decode_delta_rejects_invalid_input() -> None:
+    assert decode_delta([], None) == DecodedDelta()
+    assert decode_delta({"updates": "nope"}, None) == DecodedDelta()
+    payload = {"context": "vessels.other", "updates": [{"values": [{"path": "p", "value": 1}]}]}
+    assert decode_delta(payload, ["vessels.self"]) == DecodedDelta()
+
+
+def test_decode_delta_skips_value_less_notifications() -> None:
+    payload = {"updates": [{"values": [{"path": "notifications.x", "$source": "src"}]}]}
+    decoded = decode_delta(payload, None)
+    assert decoded.notifications == []
+    assert decoded.sources == {}
+
+
+def test_context_matcher_agrees_with_context_matches() -> None:
+    expected = ["vessels.self", "vessels.mmsi:261006533", "mmsi:261006533", "urn:mrn:x:1"]
+    matcher = ContextMatcher(expected)
+    for incoming in (
+        "vessels.self",
+        "vessels.urn:mrn:imo:mmsi:261006533",
+        "vessels.urn:mrn:x:1",
+        "vessels.mmsi:261006533",
+        "aircraft.urn:mrn:imo:mmsi:111",
+        "vessels.other",
+    ):
+        legacy = any(_context_matches(context, incoming) for context in expected)
+        assert matcher.matches(incoming) is legacy
+
+
+def test_context_matcher_caches_and_bounds_verdicts() -> None:
+    matcher = ContextMatcher(["vessels.urn:mrn:imo:mmsi:1"], cache_size=2)
+    assert matcher.matches("vessels.urn:mrn:imo:mmsi:1") is True
+    assert matcher.matches("vessels.urn:mrn:imo:mmsi:2") is False
+    assert matcher.matches("vessels.urn:mrn:imo:mmsi:2") is False
+    assert matcher.cache_size == 2
+    assert matcher.matches("vessels.urn:mrn:imo:mmsi:3") is False
+    assert matcher.cache_size == 2
+
+
+def test_verdict_caches_evict_safely_across_threads() -> None:
+    # The decode worker and the event loop fill the same caches concurrently.
+    matcher = ContextMatcher(["vessels.self"], cache_size=8, self_urn_fallback=False)
+    interest = PathInterest(["navigation.*"], cache_size=8)
+    errors: list[Exception] = []
+
+    def _hammer(offset: int) -> None:
+        try:
+            for index in range(5000):
+                matcher.matches(f"vessels.urn:mrn:imo:mmsi:{offset}{index}")
+                interest.matches(f"navigation.path{offset}.{index}")
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=_hammer, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert matcher.cache_size <= 8
+
+
+def test_context_matcher_edge_cases() -> None:
+    assert ContextMatcher(None).matches("vessels.other") is True
+    assert ContextMatcher([""]).matches("vessels.other") is True
+    matcher = ContextMatcher(["vessels.self"])
+    assert matcher.expected_contexts == ("vessels.self",)
+    assert matcher.matches(None) is True
+    assert matcher.matches(123) is False
+    assert matcher.matches(["vessels.self"]) is False
+
+
+def test_decode_delta_accepts_context_matcher() -> None:
+    matcher = ContextMatcher(["vessels.self"])
+    payload = {"context": "vessels.other", "updates": [{"values": [{"path": "p", "value": 1}]}]}
+    assert decode_delta(payload, matcher) == DecodedDelta()
+    payload["context"] = "vessels.self"
+    assert decode_delta(payload, matcher).values == {"p": 1}
+
+
+def test_peek_context() -> None:
+    assert peek_context('{"context":"vessels.self","updates":[]}') == "vessels.self"
+    assert peek_context('{"updates":[],"context":"vessels.self"}') is None
+    assert peek_context('{"context":"vessels.self') is None
+    assert peek_context('{"context":"vessels.\\"x","updates":[]}') is None
+
+
+def test_path_interest_exact_and_wildcards() -> None:
+    interest = PathInterest(
+        ["navigation.speedOverGround", "tanks.*.currentLevel", "environment.wind.*", ""]
+    )
+    assert interest.patterns == (
+        "environment.wind.*",
+        "navigation.speedOverGround",
+        "tanks.*.currentLevel",
+    )
+    assert interest.matches("navigation.speedOverGround") is True
+    assert interest.matches("navigation.speedThroughWater") is False
+    assert interest.matches("tanks.fuel.currentLevel") is True
+    assert interest.matches("tanks.fuel.capacity") is False
+    assert interest.matches("tanks.fuel.0.currentLevel") is False
+    assert interest.matches("environment.wind.speedApparent") is True
+    assert interest.matches("environment.wind.gust.max") is True
+    assert interest.matches("environment.wind") is False
+    # Repeated lookups come from the verdict cache.
+    assert interest.matches("tanks.fuel.currentLevel") is True
+
+
+def test_path_interest_prefers_exact_branch_before_wildcard() -> None:
+    interest = PathInterest(["a.b.c", "a.*.d"], cache_size=1)
+    assert interest.matches("a.b.d") is True
+    assert interest.matches("a.x.d") is True
+    assert interest.matches("a.b.e") is False
+
+
+def test_path_interest_without_wildcards_skips_trie() -> None:
+    interest = PathInterest(["navigation.position"])
+    assert interest.matches("navigation.position") is True
+    assert interest.matches("navigation.log") is False
+
+
+def test_decode_delta_skips_uninteresting_paths() -> None:
+    payload = {
+        "updates": [
+            {
+                "$source": "src",
+                "values": [
+                    {"path": "navigation.speedOverGround", "value": 1.2},
+                    {"path": "design.beam", "value": 7.09},
+                    {"path": "notifications.navigation.anchor", "value": {"state": "alarm"}},
+                ],
+            }
+        ]
+    }
+    decoded = decode_delta(payload, None, PathInterest(["navigation.*"]))
+    assert decoded.values == {"navigation.speedOverGround": 1.2}
+    assert decoded.sources == {"navigation.speedOverGround": "src"}
+    # Notifications keep their own routing regardless of the value interest set.
+    assert [n["path"] for n in decoded.notifications] == ["notifications.navigation.anchor"]
+
+
+def test_decode_frames_merges_latest_value_per_path() -> None:
+    frames = [
+        (
+            json.dumps(
+                {
+                    "context": "vessels.self",
+                    "updates": [
+                        {
+                            "$source": "src1",
+                            "timestamp": "2026-01-03T22:34:57.000Z",
+                            "values": [
+                                {"path": "navigation.speedOverGround", "value": 1.0},
+                                {"path": "navigation.headingTrue", "value": 0.1},
+                            ],
+                        }
+                    ],
+                }
+            ),
+            10.0,
+        ),
+        ('{"context":"vessels.urn:mrn:imo:mmsi:111111111","updates":[]}', 10.5),
+        ("not json", 10.7),
+        (
+            json.dumps(
+                {
+                    "context": "vessels.self",
+                    "updates": [
+                        {
+                            "$source": "src2",
+                            "timestamp": "2026-01-03T22:34:58.000Z",
+                            "values": [
+                                {"path": "navigation.speedOverGround", "value": 2.0},
+                                {
+                                    "path": "notifications.mob",
+                                    "value": {"state": "alarm", "message": "MOB"},
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ),
+            11.0,
+        ),
+    ]
+
+    batch = decode_frames(frames, ContextMatcher(["vessels.self"]))
+
+    assert batch.frames == 4
+    assert batch.size == sum(len(text) for text, _ in frames)
+    assert batch.parse_errors == 1
+    assert batch.first_received == 10.0
+    assert batch.decoded_at > 0
+    assert batch.values == {"navigation.speedOverGround": 2.0, "navigation.headingTrue": 0.1}
+    assert batch.sources["navigation.speedOverGround"] == "src2"
+    assert batch.timestamps["navigation.speedOverGround"] == "2026-01-03T22:34:58.000Z"
+    assert batch.received == {"navigation.speedOverGround": 11.0, "navigation.headingTrue": 10.0}
+    assert batch.value_paths == [
+        "navigation.speedOverGround",
+        "navigation.headingTrue",
+        "navigation.speedOverGround",
+    ]
+    assert [item["path"] for item in batch.notifications] == ["notifications.mob"]
+
+
+def test_decode_frames_counts_collapsed_values_and_dropped_frames() -> None:
+    def _frame(values: list[dict]) -> tuple[str, float]:
+        return json.dumps({"context": "vessels.self", "updates": [{"values": values}]}), 1.0
+
+    speed = "navigation.speedOverGround"
+    frames = [
+        _frame([{"path": speed, "value": 1.0}, {"path": "navigation.headingTrue", "value": 0.1}]),
+        _frame([{"path": speed, "value": 2.0}]),
+        _frame([{"path": "notifications.mob", "value": {"state": "alarm"}}]),
+        _frame([{"path": speed, "value": 3.0}]),
+    ]
+
+    batch = decode_frames(frames, None)
+
+    assert batch.values[speed] == 3.0
+    assert batch.collapsed == 2
+    # The second frame only carried a value that the fourth overwrote.
+    assert batch.dropped == 1
+    assert len(batch.notifications) == 1
+
+
+def test_decode_frames_collects_target_values_per_context() -> None:
+    own = "vessels.urn:mrn:imo:mmsi:261006533"
+    other = "vessels.urn:mrn:imo:mmsi:222222222"
+
+    def _frame(context: str, values: list[dict], peekable: bool = True) -> tuple[str, float]:
+        delta = {"context": context, "updates": [{"values": values}]}
+        if not peekable:
+            delta = {"updates": delta["updates"], "context": context}
+        return json.dumps(delta), 1.0
+
+    position = {"latitude": 60.1, "longitude": 24.9}
+    frames = [
+        _frame(own, [{"path": "navigation.speedOverGround", "value": 3.0}]),
+        _frame(
+            other,
+            [
+                {"path": "navigation.position", "value": position},
+                {"path": "navigation.headingTrue", "value": 1.0},
+                {"path": "notifications.cpa", "value": {"state": "alarm"}},
+            ],
+        ),
+        _frame(other, [{"path": "navigation.speedOverGround", "value": 5.0}], peekable=False),
+    ]
+    matcher = ContextMatcher(["vessels.self", own], self_urn_fallback=False)
+    targets = PathInterest(["navigation.position", "navigation.speedOverGround"])
+
+    batch = decode_frames(frames, matcher, None, targets)
+
+    assert batch.values == {"navigation.speedOverGround": 3.0}
+    assert batch.targets == {
+        other: {"navigation.position": position, "navigation.speedOverGround": 5.0}
+    }
+    assert batch.notifications == []
+    # Without targets, other vessels are dropped as before.
+    assert decode_frames(frames, matcher).targets == {}
+
+
+def test_context_matcher_without_self_urn_fallback() -> None:
+    loose = ContextMatcher(["vessels.self"])
+    strict = ContextMatcher(["vessels.self"], self_urn_fallback=False)
+    assert loose.matches("vessels.urn:mrn:imo:mmsi:222222222") is True
+    assert strict.matches("vessels.urn:mrn:imo:mmsi:222222222") is False
+    assert strict.matches("vessels.self") is True
+
+
+def test_decode_frames_drops_superseded_timestamp() -> None:
+    speed = "navigation.speedOverGround"
+
+    def _frame(update: dict) -> tuple[str, float]:
+        return json.dumps({"context": "vessels.self", "updates": [update]}), 1.0
+
+    frames = [
+        _frame(
+            {
+                "timestamp": "2024-01-01T00:00:00.000Z",
+                "values": [
+                    {"path": speed, "value": 1},
+                    {"path": "navigation.headingTrue", "value": 0.1},
+                ],
+            }
+        ),
+        _frame({"values": [{"path": speed, "value": 2}]}),
+    ]
+
+    batch = decode_frames(frames, None)
+
+    # The newer value carried no timestamp, so it must not keep the older frame's one.
+    assert batch.values[speed] == 2
+    assert speed not in batch.timestamps
+    assert batch.timestamps["navigation.headingTrue"] == "2024-01-01T00:00:00.000Z"
+
+
+def test_decode_frames_empty_batch() -> None:
+    batch = decode_frames([], None)
+    assert batch.frames == 0
+    assert batch.first_received is None
+    assert batch.values == {}
+
+
+def test_decoded_batch_restrict_keeps_only_requested_paths() -> None:
+    other = "vessels.urn:mrn:imo:mmsi:222222222"
+    batch = DecodedBatch(
+        frames=2,
+        values={"navigation.speedOverGround": 3.0, "environment.depth.belowTransducer": 7.5},
+        sources={"navigation.speedOverGround": "gps", "environment.depth.belowTransducer": "st"},
+        timestamps={"navigation.speedOverGround": "2026-01-03T22:34:57Z"},
+        received={"navigation.speedOverGround": 1.0, "environment.depth.belowTransducer": 1.0},
+        notifications=[{"path": "notifications.mob"}],
+        value_paths=["navigation.speedOverGround", "environment.depth.belowTransducer"],
+        first_received=1.0,
+        targets={other: {"navigation.position": {"latitude": 1.0}, "navigation.headingTrue": 1}},
+    )
+
+    restricted = batch.restrict(
+        PathInterest(["navigation.*"]), PathInterest(["navigation.headingTrue"])
+    )
+
+    assert restricted.values == {"navigation.speedOverGround": 3.0}
+    assert restricted.sources == {"navigation.speedOverGround": "gps"}
+    assert restricted.received == {"navigation.speedOverGround": 1.0}
+    assert restricted.value_paths == ["navigation.speedOverGround"]
+    assert restricted.targets == {other: {"navigation.headingTrue": 1}}
+    assert restricted.notifications == batch.notifications
+    assert restricted.frames == 2
+    assert restricted.first_received == 1.0
+    # Without filters everything but the other-vessel values is passed through.
+    unfiltered = batch.restrict(None, None)
+    assert unfiltered.values is batch.values
+    assert unfiltered.targets == {}
+    # Other subscribers on the connection do not count its traffic again.
+    follower = replace(batch, size=120, group_bytes={"navigation": 120.0}, collapsed=1)
+    follower = follower.restrict(PathInterest(["navigation.*"]), None, counters=False)
+    assert (follower.frames, follower.size, follower.collapsed) == (0, 0, 0)
+    assert follower.group_bytes == {}
+    assert follower.values == {"navigation.speedOverGround": 3.0}
+    assert follower.first_received == 1.0
+
+
+def test_decode_frames_splits_bytes_by_path_group() -> None:
+    mixed = json.dumps(
+        {
+            "context": "vessels.self",
+            "updates": [
+                {
+                    "values": [
+                        {"path": "navigation.speedOverGround", "value": 3.0},
+                        {"path": "navigation.headingTrue", "value": 1.0},
+                        {"path": "environment.depth.belowTransducer", "value": 7.5},
+                    ]
+                }
+            ],
+        }
+    )
+    other = json.dumps(
+        {
+            "context": "vessels.urn:mrn:imo:mmsi:222222222",
+            "updates": [{"values": [{"path": "navigation.speedOverGround", "value": 5.0}]}],
+        }
+    )
+    matcher = ContextMatcher(["vessels.self"], self_urn_fallback=False)
+
+    batch = decode_frames([(mixed, 1.0), (other, 1.0), ("not json", 1.0)], matcher)
+
+    assert batch.group_bytes["navigation"] == pytest.approx(len(mixed) * 2 / 3)
+    assert batch.group_bytes["environment"] == pytest.approx(len(mixed) / 3)
+    assert batch.group_bytes["other"] == len(other) + len("not json")
+    assert sum(batch.group_bytes.values()) == pytest.approx(batch.size)
@@ -0,0 +1,79 @@
+from custom_components.signalk_ha.discovery import DiscoveredEntity
+from custom_components.signalk_ha.planner import (
+    MAX_PERIOD_MS,
+    NOTIFICATIONS_PLAN,
+    SubscriptionPlan,
+    build_plans,
+    estimate_savings,
+    merge_plans,
+    plan_for_entity,
+)
+
+
+def _spec(path: str, **kwargs) -> DiscoveredEntity:
+    values = {
+        "name": path,
+        "kind": "sensor",
+        "unit": None,
+        "device_class": None,
+        "state_class": None,
+        "conversion": None,
+        "tolerance": None,
+        "min_update_seconds": None,
+        **kwargs,
+    }
+    return DiscoveredEntity(path=path, **values)
+
+
+def test_min_period_follows_write_throttle() -> None:
+    assert plan_for_entity(_spec("environment.depth.belowTransducer")) == SubscriptionPlan(
+        period=5000, min_period=5000, policy="ideal"
+    )
+    plan = plan_for_entity(_spec("environment.wind.speedApparent", min_update_seconds=30))
+    # Keepalives faster than the throttle would be discarded as well.
+    assert plan == SubscriptionPlan(period=30000, min_period=30000)
+
+
+def test_period_stays_within_staleness_budget() -> None:
+    plan = plan_for_entity(_spec("tanks.freshWater.0.currentLevel", min_update_seconds=3600))
+    assert plan.period == MAX_PERIOD_MS
+    assert plan.min_period == MAX_PERIOD_MS
+
+    fast = plan_for_entity(_spec("navigation.headingTrue", min_update_seconds=0, period_ms=500))
+    assert fast == SubscriptionPlan(period=1000, min_period=1000)
+
+
+def test_entities_on_one_path_share_the_fastest_plan() -> None:
+    plans = build_plans(
+        [
+            _spec("navigation.position", kind="geo_location"),
+            _spec("navigation.position", min_update_seconds=2),
+        ]
+    )
+    assert plans == {"navigation.position": SubscriptionPlan(period=5000, min_period=2000)}
+
+
+def test_merge_keeps_keepalives_when_any_consumer_needs_them() -> None:
+    merged = merge_plans(NOTIFICATIONS_PLAN, SubscriptionPlan(period=10000))
+    assert merged == SubscriptionPlan(period=5000, min_period=5000, policy="ideal")
+    assert merge_plans(NOTIFICATIONS_PLAN, NOTIFICATIONS_PLAN) is NOTIFICATIONS_PLAN
+
+
+def test_estimate_savings_against_bare_periods() -> None:
+    planned = {
+        "environment.wind.speedApparent": SubscriptionPlan(period=30000, min_period=30000),
+        "notifications.*": NOTIFICATIONS_PLAN,
+    }
+    baseline = {path: SubscriptionPlan(5000) for path in planned}
+
+    savings = estimate_savings(planned, baseline, bytes_per_message=40.0)
+
+    assert savings["paths"] == 2
+    assert savings["policies"] == {"ideal": 1, "instant": 1}
+    assert savings["messages_per_hour"] == {
+        "baseline": {"static": 1440.0, "busy": 1440.0},
+        "planned": {"static": 120.0, "busy": 840.0},
+    }
+    assert savings["estimated_messages_saved_per_hour"] == {"static": 1320.0, "busy": 600.0}
+    assert savings["estimated_bytes_saved_per_hour"] == {"static": 52800, "busy": 24000}
+    assert estimate_savings(planned, baseline, None)["estimated_bytes_saved_per_hour"] is None
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from custom_components.signalk_ha.parser import PathInterest
+from custom_components.signalk_ha.pool import (
+    _DATA_KEY,
+    join_stream,
+    leave_stream,
+    merge_interests,
+    merge_targets,
+    stream_key,
+)
+
+
+def test_stream_key_separates_tokens_and_vessels() -> None:
+    url = "ws://sk.local:3000/signalk/v1/stream?subscribe=none"
+    assert stream_key(url, None, "mmsi:1") == stream_key(url, "", "mmsi:1")
+    assert stream_key(url, "token", "mmsi:1") != stream_key(url, None, "mmsi:1")
+    assert stream_key(url, None, "mmsi:2") != stream_key(url, None, "mmsi:1")
+
+
+def test_join_and_leave_stream_promotes_next_member() -> None:
+    hass = SimpleNamespace(data={})
+    key = stream_key("ws://sk.local", None, None)
+    first, second = object(), object()
+
+    stream = join_stream(hass, key, first)
+    assert join_stream(hass, key, second) is stream
+    assert stream.owner is first
+    assert stream.followers == [second]
+    assert stream.shared
+
+    leave_stream(hass, stream, first)
+    assert stream.owner is second
+    assert not stream.shared
+
+    leave_stream(hass, stream, second)
+    assert stream.owner is None
+    assert hass.data[_DATA_KEY] == {}
+
+
+def test_merge_interests() -> None:
+    merged = merge_interests(
+        [PathInterest(["navigation.speedOverGround"]), PathInterest(["environment.*"])]
+    )
+    assert merged is not None
+    assert merged.matches("navigation.speedOverGround")
+    assert merged.matches("environment.depth.belowTransducer")
+    assert not merged.matches("navigation.headingTrue")
+    # A member without a filter needs every path.
+    assert merge_interests([PathInterest(["navigation.speedOverGround"]), None]) is None
+
+
+def test_merge_targets() -> None:
+    assert merge_targets([None, None]) is None
+    merged = merge_targets([None, PathInterest(["navigation.position"])])
+    assert merged is not None
+    assert merged.patterns == ("navigation.position",)
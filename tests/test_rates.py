@@ -0,0 +1,61 @@
+import pytest
+
+from custom_components.signalk_ha.rates import KeyedRates, SlidingRate
+
+
+def test_sliding_rate_empty() -> None:
+    assert SlidingRate().rates(100.0) == (0.0, 0.0, 0.0)
+
+
+def test_sliding_rate_scales_to_uptime_while_filling() -> None:
+    counter = SlidingRate()
+    for second in range(30):
+        counter.add(1000.0 + second, 2)
+
+    one_minute, fifteen_minutes, one_hour = counter.rates(1029.5)
+    assert one_minute == pytest.approx(2.0)
+    assert fifteen_minutes == pytest.approx(2.0)
+    assert one_hour == pytest.approx(2.0)
+
+
+def test_sliding_rate_windows_diverge_after_burst() -> None:
+    counter = SlidingRate()
+    for second in range(600):
+        counter.add(float(second), 10 if second < 60 else 1)
+
+    one_minute, fifteen_minutes, one_hour = counter.rates(599.0)
+    assert one_minute == pytest.approx(1.0)
+    assert fifteen_minutes == pytest.approx((600 + 540) / 600)
+    assert one_hour == fifteen_minutes
+
+    # A stall drains the short window first.
+    one_minute, fifteen_minutes, _ = counter.rates(700.0)
+    assert one_minute == 0.0
+    assert fifteen_minutes > 0.0
+
+
+def test_sliding_rate_resets_after_long_idle() -> None:
+    counter = SlidingRate((2, 4))
+    counter.add(0.0, 4)
+    counter.add(1.0, 4)
+    assert counter.rates(1.0) == (4.0, 4.0)
+    assert counter.rates(3.0) == (0.0, 2.0)
+    assert counter.rates(10.0) == (0.0, 0.0)
+    counter.add(10.0)
+    assert counter.rates(10.0) == (0.5, 0.25)
+
+
+def test_keyed_rates_top_paths() -> None:
+    rates = KeyedRates(minutes=2)
+    assert rates.top(0.0, 5) == []
+
+    for second in range(60):
+        rates.record(float(second), ["a", "a", "b"])
+    assert rates.top(60.0, 1) == [("a", 120.0)]
+
+    # Older minutes roll out of the table.
+    rates.record(61.0, ["c"])
+    rates.record(250.0, ["c"])
+    top = dict(rates.top(250.0, 5))
+    assert set(top) == {"c"}
+    assert "a" not in rates._totals
@@ -24,7 +24,7 @@ class _MockResponse:
         if self.status >= 400:
             raise RuntimeError(f"{self.status}")
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._payload
 
     async def __aenter__(self):
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 from unittest.mock import Mock
 
+import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
@@ -304,6 +305,9 @@ async def test_health_sensor_defaults_for_diagnostics(hass) -> None:
     assert "Message Count" in disabled
     assert "Messages per Hour" in disabled
     assert "Notifications per Hour" in disabled
+    assert {"Message Rate", "Value Rate", "Notification Rate", "Data Rate"} <= disabled
+    assert "End-to-End Latency" in disabled
+    assert {"Link RTT", "Link Jitter", "Frame Interval", "Payload Received"} <= disabled
 
 
 async def test_message_count_updates_with_coordinator(hass) -> None:
@@ -341,6 +345,74 @@ async def test_message_count_updates_with_coordinator(hass) -> None:
     assert message_sensor.native_value == 5
 
 
+async def test_rate_sensors_report_sliding_windows(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    discovery = SimpleNamespace(
+        data=DiscoveryResult(entities=[], conflicts=[]),
+        async_add_listener=Mock(return_value=lambda: None),
+    )
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    entry.runtime_data = SignalKRuntimeData(
+        coordinator=coordinator,
+        discovery=discovery,
+        auth=SignalKAuthManager(None),
+    )
+
+    added = []
+    await async_setup_entry(hass, entry, added.extend)
+    payload = (
+        '{"context":"vessels.self","updates":[{"$source":"nmea.GP","values":['
+        '{"path":"navigation.speedOverGround","value":1.0},'
+        '{"path":"navigation.headingTrue","value":0.5}]}]}'
+    )
+    for _ in range(3):
+        coordinator._handle_message(payload, coordinator.config)
+    coordinator._flush_handle.cancel()
+    coordinator._flush_handle = None
+
+    message_rate = _find_health(added, "Message Rate")
+    value_rate = _find_health(added, "Value Rate")
+    data_rate = _find_health(added, "Data Rate")
+    assert message_rate.native_value > 0
+    assert value_rate.native_value == pytest.approx(2 * message_rate.native_value)
+    assert data_rate.native_value > 0
+    assert data_rate.native_unit_of_measurement == "B/s"
+    payload_received = _find_health(added, "Payload Received")
+    assert payload_received.native_value == 3 * len(payload)
+    assert payload_received.extra_state_attributes == {
+        "compression_window_bits": 0,
+        "by_group": {"navigation": 3 * len(payload)},
+    }
+    attrs = value_rate.extra_state_attributes
+    assert set(attrs) == {"rate_1m", "rate_15m", "rate_1h", "top_paths", "top_sources"}
+    assert {item["path"] for item in attrs["top_paths"]} == {
+        "navigation.speedOverGround",
+        "navigation.headingTrue",
+    }
+    assert attrs["top_sources"][0]["source"] == "nmea.GP"
+    assert _find_health(added, "Notification Rate").native_value == 0
+
+    latency = _find_health(added, "End-to-End Latency")
+    assert latency.native_value is None
+    assert latency.extra_state_attributes["groups"] == {}
+    coordinator._flush_updates()
+    coordinator.record_state_write("navigation.headingTrue")
+    assert latency.native_value is None  # The payload carried no server timestamp.
+    assert latency.extra_state_attributes["coalesce_p95_ms"] >= 0
+
+    rtt = _find_health(added, "Link RTT")
+    assert rtt.native_value is None
+    coordinator._link.pong(coordinator._link.start_ping(1.0), 1.25)
+    assert rtt.native_value == 250.0
+    assert _find_health(added, "Link Jitter").native_value == 125.0
+    assert rtt.extra_state_attributes["samples"] == 1
+    assert _find_health(added, "Frame Interval").extra_state_attributes == {
+        "jitter_ms": None,
+        "last_ms": None,
+    }
+
+
 async def test_sensor_setup_entry_without_runtime(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -1,14 +1,17 @@
+from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.signalk_ha import (
     _async_entry_updated,
     _async_update_subscriptions,
     async_migrate_entry,
+    async_remove_entry,
     async_setup_entry,
     async_unload_entry,
 )
@@ -24,14 +27,20 @@ from custom_components.signalk_ha.const import (
     CONF_VESSEL_ID,
     CONF_VESSEL_NAME,
     CONF_WS_URL,
+    DEFAULT_GROUPS,
     DEFAULT_PERIOD_MS,
     DEFAULT_REFRESH_INTERVAL_HOURS,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
     SK_PATH_NOTIFICATIONS,
 )
-from custom_components.signalk_ha.discovery import DiscoveredEntity, DiscoveryResult
+from custom_components.signalk_ha.discovery import (
+    DiscoveredEntity,
+    DiscoveryResult,
+    discovery_result_to_dict,
+)
 from custom_components.signalk_ha.entity_utils import path_from_unique_id
+from custom_components.signalk_ha.planner import NOTIFICATIONS_PLAN, SubscriptionPlan
 from custom_components.signalk_ha.runtime import SignalKRuntimeData
 
 
@@ -93,6 +102,89 @@ async def test_setup_entry_sets_runtime_data_and_subscriptions(hass) -> None:
     update_paths.assert_called_once()
 
 
+async def test_setup_entry_builds_from_discovery_cache(hass, hass_storage) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"signalk:{entry.entry_id}:navigation.speedOverGround",
+        suggested_object_id="speed_over_ground",
+        config_entry=entry,
+    )
+    spec = DiscoveredEntity(
+        path="navigation.speedOverGround",
+        name="Speed Over Ground",
+        kind="sensor",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        conversion=None,
+        tolerance=None,
+        min_update_seconds=None,
+        period_ms=750,
+    )
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.discovery"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.discovery",
+        "data": {
+            "key": {
+                "server_id": None,
+                "server_version": None,
+                "groups": sorted(DEFAULT_GROUPS),
+            },
+            "result": discovery_result_to_dict(DiscoveryResult(entities=[spec], conflicts=[])),
+        },
+    }
+
+    first_refresh = AsyncMock()
+    background_refresh = AsyncMock()
+    with (
+        patch(
+            "custom_components.signalk_ha.__init__.SignalKDiscoveryCoordinator.async_config_entry_first_refresh",
+            new=first_refresh,
+        ),
+        patch(
+            "custom_components.signalk_ha.__init__.SignalKDiscoveryCoordinator.async_refresh",
+            new=background_refresh,
+        ),
+        patch(
+            "custom_components.signalk_ha.async_get_clientsession",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.signalk_ha.__init__.SignalKCoordinator.async_update_paths",
+            new=AsyncMock(),
+        ) as update_paths,
+        patch.object(hass.config_entries, "async_forward_entry_setups", new=AsyncMock()),
+    ):
+        assert await async_setup_entry(hass, entry) is True
+        # Entities and periods come from the cache without waiting for REST.
+        first_refresh.assert_not_awaited()
+        assert entry.runtime_data.discovery.from_cache is True
+        _, periods = update_paths.call_args.args
+        assert periods["navigation.speedOverGround"] == 750
+        await hass.async_block_till_done()
+
+    background_refresh.assert_awaited_once()
+    assert update_paths.call_count == 2
+
+
+async def test_remove_entry_deletes_stored_caches(hass, hass_storage) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+    for suffix in ("snapshot", "discovery"):
+        key = f"{DOMAIN}.{entry.entry_id}.{suffix}"
+        hass_storage[key] = {"version": 1, "minor_version": 1, "key": key, "data": {}}
+
+    await async_remove_entry(hass, entry)
+
+    assert f"{DOMAIN}.{entry.entry_id}.snapshot" not in hass_storage
+    assert f"{DOMAIN}.{entry.entry_id}.discovery" not in hass_storage
+
+
 async def test_setup_entry_continues_on_discovery_error(hass) -> None:
     entry = _make_entry()
     entry.add_to_hass(hass)
@@ -288,6 +380,11 @@ async def test_update_subscriptions_uses_registry_and_periods(hass) -> None:
         "navigation.speedOverGround": 750,
         SK_PATH_NOTIFICATIONS: DEFAULT_PERIOD_MS,
     }
+    # The sensor's 5 s write throttle outranks the 750 ms period the mapping asked for.
+    assert coordinator.async_update_paths.call_args.kwargs["plans"] == {
+        "navigation.speedOverGround": SubscriptionPlan(period=5000, min_period=5000),
+        SK_PATH_NOTIFICATIONS: NOTIFICATIONS_PLAN,
+    }
 
 
 async def test_update_subscriptions_disable_notifications(hass) -> None:
@@ -378,12 +475,6 @@ async def test_registry_update_triggers_subscription_refresh(hass) -> None:
         listener_holder["listener"] = listener
         return lambda: None
 
-    created: list = []
-
-    def _create_task(coro):
-        created.append(coro)
-        coro.close()
-
     with (
         patch(
             "custom_components.signalk_ha.__init__.SignalKDiscoveryCoordinator.async_config_entry_first_refresh",
@@ -402,68 +493,61 @@ async def test_registry_update_triggers_subscription_refresh(hass) -> None:
             new=AsyncMock(),
         ) as update_subs,
         patch.object(hass.config_entries, "async_forward_entry_setups", new=AsyncMock()),
-        patch.object(hass, "async_create_task", side_effect=_create_task),
         patch("homeassistant.core.EventBus.async_listen", side_effect=_listen),
     ):
         assert await async_setup_entry(hass, entry) is True
-
-        event = SimpleNamespace(data={"action": "update"})
-        listener_holder["listener"](event)
+        # The initial subscription is computed directly; registry events go through the debouncer.
         assert update_subs.call_count == 1
+        listener = listener_holder["listener"]
 
+        # Events without an entity, for another entry or without an enable change are ignored.
+        listener(SimpleNamespace(data={"action": "update"}))
         with patch(
             "custom_components.signalk_ha.__init__.er.async_get",
             return_value=SimpleNamespace(
                 async_get=lambda entity_id: SimpleNamespace(config_entry_id="other")
             ),
         ):
-            event = SimpleNamespace(
-                data={"entity_id": registry_entry.entity_id, "action": "update"},
+            listener(
+                SimpleNamespace(data={"entity_id": registry_entry.entity_id, "action": "update"})
+            )
+        listener(
+            SimpleNamespace(
+                data={
+                    "entity_id": registry_entry.entity_id,
+                    "action": "update",
+                    "changes": {"name": ("old", "new")},
+                }
             )
-            listener_holder["listener"](event)
+        )
+        listener(SimpleNamespace(data={"entity_id": "sensor.unknown", "action": "create"}))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
         assert update_subs.call_count == 1
 
-        event = SimpleNamespace(
-            data={
-                "entity_id": registry_entry.entity_id,
-                "action": "update",
-                "changes": {"name": ("old", "new")},
-            },
-        )
-        listener_holder["listener"](event)
+        # A burst of registry changes collapses into one recompute once the cooldown passes.
+        listener(SimpleNamespace(data={"entity_id": registry_entry.entity_id, "action": "create"}))
+        for disabled_by in ("user", None, "user"):
+            listener(
+                SimpleNamespace(
+                    data={
+                        "entity_id": registry_entry.entity_id,
+                        "action": "update",
+                        "changes": {"disabled_by": (None, disabled_by)},
+                    }
+                )
+            )
+        await hass.async_block_till_done()
         assert update_subs.call_count == 1
 
-        event = SimpleNamespace(
-            data={
-                "entity_id": registry_entry.entity_id,
-                "action": "create",
-            },
-        )
-        listener_holder["listener"](event)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
         assert update_subs.call_count == 2
 
-        event = SimpleNamespace(
-            data={
-                "entity_id": "sensor.unknown",
-                "action": "create",
-            },
-        )
-        listener_holder["listener"](event)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
         assert update_subs.call_count == 2
 
-        event = SimpleNamespace(
-            data={
-                "entity_id": registry_entry.entity_id,
-                "action": "update",
-                "changes": {"disabled_by": (None, "user")},
-            },
-        )
-        listener_holder["listener"](event)
-        assert update_subs.call_count == 3
-
-    assert update_subs.call_count == 3
-    assert created
-
 
 async def test_entry_updated_triggers_reload(hass) -> None:
     entry = _make_entry()
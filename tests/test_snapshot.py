@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.signalk_ha.snapshot import (
+    STORAGE_VERSION,
+    SnapshotStore,
+    async_remove_snapshot,
+    decode_snapshot,
+    encode_snapshot,
+    snapshot_key,
+)
+
+
+def test_snapshot_round_trip_skips_stale_and_malformed_entries() -> None:
+    now = dt_util.utcnow()
+    encoded = encode_snapshot(
+        {
+            "navigation.speedOverGround": 5.5,
+            "navigation.position": {"latitude": 1.0, "longitude": 2.0},
+            "design.beam": 7.09,
+            "environment.depth.belowTransducer": 3.2,
+        },
+        {
+            "navigation.speedOverGround": now - timedelta(seconds=10),
+            "navigation.position": now,
+            "design.beam": now - timedelta(hours=1),
+        },
+        {"navigation.speedOverGround": "src1"},
+    )
+    # Values without a receive time cannot be judged for staleness and are not stored.
+    assert "environment.depth.belowTransducer" not in encoded["paths"]
+    encoded["paths"]["broken"] = [1.0, "not a time", None]
+    encoded["paths"]["short"] = [1.0]
+
+    values, updates, sources = decode_snapshot(encoded, now, 600)
+
+    assert values == {
+        "navigation.speedOverGround": 5.5,
+        "navigation.position": {"latitude": 1.0, "longitude": 2.0},
+    }
+    assert updates["navigation.speedOverGround"] == now - timedelta(seconds=10)
+    assert sources == {"navigation.speedOverGround": "src1"}
+    assert decode_snapshot(None, now, 600) == ({}, {}, {})
+
+
+async def test_snapshot_store_writes_at_most_once_per_interval(hass, hass_storage) -> None:
+    produced: list[int] = []
+
+    def _data() -> dict:
+        produced.append(1)
+        return {"paths": {"navigation.speedOverGround": [1.0, dt_util.utcnow().isoformat(), None]}}
+
+    snapshot = SnapshotStore(hass, "entry", _data, interval=300)
+    for _ in range(50):
+        snapshot.schedule_save()
+    assert snapshot.pending is True
+    assert produced == []
+
+    await snapshot.async_flush()
+    await hass.async_block_till_done()
+
+    assert produced == [1]
+    assert snapshot.saves == 1
+    assert snapshot.pending is False
+    stored = hass_storage[snapshot_key("entry")]
+    assert stored["version"] == STORAGE_VERSION
+    assert await snapshot.async_load() == stored["data"]
+
+    # Nothing pending: flushing again does not write.
+    await snapshot.async_flush()
+    assert produced == [1]
+
+    await async_remove_snapshot(hass, "entry")
+    assert snapshot_key("entry") not in hass_storage
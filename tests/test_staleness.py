@@ -69,3 +69,36 @@ async def test_sensor_staleness_transitions(hass, enable_custom_integrations) ->
 
     coordinator._last_update_by_path[path] = dt_util.utcnow()
     assert sensor.available is True
+
+
+async def test_sensor_serves_restored_value_until_connected(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+
+    path = "navigation.speedOverGround"
+    spec = DiscoveredEntity(
+        path=path,
+        name="Speed Over Ground",
+        kind="sensor",
+        unit="kn",
+        device_class=None,
+        state_class=None,
+        conversion=None,
+        tolerance=None,
+        min_update_seconds=None,
+    )
+    discovery = SimpleNamespace(data=DiscoveryResult(entities=[spec], conflicts=[]))
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator.data = {path: 5.5}
+    coordinator._last_update_by_path[path] = dt_util.utcnow() - timedelta(seconds=30)
+    sensor = SignalKSensor(coordinator, discovery, entry, spec)
+    assert sensor.available is False
+
+    coordinator._warm_start = True
+    assert sensor.available is True
+
+    # Restored values keep their original receive time and still go stale.
+    coordinator._last_update_by_path[path] = dt_util.utcnow() - timedelta(
+        seconds=DEFAULT_STALE_SECONDS + 1
+    )
+    assert sensor.available is False
@@ -3,7 +3,10 @@ from custom_components.signalk_ha.const import (
     DEFAULT_PERIOD_MS,
     DEFAULT_STALE_SECONDS,
 )
-from custom_components.signalk_ha.subscription import build_subscribe_payload
+from custom_components.signalk_ha.subscription import (
+    build_subscribe_payload,
+    build_unsubscribe_payload,
+)
 
 
 def test_build_subscribe_payload_sanitizes_paths() -> None:
@@ -202,3 +205,22 @@ def test_build_subscribe_payload_defaults_zero_min_period() -> None:
             "policy": "ideal",
         }
     ]
+
+
+def test_build_unsubscribe_payload() -> None:
+    payload = build_unsubscribe_payload("vessels.self", ["navigation.*", "design.beam"])
+    assert payload == {
+        "context": "vessels.self",
+        "unsubscribe": [{"path": "navigation.*"}, {"path": "design.beam"}],
+    }
+
+
+def test_build_subscribe_payload_uses_per_path_policy() -> None:
+    payload = build_subscribe_payload(
+        "vessels.self",
+        [
+            {"path": "notifications.*", "period": 5000, "policy": "instant"},
+            {"path": "navigation.depth", "period": 5000, "policy": "bogus"},
+        ],
+    )
+    assert [item["policy"] for item in payload["subscribe"]] == ["instant", "ideal"]
@@ -1,8 +1,11 @@
-import time
-from unittest.mock import Mock
-
-from pytest_homeassistant_custom_component.common import MockConfigEntry
-
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from custom_components.signalk_ha.auth import SignalKAuthManager
 from custom_components.signalk_ha.const import (
     CONF_BASE_URL,
@@ -15,70 +18,70 @@ from custom_components.signalk_ha.const import (
     CONF_WS_URL,
     DOMAIN,
 )
-from custom_components.signalk_ha.coordinator import SignalKCoordinator
-from custom_components.signalk_ha.discovery import DiscoveredEntity
-from custom_components.signalk_ha.sensor import SignalKSensor
-
-
-def _make_entry() -> MockConfigEntry:
-    return MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            CONF_HOST: "sk.local",
-            CONF_PORT: 3000,
-            CONF_SSL: False,
-            CONF_VERIFY_SSL: True,
-            CONF_BASE_URL: "http://sk.local:3000/signalk/v1/api/",
-            CONF_WS_URL: "ws://sk.local:3000/signalk/v1/stream?subscribe=none",
-            CONF_VESSEL_ID: "mmsi:261006533",
-            CONF_VESSEL_NAME: "ONA",
-        },
-    )
-
-
-def test_tolerance_allows_small_changes(hass) -> None:
-    entry = _make_entry()
-    entry.add_to_hass(hass)
-
+from custom_components.signalk_ha.coordinator import ConnectionState, SignalKCoordinator
+from custom_components.signalk_ha.discovery import DiscoveredEntity, DiscoveryResult
+from custom_components.signalk_ha.sensor import SignalKSensor
+
+
+def _make_entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: "sk.local",
+            CONF_PORT: 3000,
+            CONF_SSL: False,
+            CONF_VERIFY_SSL: True,
+            CONF_BASE_URL: "http://sk.local:3000/signalk/v1/api/",
+            CONF_WS_URL: "ws://sk.local:3000/signalk/v1/stream?subscribe=none",
+            CONF_VESSEL_ID: "mmsi:261006533",
+            CONF_VESSEL_NAME: "ONA",
+        },
+    )
+
+
+def test_tolerance_allows_small_changes(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+
     coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
-    spec = DiscoveredEntity(
-        path="navigation.speedOverGround",
-        name="Speed",
-        kind="sensor",
-        unit="kn",
-        device_class=None,
-        state_class=None,
-        conversion=None,
-        tolerance=0.1,
-        min_update_seconds=60.0,
-    )
-    sensor = SignalKSensor(coordinator, Mock(), entry, spec)
-
-    sensor._last_native_value = 1.0
-    sensor._last_available = True
-    sensor._last_write = time.monotonic()
-
-    assert sensor._should_write_state(1.05, True) is False
-
-
-def test_tolerance_triggers_large_changes(hass) -> None:
-    entry = _make_entry()
-    entry.add_to_hass(hass)
-
+    spec = DiscoveredEntity(
+        path="navigation.speedOverGround",
+        name="Speed",
+        kind="sensor",
+        unit="kn",
+        device_class=None,
+        state_class=None,
+        conversion=None,
+        tolerance=0.1,
+        min_update_seconds=60.0,
+    )
+    sensor = SignalKSensor(coordinator, Mock(), entry, spec)
+
+    sensor._last_native_value = 1.0
+    sensor._last_available = True
+    sensor._last_write = time.monotonic()
+
+    assert sensor._should_write_state(1.05, True) is False
+
+
+def test_tolerance_triggers_large_changes(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+
     coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
-    spec = DiscoveredEntity(
-        path="navigation.speedOverGround",
-        name="Speed",
-        kind="sensor",
-        unit="kn",
-        device_class=None,
-        state_class=None,
-        conversion=None,
-        tolerance=0.1,
-        min_update_seconds=60.0,
-    )
-    sensor = SignalKSensor(coordinator, Mock(), entry, spec)
-
+    spec = DiscoveredEntity(
+        path="navigation.speedOverGround",
+        name="Speed",
+        kind="sensor",
+        unit="kn",
+        device_class=None,
+        state_class=None,
+        conversion=None,
+        tolerance=0.1,
+        min_update_seconds=60.0,
+    )
+    sensor = SignalKSensor(coordinator, Mock(), entry, spec)
+
     sensor._last_native_value = 1.0
     sensor._last_available = True
     sensor._last_write = time.monotonic()
@@ -110,3 +113,40 @@ def test_min_interval_blocks_large_changes(hass) -> None:
     sensor._last_write = time.monotonic()
 
     assert sensor._should_write_state(2.0, True) is False
+
+
+async def test_throttled_value_is_written_when_window_closes(hass) -> None:
+    entry = _make_entry()
+    entry.add_to_hass(hass)
+
+    spec = DiscoveredEntity(
+        path="navigation.speedOverGround",
+        name="Speed",
+        kind="sensor",
+        unit="kn",
+        device_class=None,
+        state_class=None,
+        conversion=None,
+        tolerance=None,
+        min_update_seconds=0.05,
+    )
+    discovery = SimpleNamespace(data=DiscoveryResult(entities=[spec], conflicts=[]))
+    coordinator = SignalKCoordinator(hass, entry, Mock(), Mock(), SignalKAuthManager(None))
+    coordinator._state = ConnectionState.CONNECTED
+    coordinator._last_update_by_path["navigation.speedOverGround"] = dt_util.utcnow()
+    sensor = SignalKSensor(coordinator, discovery, entry, spec)
+    sensor.hass = hass
+    sensor.async_write_ha_state = Mock()
+
+    # A burst: the first value is written, the rest land inside the throttle window.
+    for value in (1.0, 2.0, 3.0):
+        coordinator.data = {"navigation.speedOverGround": value}
+        sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+    assert sensor._last_native_value == 1.0
+
+    # No further delta arrives; the last value is still written once the window closes.
+    await asyncio.sleep(0.1)
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor._last_native_value == 3.0
+    assert sensor._recheck_handle is None